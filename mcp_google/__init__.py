@@ -1,7 +1,15 @@
 """MCP Gmail, Calendar, and Google Chat server - Gmail, Google Calendar, and Google Chat integration for LLMs via Model Context Protocol."""
 
-from mcp_google import gmail  # noqa: F401
-from mcp_google import calendar  # noqa: F401
-from mcp_google import google_chat  # noqa: F401
+import importlib
 
-__version__ = "0.1.0"
\ No newline at end of file
+__version__ = "0.1.0"
+
+# Service modules are imported on first access so that lightweight imports
+# (e.g. mcp_google.config) don't pull in the Google API client libraries
+_SUBMODULES = ("gmail", "calendar", "google_chat")
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,89 @@
+"""
+Small in-process TTL cache used to avoid re-fetching API resources.
+
+cachetools isn't a dependency, so this provides the subset the server needs: a
+bounded, thread-safe mapping whose entries expire after a fixed time, and a
+decorator that memoizes a function on its positional arguments.
+"""
+
+import functools
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire `ttl` seconds after they were stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of entries; the least recently used are evicted first
+            ttl: Lifetime of an entry in seconds
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the unexpired value stored for `key`, or `default`."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            if entry[1] <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store `value` for `key`, evicting the least recently used entries beyond maxsize."""
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Remove `key` and return its value (expired or not), or `default`."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+            return default if entry is None else entry[0]
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+def ttl_cache(maxsize: int, ttl: float) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that memoizes a function on its positional arguments for `ttl` seconds.
+
+    None results are not cached, so lookups that failed are retried on the next call.
+    The wrapper exposes the underlying TTLCache as `cache`; its keys are the argument tuples.
+
+    Args:
+        maxsize: Maximum number of cached results
+        ttl: Lifetime of a cached result in seconds
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        cache = TTLCache(maxsize, ttl)
+
+        @functools.wraps(fn)
+        def wrapper(*args: Hashable) -> Any:
+            result: Optional[Any] = cache.get(args)
+            if result is None:
+                result = fn(*args)
+                if result is not None:
+                    cache.set(args, result)
+            return result
+
+        wrapper.cache = cache  # type: ignore[attr-defined]
+        return wrapper
+    return decorator
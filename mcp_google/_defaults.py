@@ -0,0 +1,46 @@
+"""
+Default paths, user IDs and OAuth scopes for the Gmail, Calendar, and Google Chat clients.
+
+Kept free of third-party imports so the configuration can be loaded without importing
+the Google API client libraries.
+"""
+
+# Gmail defaults
+GMAIL_DEFAULT_CREDENTIALS_PATH = "credentials.json"
+GMAIL_DEFAULT_TOKEN_PATH = "token.json"
+GMAIL_DEFAULT_USER_ID = "me"
+
+GMAIL_SCOPES = [
+    "https://www.googleapis.com/auth/gmail.readonly",
+    "https://www.googleapis.com/auth/gmail.send",
+    "https://www.googleapis.com/auth/gmail.compose",
+    "https://www.googleapis.com/auth/gmail.labels",
+]
+
+# Calendar defaults
+CALENDAR_DEFAULT_CREDENTIALS_PATH = "credentials.json"
+CALENDAR_DEFAULT_TOKEN_PATH = "calendar_token.json"
+CALENDAR_DEFAULT_USER_ID = "me"
+
+CALENDAR_SCOPES = [
+    "https://www.googleapis.com/auth/calendar",
+    "https://www.googleapis.com/auth/calendar.events",
+]
+
+# Google Chat defaults
+GOOGLE_CHAT_DEFAULT_CREDENTIALS_PATH = "credentials.json"
+GOOGLE_CHAT_DEFAULT_TOKEN_PATH = "google_chat_token.json"
+# None keeps the display name cache database next to the token file
+GOOGLE_CHAT_DEFAULT_USER_CACHE_PATH = None
+GOOGLE_CHAT_DEFAULT_USER_ID = "me"
+
+GOOGLE_CHAT_SCOPES = [
+    "https://www.googleapis.com/auth/chat.spaces.readonly",
+    "https://www.googleapis.com/auth/chat.messages",
+    "https://www.googleapis.com/auth/chat.messages.readonly",
+    "https://www.googleapis.com/auth/chat.spaces",
+    "https://www.googleapis.com/auth/chat.memberships.readonly",
+    "https://www.googleapis.com/auth/userinfo.profile",  # Added for user details
+    "https://www.googleapis.com/auth/userinfo.email",   # Added for user details
+    "openid",  # Add this line to prevent scope mismatch error
+]
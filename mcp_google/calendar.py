@@ -4,21 +4,32 @@ Includes calendar management, event operations, and analysis functions.
 """
 
 import base64
+import functools
+import heapq
 import json
 import logging
 import os
+import re
+import threading
 from datetime import datetime, date, timedelta, time, timezone
-from typing import Any, Dict, List, Optional, Tuple
-from collections import defaultdict
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from time import sleep
 
+import httplib2
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
 from dateutil import parser as date_parser
 from dateutil import rrule
+from dateutil import tz
+from pydantic import ValidationError
+from pydantic_core import from_json
 
+from .transport import PooledHttp
 from .calendar_models import (
     GoogleCalendarEvent,
     EventsResponse,
@@ -28,19 +39,21 @@ from .calendar_models import (
     EventUpdateRequest,
     CalendarListResponse,
     CalendarListEntry,
-    ProjectedEventOccurrence
+    EventView,
+    BusyInterval,
+    BUSY_LIST_ADAPTER,
+    FreeBusyResult,
+    ProjectedEventOccurrence,
+    ProjectedOccurrences,
 )
 
 # Default settings
-DEFAULT_CREDENTIALS_PATH = "credentials.json"
-DEFAULT_TOKEN_PATH = "calendar_token.json"
-DEFAULT_USER_ID = "me"
-
-# Google Calendar API scopes
-CALENDAR_SCOPES = [
-    "https://www.googleapis.com/auth/calendar",
-    "https://www.googleapis.com/auth/calendar.events",
-]
+from ._defaults import (
+    CALENDAR_DEFAULT_CREDENTIALS_PATH as DEFAULT_CREDENTIALS_PATH,
+    CALENDAR_DEFAULT_TOKEN_PATH as DEFAULT_TOKEN_PATH,
+    CALENDAR_DEFAULT_USER_ID as DEFAULT_USER_ID,
+    CALENDAR_SCOPES,
+)
 
 # For simpler testing
 CALENDAR_READONLY_SCOPE = ["https://www.googleapis.com/auth/calendar.readonly"]
@@ -48,59 +61,284 @@ CALENDAR_READONLY_SCOPE = ["https://www.googleapis.com/auth/calendar.readonly"]
 # Type alias for the Calendar service
 CalendarService = Resource
 
+# Refresh access tokens this long before they actually expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
 logger = logging.getLogger(__name__)
 
+# In-process credential cache keyed by (credentials_path, token_path, scopes)
+_CREDS_CACHE: Dict[Tuple[str, str, Tuple[str, ...]], Credentials] = {}
+# Last token JSON written to (or read from) each token path
+_TOKEN_JSON_CACHE: Dict[str, str] = {}
+_CREDS_LOCK = threading.Lock()
+
+# Per-thread service copies for services not built on PooledHttp;
+# httplib2 connections must not be shared between threads
+_thread_local = threading.local()
+
+# Maximum number of API requests issued concurrently by the *_multi/_many helpers;
+# must stay within transport.SHARED_POOL_SIZE
+MAX_CONCURRENT_REQUESTS = 10
+
 
 def get_calendar_service(
     credentials_path: str = DEFAULT_CREDENTIALS_PATH,
     token_path: str = DEFAULT_TOKEN_PATH,
     scopes: List[str] = CALENDAR_SCOPES,
+    credentials: Optional[Credentials] = None,
 ) -> CalendarService:
     """
     Authenticate with Google Calendar API and return the service object.
 
+    The service is built once per (credentials_path, token_path, scopes) combination
+    and reused on subsequent calls, so its HTTP connection stays warm between requests.
+
     Args:
         credentials_path: Path to the credentials JSON file
         token_path: Path to save/load the token
         scopes: OAuth scopes to request
+        credentials: Already loaded credentials to build the service on instead
+            (optional); the service is not memoized in that case
 
     Returns:
         Authenticated Google Calendar API service
     """
-    creds = None
+    if credentials is not None:
+        return _build_authorized_service(credentials)
+
+    scopes_key = tuple(scopes)
+    # Refresh the cached credentials in place if they are about to expire
+    get_credentials(credentials_path, token_path, scopes_key)
+    return _build_service(credentials_path, token_path, scopes_key)
+
+
+def get_credentials(
+    credentials_path: str = DEFAULT_CREDENTIALS_PATH,
+    token_path: str = DEFAULT_TOKEN_PATH,
+    scopes: Tuple[str, ...] = tuple(CALENDAR_SCOPES),
+) -> Credentials:
+    """
+    Return cached OAuth credentials, loading or refreshing them only when needed.
+
+    The token file is read once per process and written back only when the token
+    actually changed.
+
+    Args:
+        credentials_path: Path to the credentials JSON file
+        token_path: Path to save/load the token
+        scopes: OAuth scopes to request
+
+    Returns:
+        Valid OAuth credentials
+    """
+    key = (credentials_path, token_path, tuple(scopes))
+
+    with _CREDS_LOCK:
+        creds = _CREDS_CACHE.get(key)
 
-    # Look for token file with stored credentials
-    if os.path.exists(token_path):
-        with open(token_path, "r") as token:
-            token_data = json.load(token)
+        # Look for token file with stored credentials
+        if creds is None and os.path.exists(token_path):
+            with open(token_path, "r") as token:
+                token_data = json.load(token)
             creds = Credentials.from_authorized_user_info(token_data)
+            _TOKEN_JSON_CACHE[token_path] = creds.to_json()
+
+        # If credentials don't exist or are about to expire, authenticate
+        if not creds or _needs_refresh(creds):
+            if creds and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                # Check if credentials file exists
+                if not os.path.exists(credentials_path):
+                    raise FileNotFoundError(
+                        f"Credentials file not found at {credentials_path}. "
+                        "Please download your OAuth credentials from Google Cloud Console."
+                    )
 
-    # If credentials don't exist or are invalid, authenticate
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # Check if credentials file exists
-            if not os.path.exists(credentials_path):
-                raise FileNotFoundError(
-                    f"Credentials file not found at {credentials_path}. "
-                    "Please download your OAuth credentials from Google Cloud Console."
-                )
+                flow = InstalledAppFlow.from_client_secrets_file(credentials_path, list(scopes))
+                creds = flow.run_local_server(port=0)
+
+        # Save credentials for future runs, but only if they changed
+        token_json = creds.to_json()
+        if _TOKEN_JSON_CACHE.get(token_path) != token_json:
+            with open(token_path, "w") as token:
+                token.write(token_json)
+            _TOKEN_JSON_CACHE[token_path] = token_json
+
+        _CREDS_CACHE[key] = creds
+        return creds
+
+
+def _needs_refresh(creds: Credentials) -> bool:
+    """Check whether credentials are invalid or expire within TOKEN_REFRESH_MARGIN."""
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - TOKEN_REFRESH_MARGIN <= now
+
+
+@functools.lru_cache(maxsize=None)
+def _build_service(
+    credentials_path: str,
+    token_path: str,
+    scopes: Tuple[str, ...],
+) -> CalendarService:
+    """
+    Build the Calendar service for a hashable set of settings (memoized).
+
+    Args:
+        credentials_path: Path to the credentials JSON file
+        token_path: Path to save/load the token
+        scopes: OAuth scopes to request, as a tuple
+
+    Returns:
+        Authenticated Google Calendar API service
+    """
+    creds = get_credentials(credentials_path, token_path, scopes)
+    return _build_authorized_service(creds)
+
+
+def _build_authorized_service(creds: Credentials) -> CalendarService:
+    """Build a Calendar service on a thread-safe, pooled keep-alive transport."""
+    # The process-wide connection pool serves every request made through this service,
+    # including concurrent ones; the session refreshes the token transparently when it expires.
+    authed_http = PooledHttp(creds)
+
+    # Build the Calendar service from the bundled discovery document
+    return build(
+        "calendar",
+        "v3",
+        http=authed_http,
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+def _thread_service(service: CalendarService) -> CalendarService:
+    """
+    Return a version of `service` that the calling thread may use.
+
+    Services built on PooledHttp are thread-safe and returned as is. httplib2 is
+    not, so for any other service the worker thread gets its own copy sharing
+    the credentials of the original one.
+    """
+    if isinstance(service._http, PooledHttp):
+        return service
+
+    services = getattr(_thread_local, "services", None)
+    if services is None:
+        services = _thread_local.services = {}
+
+    thread_service = services.get(id(service))
+    if thread_service is None:
+        thread_http = AuthorizedHttp(service._http.credentials, http=httplib2.Http())
+        thread_service = build(
+            "calendar",
+            "v3",
+            http=thread_http,
+            cache_discovery=False,
+            static_discovery=True,
+        )
+        services[id(service)] = thread_service
+    return thread_service
+
+
+# HTTP statuses worth retrying. GET, PUT and DELETE requests are already retried on
+# these by the transport (transport.TRANSPORT_RETRY), so _handle_api_errors only
+# retries the methods it skips: POST and PATCH. Inserts retry only on 429, since a
+# rate-limited request was never applied and cannot create a duplicate.
+RETRY_STATUS = (429, 500, 502, 503, 504)
+RATE_LIMIT_STATUS = (429,)
+NO_RETRY_STATUS: Tuple[int, ...] = ()
+RETRY_BASE_DELAY = 0.25
+
+
+def _handle_api_errors(
+    action: str,
+    default: Any = None,
+    retry_status: Tuple[int, ...] = NO_RETRY_STATUS,
+    max_retries: int = 3
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator that logs API errors and returns `default` instead of raising.
+
+    Transient errors with a status in `retry_status` are retried with exponential
+    backoff, up to `max_retries` attempts in total. Nothing is retried by default,
+    because GET, PUT and DELETE requests are already retried by the transport; only
+    functions issuing POST or PATCH requests should pass RETRY_STATUS or
+    RATE_LIMIT_STATUS.
+
+    Args:
+        action: Description of the operation used in log messages, e.g. 'creating event'
+        default: Value returned when the call fails
+        retry_status: HTTP statuses that trigger a retry
+        max_retries: Maximum number of attempts
+    """
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            for attempt in range(max_retries):
+                try:
+                    return fn(*args, **kwargs)
+                except HttpError as error:
+                    status = error.resp.status
+                    if status in retry_status and attempt < max_retries - 1:
+                        sleep(RETRY_BASE_DELAY * 2 ** attempt)
+                        continue
+                    if status in (404, 410):
+                        logger.error(f"Resource not found while {action}: {error}")
+                    else:
+                        logger.error(f"An API error occurred while {action}: {error}", exc_info=True)
+                    return default
+                except Exception as e:
+                    logger.error(f"An unexpected error occurred while {action}: {e}", exc_info=True)
+                    return default
+            return default
+        return wrapper
+    return decorator
+
+
+def _raw_content(resp: httplib2.Response, content: bytes) -> bytes:
+    """Response post-processor that skips JSON decoding."""
+    return content
+
+
+def _execute_raw(request: Any) -> bytes:
+    """
+    Execute an API request and return the undecoded JSON response body.
+
+    Lets callers validate the body with pydantic's model_validate_json, which parses
+    and validates in a single pass instead of going through json.loads first.
+
+    Args:
+        request: A googleapiclient HttpRequest
+
+    Returns:
+        The raw response body
+    """
+    request.postproc = _raw_content
+    return request.execute()
 
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
-            creds = flow.run_local_server(port=0)
 
-        # Save credentials for future runs
-        token_json = json.loads(creds.to_json())
-        with open(token_path, "w") as token:
-            json.dump(token_json, token)
+def _fast_isoparse(value: str) -> datetime:
+    """
+    Parse an RFC3339/ISO-8601 timestamp.
 
-    # Build the Calendar service
-    return build("calendar", "v3", credentials=creds)
+    Uses the C-implemented datetime.fromisoformat, which accepts everything the
+    API returns on Python 3.11+, and falls back to dateutil for anything else.
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return date_parser.isoparse(value)
 
 
 # === CALENDAR MANAGEMENT FUNCTIONS ===
 
+@_handle_api_errors('fetching calendar list')
 def find_calendars(
     service: CalendarService,
     min_access_role: Optional[str] = None
@@ -117,23 +355,16 @@ def find_calendars(
     """
     logger.info(f"Fetching calendar list. Min access role: {min_access_role}")
 
-    try:
-        calendar_list = service.calendarList().list(
-            minAccessRole=min_access_role
-        ).execute()
-
-        logger.info(f"Found {len(calendar_list.get('items', []))} calendars in the list.")
-        parsed_list = CalendarListResponse(**calendar_list)
-        return parsed_list
+    calendar_list = _execute_raw(service.calendarList().list(
+        minAccessRole=min_access_role
+    ))
 
-    except HttpError as error:
-        logger.error(f"An API error occurred while fetching calendar list: {error}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching calendar list: {e}", exc_info=True)
-        return None
+    parsed_list = CalendarListResponse.model_validate_json(calendar_list)
+    logger.info(f"Found {len(parsed_list.items)} calendars in the list.")
+    return parsed_list
 
 
+@_handle_api_errors('creating calendar', retry_status=RATE_LIMIT_STATUS)
 def create_calendar(
     service: CalendarService,
     summary: str
@@ -154,23 +385,144 @@ def create_calendar(
         'summary': summary
     }
 
-    try:
-        created_calendar = service.calendars().insert(body=calendar_body).execute()
-        logger.info(f"Successfully created calendar with ID: {created_calendar.get('id')}")
+    created_calendar = _execute_raw(service.calendars().insert(body=calendar_body))
+
+    parsed_calendar = CalendarListEntry.model_validate_json(created_calendar)
+    logger.info(f"Successfully created calendar with ID: {parsed_calendar.id}")
+    return parsed_calendar
 
-        parsed_calendar = CalendarListEntry(**created_calendar)
-        return parsed_calendar
 
-    except HttpError as error:
-        logger.error(f"An API error occurred while creating calendar '{summary}': {error}", exc_info=True)
+# === EVENT MANAGEMENT FUNCTIONS ===
+
+# Maximum number of sub-requests the Calendar API accepts in one batch
+BATCH_MAX_REQUESTS = 50
+
+
+def _format_datetime_field(dt_obj: datetime) -> str:
+    """Format a datetime as RFC3339, assuming UTC for naive values."""
+    if dt_obj.tzinfo is None:
+        return dt_obj.isoformat() + 'Z'
+    else:
+        return dt_obj.isoformat()
+
+
+def _serialize_event_dt(edt: EventDateTime) -> Optional[Dict[str, str]]:
+    """
+    Serialize an EventDateTime into its API representation.
+
+    Args:
+        edt: Start or end of an event
+
+    Returns:
+        A {'dateTime', 'timeZone'} or {'date'} dictionary, or None if neither is set
+    """
+    if edt.dateTime:
+        if edt.timeZone:
+            return {'dateTime': _format_datetime_field(edt.dateTime), 'timeZone': edt.timeZone}
+        return {'dateTime': _format_datetime_field(edt.dateTime)}
+    if edt.date:
+        return {'date': str(edt.date)}
+    return None
+
+
+def _build_event_body(event_data: EventCreateRequest) -> Optional[Dict[str, Any]]:
+    """
+    Build the API request body for a new event.
+
+    Args:
+        event_data: An EventCreateRequest object containing event details
+
+    Returns:
+        The event body dictionary, or None if the start or end time is missing
+    """
+    if not event_data.start or not event_data.end:
+        logger.error("Event creation failed: Start and End times are required.")
+        return None
+
+    start = _serialize_event_dt(event_data.start)
+    if start is None:
+        logger.error("Event creation failed: Start time requires either dateTime or date.")
         return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while creating calendar '{summary}': {e}", exc_info=True)
+
+    end = _serialize_event_dt(event_data.end)
+    if end is None:
+        logger.error("Event creation failed: End time requires either dateTime or date.")
         return None
 
+    # Optional fields are only sent when they have a value
+    candidates = (
+        ('start', start),
+        ('end', end),
+        ('summary', event_data.summary),
+        ('description', event_data.description),
+        ('location', event_data.location),
+        ('attendees', [{'email': email} for email in event_data.attendees] if event_data.attendees else None),
+        ('recurrence', event_data.recurrence),
+        ('reminders', event_data.reminders.model_dump(by_alias=True, exclude_unset=True) if event_data.reminders else None),
+    )
+    return {key: value for key, value in candidates if value}
 
-# === EVENT MANAGEMENT FUNCTIONS ===
 
+def _build_update_body(update_data: EventUpdateRequest) -> Dict[str, Any]:
+    """
+    Build the patch request body for an event update.
+
+    Args:
+        update_data: An EventUpdateRequest object containing fields to update
+
+    Returns:
+        The patch body dictionary (empty if there is nothing to update)
+    """
+    candidates = (
+        ('summary', update_data.summary),
+        ('description', update_data.description),
+        ('location', update_data.location),
+        ('start', _serialize_event_dt(update_data.start) if update_data.start is not None else None),
+        ('end', _serialize_event_dt(update_data.end) if update_data.end is not None else None),
+        ('attendees', [
+            attendee.model_dump(by_alias=True, exclude_unset=True)
+            for attendee in update_data.attendees
+        ] if update_data.attendees is not None else None),
+    )
+    return {key: value for key, value in candidates if value is not None}
+
+
+def _execute_batch(
+    service: CalendarService,
+    requests: List[Tuple[int, Any]],
+    size: int
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Execute API requests as batch HTTP requests of at most BATCH_MAX_REQUESTS each.
+
+    Args:
+        service: Calendar API service instance
+        requests: (index, request) pairs; the index is the slot in the returned list
+        size: Length of the returned list
+
+    Returns:
+        A list of (response, exception) tuples; slots without a request stay (None, None)
+    """
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * size
+
+    def callback(request_id: str, response: Optional[Dict[str, Any]], exception: Optional[Exception]) -> None:
+        results[int(request_id)] = (response, exception)
+
+    for chunk_start in range(0, len(requests), BATCH_MAX_REQUESTS):
+        batch = service.new_batch_http_request(callback=callback)
+        for index, request in requests[chunk_start:chunk_start + BATCH_MAX_REQUESTS]:
+            batch.add(request, request_id=str(index))
+        try:
+            batch.execute()
+        except HttpError as error:
+            logger.error(f"An API error occurred while executing batch request: {error}", exc_info=True)
+            for index, _ in requests[chunk_start:chunk_start + BATCH_MAX_REQUESTS]:
+                results[index] = (None, error)
+
+    return results
+
+
+@_handle_api_errors('finding events')
 def find_events(
     service: CalendarService,
     calendar_id: str = 'primary',
@@ -180,7 +532,8 @@ def find_events(
     max_results: int = 50,
     single_events: bool = True,
     order_by: str = 'startTime',
-    show_deleted: bool = False
+    show_deleted: bool = False,
+    fields: Optional[str] = None
 ) -> Optional[EventsResponse]:
     """
     Finds events in a specified calendar based on various criteria.
@@ -195,10 +548,34 @@ def find_events(
         single_events: Whether to expand recurring events into single instances
         order_by: The order of the events returned
         show_deleted: Whether to include deleted events
+        fields: Partial-response field mask, e.g. 'items(id,summary,start,end)'
 
     Returns:
         An EventsResponse object containing the list of events, or None if an error occurs
     """
+    list_kwargs = _events_list_kwargs(
+        calendar_id, time_min, time_max, query, max_results, single_events, order_by, show_deleted, fields
+    )
+
+    logger.info(f"Fetching events from calendar '{calendar_id}' with parameters: {list_kwargs}")
+
+    events_result = EventsResponse.model_validate_json(_execute_raw(service.events().list(**list_kwargs)))
+    logger.info(f"Found {len(events_result.items)} events.")
+    return events_result
+
+
+def _events_list_kwargs(
+    calendar_id: str,
+    time_min: Optional[datetime],
+    time_max: Optional[datetime],
+    query: Optional[str],
+    max_results: int,
+    single_events: bool,
+    order_by: Optional[str],
+    show_deleted: bool,
+    fields: Optional[str] = None
+) -> Dict[str, Any]:
+    """Build the keyword arguments for an events().list request, omitting unset values."""
     # Format datetime objects to RFC3339 string format
     time_min_str = time_min.isoformat() + 'Z' if time_min and time_min.tzinfo is None else (time_min.isoformat() if time_min else None)
     time_max_str = time_max.isoformat() + 'Z' if time_max and time_max.tzinfo is None else (time_max.isoformat() if time_max else None)
@@ -212,27 +589,98 @@ def find_events(
         'singleEvents': single_events,
         'orderBy': order_by,
         'showDeleted': show_deleted,
+        'fields': fields,
+        # Skip whitespace in the JSON response
+        'prettyPrint': False,
     }
     # Filter out None values
-    list_kwargs = {k: v for k, v in list_kwargs.items() if v is not None}
+    return {k: v for k, v in list_kwargs.items() if v is not None}
 
-    logger.info(f"Fetching events from calendar '{calendar_id}' with parameters: {list_kwargs}")
 
-    try:
-        events_result = service.events().list(**list_kwargs).execute()
-        logger.info(f"Found {len(events_result.get('items', []))} events.")
+def iter_events(
+    service: CalendarService,
+    calendar_id: str = 'primary',
+    time_min: Optional[datetime] = None,
+    time_max: Optional[datetime] = None,
+    query: Optional[str] = None,
+    page_size: int = 2500,
+    single_events: bool = True,
+    order_by: Optional[str] = 'startTime',
+    show_deleted: bool = False,
+    fields: Optional[str] = None,
+    prefetch: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yields raw event resources from every page of an events().list query.
 
-        events_response = EventsResponse(**events_result)
-        return events_response
+    With `prefetch` enabled, the next page is requested in a background thread
+    while the caller processes the current one. Services built on PooledHttp are
+    thread-safe, so the caller may keep using the service in the meantime.
+
+    Args:
+        service: Calendar API service instance
+        calendar_id: Calendar identifier
+        time_min: Start of the time range (inclusive)
+        time_max: End of the time range (exclusive)
+        query: Free text search query
+        page_size: Maximum number of events per page (the API caps this at 2500)
+        single_events: Whether to expand recurring events into single instances
+        order_by: The order of the events returned (only valid with single_events)
+        show_deleted: Whether to include deleted events
+        fields: Partial-response field mask; include 'nextPageToken' to keep paging
+        prefetch: Whether to fetch the next page while the current one is consumed
+
+    Yields:
+        Event resources as dictionaries
+
+    Raises:
+        HttpError: If a page request fails; callers must not treat the events
+            yielded so far as the complete result
+    """
+    list_kwargs = _events_list_kwargs(
+        calendar_id, time_min, time_max, query, page_size, single_events, order_by, show_deleted, fields
+    )
+
+    logger.info(f"Streaming events from calendar '{calendar_id}' with parameters: {list_kwargs}")
+
+    request = service.events().list(**list_kwargs)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(request.execute) if prefetch else None
+        while request is not None:
+            response = pending.result() if pending else request.execute()
+
+            request = service.events().list_next(request, response)
+            pending = executor.submit(request.execute) if prefetch and request is not None else None
+
+            yield from response.get('items', [])
 
-    except HttpError as error:
-        logger.error(f"An API error occurred while finding events: {error}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while finding events: {e}", exc_info=True)
-        return None
 
+def find_events_multi(
+    service: CalendarService,
+    calendar_ids: List[str],
+    **kwargs: Any
+) -> Dict[str, Optional[EventsResponse]]:
+    """
+    Finds events in several calendars concurrently.
+
+    Args:
+        service: Calendar API service instance
+        calendar_ids: Calendar identifiers to search
+        **kwargs: Search criteria passed through to find_events
 
+    Returns:
+        A dictionary mapping each calendar ID to its EventsResponse, or None if that search failed
+    """
+    def fetch(calendar_id: str) -> Optional[EventsResponse]:
+        return find_events(_thread_service(service), calendar_id=calendar_id, **kwargs)
+
+    logger.info(f"Fetching events from {len(calendar_ids)} calendars concurrently.")
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        return dict(zip(calendar_ids, executor.map(fetch, calendar_ids)))
+
+
+@_handle_api_errors('creating event', retry_status=RATE_LIMIT_STATUS)
 def create_event(
     service: CalendarService,
     event_data: EventCreateRequest,
@@ -251,78 +699,24 @@ def create_event(
     Returns:
         A GoogleCalendarEvent object representing the created event, or None if an error occurs
     """
-    def format_datetime_field(dt_obj: datetime) -> str:
-        if dt_obj.tzinfo is None:
-            return dt_obj.isoformat() + 'Z'
-        else:
-            return dt_obj.isoformat()
-
-    # Construct event body
-    event_body: Dict[str, Any] = {}
-
-    if not event_data.start or not event_data.end:
-        logger.error("Event creation failed: Start and End times are required.")
+    event_body = _build_event_body(event_data)
+    if event_body is None:
         return None
 
-    # Start time
-    event_body['start'] = {}
-    if event_data.start.dateTime:
-        event_body['start']['dateTime'] = format_datetime_field(event_data.start.dateTime)
-        if event_data.start.timeZone:
-            event_body['start']['timeZone'] = event_data.start.timeZone
-    elif event_data.start.date:
-        event_body['start']['date'] = str(event_data.start.date)
-    else:
-        logger.error("Event creation failed: Start time requires either dateTime or date.")
-        return None
-
-    # End time
-    event_body['end'] = {}
-    if event_data.end.dateTime:
-        event_body['end']['dateTime'] = format_datetime_field(event_data.end.dateTime)
-        if event_data.end.timeZone:
-            event_body['end']['timeZone'] = event_data.end.timeZone
-    elif event_data.end.date:
-        event_body['end']['date'] = str(event_data.end.date)
-    else:
-        logger.error("Event creation failed: End time requires either dateTime or date.")
-        return None
-
-    # Optional fields
-    if event_data.summary:
-        event_body['summary'] = event_data.summary
-    if event_data.description:
-        event_body['description'] = event_data.description
-    if event_data.location:
-        event_body['location'] = event_data.location
-    if event_data.attendees:
-        event_body['attendees'] = [{'email': email} for email in event_data.attendees]
-    if event_data.recurrence:
-        event_body['recurrence'] = event_data.recurrence
-    if event_data.reminders:
-        event_body['reminders'] = event_data.reminders.dict(by_alias=True, exclude_unset=True)
-
     logger.info(f"Creating event in calendar '{calendar_id}': {event_body.get('summary', '[No Summary]')}")
 
-    try:
-        created_event = service.events().insert(
-            calendarId=calendar_id,
-            body=event_body,
-            sendNotifications=send_notifications
-        ).execute()
-
-        logger.info(f"Successfully created event with ID: {created_event.get('id')}")
-        parsed_event = GoogleCalendarEvent(**created_event)
-        return parsed_event
+    created_event = _execute_raw(service.events().insert(
+        calendarId=calendar_id,
+        body=event_body,
+        sendNotifications=send_notifications
+    ))
 
-    except HttpError as error:
-        logger.error(f"Google API error while creating event: {error}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while creating event: {e}", exc_info=True)
-        return None
+    parsed_event = GoogleCalendarEvent.model_validate_json(created_event)
+    logger.info(f"Successfully created event with ID: {parsed_event.id}")
+    return parsed_event
 
 
+@_handle_api_errors('quick adding event', retry_status=RATE_LIMIT_STATUS)
 def quick_add_event(
     service: CalendarService,
     text: str,
@@ -343,31 +737,25 @@ def quick_add_event(
     """
     logger.info(f"Quick adding event to calendar '{calendar_id}' with text: \"{text}\"")
 
-    try:
-        created_event = service.events().quickAdd(
-            calendarId=calendar_id,
-            text=text,
-            sendNotifications=send_notifications
-        ).execute()
-
-        logger.info(f"Successfully quick-added event with ID: {created_event.get('id')}")
-        parsed_event = GoogleCalendarEvent(**created_event)
-        return parsed_event
+    created_event = _execute_raw(service.events().quickAdd(
+        calendarId=calendar_id,
+        text=text,
+        sendNotifications=send_notifications
+    ))
 
-    except HttpError as error:
-        logger.error(f"An API error occurred during quick add: {error}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during quick add: {e}", exc_info=True)
-        return None
+    parsed_event = GoogleCalendarEvent.model_validate_json(created_event)
+    logger.info(f"Successfully quick-added event with ID: {parsed_event.id}")
+    return parsed_event
 
 
+@_handle_api_errors('updating event', retry_status=RETRY_STATUS)
 def update_event(
     service: CalendarService,
     event_id: str,
     update_data: EventUpdateRequest,
     calendar_id: str = 'primary',
-    send_notifications: bool = True
+    send_notifications: bool = True,
+    fetch_if_empty: bool = False
 ) -> Optional[GoogleCalendarEvent]:
     """
     Updates an existing event using patch semantics.
@@ -378,90 +766,36 @@ def update_event(
         update_data: An EventUpdateRequest object containing fields to update
         calendar_id: Calendar identifier
         send_notifications: Whether to send update notifications to attendees
+        fetch_if_empty: Whether to fetch and return the unchanged event when there is nothing to update
 
     Returns:
         A GoogleCalendarEvent object representing the updated event, or None if an error occurs
+        or there is nothing to update (unless fetch_if_empty is set)
     """
-    def format_datetime_field(dt_obj: datetime) -> str:
-        if dt_obj.tzinfo is None:
-            return dt_obj.isoformat() + 'Z'
-        else:
-            return dt_obj.isoformat()
-
-    update_body: Dict[str, Any] = {}
-
-    if update_data.summary is not None:
-        update_body['summary'] = update_data.summary
-    if update_data.description is not None:
-        update_body['description'] = update_data.description
-    if update_data.location is not None:
-        update_body['location'] = update_data.location
-
-    # Handle start time
-    if update_data.start is not None:
-        start_details = {}
-        if update_data.start.dateTime:
-            start_details['dateTime'] = format_datetime_field(update_data.start.dateTime)
-            if update_data.start.timeZone:
-                start_details['timeZone'] = update_data.start.timeZone
-        elif update_data.start.date:
-            start_details['date'] = str(update_data.start.date)
-        if start_details:
-            update_body['start'] = start_details
-
-    # Handle end time
-    if update_data.end is not None:
-        end_details = {}
-        if update_data.end.dateTime:
-            end_details['dateTime'] = format_datetime_field(update_data.end.dateTime)
-            if update_data.end.timeZone:
-                end_details['timeZone'] = update_data.end.timeZone
-        elif update_data.end.date:
-            end_details['date'] = str(update_data.end.date)
-        if end_details:
-            update_body['end'] = end_details
-
-    # Handle attendees
-    if update_data.attendees is not None:
-        update_body['attendees'] = [
-            attendee.dict(by_alias=True, exclude_unset=True) 
-            for attendee in update_data.attendees
-        ]
+    update_body = _build_update_body(update_data)
 
     if not update_body:
         logger.warning(f"Update called for event {event_id} with no fields to update.")
-        try:
-            existing_event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-            return GoogleCalendarEvent(**existing_event)
-        except HttpError as e:
-            logger.error(f"Failed to retrieve event {event_id} after empty update request: {e}")
+        if not fetch_if_empty:
             return None
+        existing_event = _execute_raw(service.events().get(calendarId=calendar_id, eventId=event_id))
+        return GoogleCalendarEvent.model_validate_json(existing_event)
 
     logger.info(f"Updating event '{event_id}' in calendar '{calendar_id}'.")
 
-    try:
-        updated_event = service.events().patch(
-            calendarId=calendar_id,
-            eventId=event_id,
-            body=update_body,
-            sendNotifications=send_notifications
-        ).execute()
-
-        logger.info(f"Successfully updated event '{event_id}'.")
-        parsed_event = GoogleCalendarEvent(**updated_event)
-        return parsed_event
+    updated_event = _execute_raw(service.events().patch(
+        calendarId=calendar_id,
+        eventId=event_id,
+        body=update_body,
+        sendNotifications=send_notifications
+    ))
 
-    except HttpError as error:
-        if error.resp.status == 404:
-            logger.error(f"Event '{event_id}' not found in calendar '{calendar_id}'.")
-        else:
-            logger.error(f"Google API error while updating event '{event_id}': {error}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while updating event '{event_id}': {e}", exc_info=True)
-        return None
+    logger.info(f"Successfully updated event '{event_id}'.")
+    parsed_event = GoogleCalendarEvent.model_validate_json(updated_event)
+    return parsed_event
 
 
+@_handle_api_errors('deleting event', default=False)
 def delete_event(
     service: CalendarService,
     event_id: str,
@@ -482,27 +816,17 @@ def delete_event(
     """
     logger.info(f"Attempting to delete event '{event_id}' from calendar '{calendar_id}'.")
 
-    try:
-        service.events().delete(
-            calendarId=calendar_id,
-            eventId=event_id,
-            sendNotifications=send_notifications
-        ).execute()
-        
-        logger.info(f"Successfully deleted event '{event_id}'.")
-        return True
-
-    except HttpError as error:
-        if error.resp.status in [404, 410]:
-            logger.error(f"Event '{event_id}' not found or already deleted in calendar '{calendar_id}'.")
-        else:
-            logger.error(f"Google API error while deleting event '{event_id}': {error}", exc_info=True)
-        return False
-    except Exception as e:
-        logger.error(f"An unexpected error occurred while deleting event '{event_id}': {e}", exc_info=True)
-        return False
+    service.events().delete(
+        calendarId=calendar_id,
+        eventId=event_id,
+        sendNotifications=send_notifications
+    ).execute()
+    
+    logger.info(f"Successfully deleted event '{event_id}'.")
+    return True
 
 
+@_handle_api_errors('retrieving event')
 def get_event(
     service: CalendarService,
     event_id: str,
@@ -519,23 +843,235 @@ def get_event(
     Returns:
         A GoogleCalendarEvent object, or None if an error occurs
     """
-    try:
-        event = service.events().get(calendarId=calendar_id, eventId=event_id).execute()
-        return GoogleCalendarEvent(**event)
-    except HttpError as error:
-        logger.error(f"Error retrieving event '{event_id}': {error}")
-        return None
+    event = _execute_raw(service.events().get(calendarId=calendar_id, eventId=event_id))
+    return GoogleCalendarEvent.model_validate_json(event)
+
+
+def create_events_batch(
+    service: CalendarService,
+    events: List[EventCreateRequest],
+    calendar_id: str = 'primary',
+    send_notifications: bool = True
+) -> List[Optional[GoogleCalendarEvent]]:
+    """
+    Creates several events using batch HTTP requests instead of one request per event.
+
+    Args:
+        service: Calendar API service instance
+        events: EventCreateRequest objects containing event details
+        calendar_id: Calendar identifier
+        send_notifications: Whether to send notifications about the creation to attendees
+
+    Returns:
+        A list aligned with `events` holding the created GoogleCalendarEvent, or None where creation failed
+    """
+    requests = []
+    for i, event_data in enumerate(events):
+        event_body = _build_event_body(event_data)
+        if event_body is not None:
+            requests.append((i, service.events().insert(
+                calendarId=calendar_id,
+                body=event_body,
+                sendNotifications=send_notifications
+            )))
+
+    logger.info(f"Batch creating {len(requests)} events in calendar '{calendar_id}'.")
+
+    created_events: List[Optional[GoogleCalendarEvent]] = []
+    for i, (response, exception) in enumerate(_execute_batch(service, requests, len(events))):
+        if exception is not None:
+            logger.error(f"Google API error while creating event #{i}: {exception}")
+        created_events.append(GoogleCalendarEvent.model_validate(response) if response else None)
+
+    return created_events
+
+
+def update_events_batch(
+    service: CalendarService,
+    updates: List[Tuple[str, EventUpdateRequest]],
+    calendar_id: str = 'primary',
+    send_notifications: bool = True,
+    fetch_if_empty: bool = False
+) -> List[Optional[GoogleCalendarEvent]]:
+    """
+    Updates several events using batch HTTP requests instead of one request per event.
+
+    Args:
+        service: Calendar API service instance
+        updates: (event_id, EventUpdateRequest) pairs
+        calendar_id: Calendar identifier
+        send_notifications: Whether to send update notifications to attendees
+        fetch_if_empty: Whether to fetch unchanged events whose update has no fields
+
+    Returns:
+        A list aligned with `updates` holding the updated GoogleCalendarEvent, or None where the update failed
+    """
+    requests = []
+    for i, (event_id, update_data) in enumerate(updates):
+        update_body = _build_update_body(update_data)
+        if update_body:
+            request = service.events().patch(
+                calendarId=calendar_id,
+                eventId=event_id,
+                body=update_body,
+                sendNotifications=send_notifications
+            )
+        elif fetch_if_empty:
+            request = service.events().get(calendarId=calendar_id, eventId=event_id)
+        else:
+            logger.warning(f"Update called for event {event_id} with no fields to update.")
+            continue
+        requests.append((i, request))
+
+    logger.info(f"Batch updating {len(requests)} events in calendar '{calendar_id}'.")
+
+    updated_events: List[Optional[GoogleCalendarEvent]] = []
+    for (event_id, _), (response, exception) in zip(updates, _execute_batch(service, requests, len(updates))):
+        if exception is not None:
+            logger.error(f"Google API error while updating event '{event_id}': {exception}")
+        updated_events.append(GoogleCalendarEvent.model_validate(response) if response else None)
+
+    return updated_events
+
+
+def delete_events_batch(
+    service: CalendarService,
+    event_ids: List[str],
+    calendar_id: str = 'primary',
+    send_notifications: bool = True
+) -> List[bool]:
+    """
+    Deletes several events using batch HTTP requests instead of one request per event.
+
+    Args:
+        service: Calendar API service instance
+        event_ids: The IDs of the events to delete
+        calendar_id: Calendar identifier
+        send_notifications: Whether to send deletion notifications to attendees
+
+    Returns:
+        A list aligned with `event_ids`, True where the event was deleted successfully
+    """
+    requests = [
+        (i, service.events().delete(
+            calendarId=calendar_id,
+            eventId=event_id,
+            sendNotifications=send_notifications
+        ))
+        for i, event_id in enumerate(event_ids)
+    ]
+
+    logger.info(f"Batch deleting {len(requests)} events from calendar '{calendar_id}'.")
+
+    deleted: List[bool] = []
+    for event_id, (_, exception) in zip(event_ids, _execute_batch(service, requests, len(event_ids))):
+        if exception is not None:
+            logger.error(f"Google API error while deleting event '{event_id}': {exception}")
+        deleted.append(exception is None)
+
+    return deleted
 
 
 # === ANALYSIS FUNCTIONS ===
 
+EXDATE_RE = re.compile(r'^EXDATE(?:;([^:]+))?:(.+)$')
+RRULE_UNTIL_RE = re.compile(r'UNTIL=([^;]+)')
+
+
+@functools.lru_cache(maxsize=4096)
+def _build_ruleset(rrule_str: str, dtstart_iso: str, exdate_strs: Tuple[str, ...]) -> rrule.rruleset:
+    """
+    Build the rruleset for a recurrence (memoized across calls).
+
+    Args:
+        rrule_str: The event's RRULE line
+        dtstart_iso: ISO representation of the event start
+        exdate_strs: The event's EXDATE lines, sorted
+
+    Returns:
+        The recurrence rule set with its exception dates applied
+    """
+    dtstart_obj = datetime.fromisoformat(dtstart_iso)
+
+    ruleset = rrule.rruleset()
+    ruleset.rrule(rrule.rrulestr(rrule_str, dtstart=dtstart_obj))
+
+    for exdate_str in exdate_strs:
+        for ex_dt in _parse_exdate(exdate_str, dtstart_obj):
+            ruleset.exdate(ex_dt)
+
+    return ruleset
+
+
+def _rrule_ends_before(rrule_str: str, time_min: datetime) -> bool:
+    """Check whether an RRULE's UNTIL bound lies before `time_min`."""
+    match = RRULE_UNTIL_RE.search(rrule_str)
+    if not match:
+        return False
+
+    try:
+        until = _fast_isoparse(match.group(1))
+    except ValueError:
+        return False
+
+    # Compare in the same awareness as the window
+    if until.tzinfo is None and time_min.tzinfo is not None:
+        until = until.replace(tzinfo=time_min.tzinfo)
+    elif until.tzinfo is not None and time_min.tzinfo is None:
+        until = until.replace(tzinfo=None)
+    return until < time_min
+
+
+def _parse_exdate(exdate_str: str, dtstart_obj: datetime) -> List[datetime]:
+    """
+    Parse an EXDATE line into datetimes comparable with the rule's DTSTART.
+
+    Args:
+        exdate_str: EXDATE property, e.g. 'EXDATE;TZID=Europe/Berlin:20240101T090000,20240108T090000'
+        dtstart_obj: Start of the recurring event
+
+    Returns:
+        The excluded datetimes (unparseable values are logged and skipped)
+    """
+    match = EXDATE_RE.match(exdate_str)
+    if not match:
+        return []
+
+    param_str, dates_str = match.groups()
+    params = {
+        key.upper(): value
+        for key, _, value in (part.partition('=') for part in (param_str or '').split(';'))
+        if value
+    }
+    is_all_day = params.get('VALUE') == 'DATE'
+    exdate_tz = tz.gettz(params['TZID']) if 'TZID' in params else dtstart_obj.tzinfo
+
+    ex_dts: List[datetime] = []
+    for date_str in dates_str.split(','):
+        try:
+            if is_all_day:
+                ex_dt = datetime.combine(date.fromisoformat(date_str), datetime.min.time())
+            else:
+                ex_dt = _fast_isoparse(date_str)
+        except ValueError:
+            logger.warning(f"Could not parse EXDATE value '{date_str}' in '{exdate_str}'")
+            continue
+
+        if ex_dt.tzinfo is None and dtstart_obj.tzinfo:
+            ex_dt = ex_dt.replace(tzinfo=exdate_tz)
+        ex_dts.append(ex_dt)
+
+    return ex_dts
+
+
+@_handle_api_errors('projecting recurring events')
 def project_recurring_events(
     service: CalendarService,
     time_min: datetime,
     time_max: datetime,
     calendar_id: str = 'primary',
     event_query: Optional[str] = None
-) -> List[ProjectedEventOccurrence]:
+) -> Optional[ProjectedOccurrences]:
     """
     Finds recurring events and projects their occurrences within a time window.
 
@@ -547,72 +1083,59 @@ def project_recurring_events(
         event_query: Optional text query to filter master recurring events
 
     Returns:
-        A list of ProjectedEventOccurrence objects representing calculated occurrences
+        A ProjectedOccurrences collection of the calculated occurrences, sorted by start,
+        or None if the events could not be retrieved
     """
-    projected_occurrences: List[ProjectedEventOccurrence] = []
+    # One run per master event; each is already sorted because rruleset.between is
+    runs: List[List[ProjectedEventOccurrence]] = []
 
     logger.info(f"Starting projection of recurring events for calendar '{calendar_id}'")
     logger.info(f"Projection window: {time_min} to {time_max}. Query: '{event_query or 'None'}'")
 
-    # Find master recurring events
-    master_events_response = find_events(
+    # Stream master recurring events (orderBy=startTime is only valid for single events)
+    master_items = iter_events(
         service=service,
         calendar_id=calendar_id,
         query=event_query,
         single_events=False,  # Get the master event definition
+        order_by=None,
         show_deleted=False,
-        max_results=2500
+        fields='nextPageToken,items(id,summary,start,end,recurrence)'
     )
 
-    if not master_events_response or not master_events_response.items:
-        logger.info("No master recurring events found matching the criteria.")
-        return []
-
-    logger.debug(f"Found {len(master_events_response.items)} potential master events.")
-
     # Process each master event
-    for event in master_events_response.items:
-        if not event.recurrence:
+    for item in master_items:
+        if not item.get('recurrence'):
             continue
 
-        if not event.start or not (event.start.dateTime or event.start.date):
-            logger.warning(f"Skipping recurring event without start time: {event.summary} ({event.id})")
+        try:
+            event = EventView.from_api(item)
+        except ValueError as e:
+            logger.error(f"Could not parse start/end for event {item.get('summary')} ({item.get('id')}): {e}")
             continue
 
         # Determine the start datetime and duration
         dtstart_obj: Optional[datetime] = None
         event_duration: Optional[timedelta] = None
 
-        if event.start.dateTime:
-            try:
-                dtstart_obj = date_parser.isoparse(event.start.dateTime)
-                if event.end and event.end.dateTime:
-                    dtend_obj = date_parser.isoparse(event.end.dateTime)
-                    event_duration = dtend_obj - dtstart_obj
-                else:
-                    event_duration = timedelta(hours=1)
-                    logger.warning(f"Recurring event '{event.summary}' missing end.dateTime, assuming {event_duration} duration.")
-            except ValueError as e:
-                logger.error(f"Could not parse dateTime for event {event.summary} ({event.id}): {e}")
-                continue
-        elif event.start.date:
-            try:
-                start_date = date_parser.parse(event.start.date).date()
-                dtstart_obj = datetime.combine(start_date, datetime.min.time())
-                if time_min.tzinfo:
-                    dtstart_obj = dtstart_obj.replace(tzinfo=time_min.tzinfo)
-
-                if event.end and event.end.date:
-                    end_date = date_parser.parse(event.end.date).date()
-                    event_duration = end_date - start_date
-                else:
-                    event_duration = timedelta(days=1)
-            except ValueError as e:
-                logger.error(f"Could not parse date for event {event.summary} ({event.id}): {e}")
-                continue
-
-        if not dtstart_obj or event_duration is None:
-            logger.error(f"Could not determine dtstart or duration for event {event.summary} ({event.id})")
+        if event.start_dt:
+            dtstart_obj = event.start_dt
+            if event.end_dt:
+                event_duration = event.end_dt - dtstart_obj
+            else:
+                event_duration = timedelta(hours=1)
+                logger.warning(f"Recurring event '{event.summary}' missing end.dateTime, assuming {event_duration} duration.")
+        elif event.start_date:
+            dtstart_obj = datetime.combine(event.start_date, datetime.min.time())
+            if time_min.tzinfo:
+                dtstart_obj = dtstart_obj.replace(tzinfo=time_min.tzinfo)
+
+            if event.end_date:
+                event_duration = event.end_date - event.start_date
+            else:
+                event_duration = timedelta(days=1)
+        else:
+            logger.warning(f"Skipping recurring event without start time: {event.summary} ({event.id})")
             continue
 
         # Extract RRULE
@@ -629,47 +1152,21 @@ def project_recurring_events(
             logger.warning(f"Recurring event '{event.summary}' ({event.id}) has no RRULE string. Skipping.")
             continue
 
+        # Skip rules whose last occurrence precedes the window
+        if _rrule_ends_before(rrule_str, time_min):
+            continue
+
         try:
-            # Parse the recurrence rule
-            ruleset = rrule.rruleset()
-            main_rule = rrule.rrulestr(rrule_str, dtstart=dtstart_obj, forceset=True)
-            ruleset.rrule(main_rule[0])
-
-            # Add exception dates
-            for exdate_str in exdate_strs:
-                parts = exdate_str.split(':', 1)
-                if len(parts) == 2:
-                    param_str, dates_str = parts
-                    dates = dates_str.split(',')
-                    params = {}
-                    if ';' in param_str:
-                        param_parts = param_str.split(';')[1:]
-                        for part in param_parts:
-                            if '=' in part:
-                                key, value = part.split('=', 1)
-                                params[key.upper()] = value
-
-                    is_all_day = params.get('VALUE') == 'DATE'
-
-                    for date_str in dates:
-                        try:
-                            if is_all_day:
-                                ex_date = date_parser.parse(date_str).date()
-                                ex_dt = datetime.combine(ex_date, datetime.min.time())
-                                if dtstart_obj.tzinfo:
-                                    ex_dt = ex_dt.replace(tzinfo=dtstart_obj.tzinfo)
-                            else:
-                                ex_dt = date_parser.isoparse(date_str)
-
-                            ruleset.exdate(ex_dt)
-                        except ValueError:
-                            logger.warning(f"Could not parse EXDATE value '{date_str}' for event {event.id}")
+            # Build (or reuse) the rule set for this recurrence
+            ruleset = _build_ruleset(rrule_str, dtstart_obj.isoformat(), tuple(sorted(exdate_strs)))
 
             # Generate occurrences within the window
             occurrences = ruleset.between(time_min, time_max, inc=True)
 
             logger.debug(f"Event '{event.summary}' ({event.id}): Found {len(occurrences)} occurrences via rrule.")
 
+            summary = event.summary or "No Summary"
+            run: List[ProjectedEventOccurrence] = []
             for occ_start_dt in occurrences:
                 # Ensure timezone consistency
                 if dtstart_obj.tzinfo and occ_start_dt.tzinfo is None:
@@ -679,30 +1176,31 @@ def project_recurring_events(
 
                 occ_end_dt = occ_start_dt + event_duration
 
-                projected_occurrences.append(
-                    ProjectedEventOccurrence(
-                        original_event_id=event.id,
-                        original_summary=event.summary or "No Summary",
-                        occurrence_start=occ_start_dt,
-                        occurrence_end=occ_end_dt
-                    )
-                )
+                run.append(ProjectedEventOccurrence(event.id, summary, occ_start_dt, occ_end_dt))
+            if run:
+                runs.append(run)
 
         except Exception as e:
             logger.error(f"Failed to parse/process recurrence for event '{event.summary}' ({event.id}): {e}", exc_info=True)
             continue
 
+    # Merge the pre-sorted runs: O(N log K) for K recurring events
+    projected_occurrences = ProjectedOccurrences(heapq.merge(*runs, key=lambda x: x.occurrence_start))
+
+    if not projected_occurrences:
+        logger.info("No recurring event occurrences found in the projection window.")
+
     logger.info(f"Finished projection. Found {len(projected_occurrences)} total occurrences.")
-    projected_occurrences.sort(key=lambda x: x.occurrence_start)
     return projected_occurrences
 
 
+@_handle_api_errors('analyzing busyness')
 def analyze_busyness(
     service: CalendarService,
     time_min: datetime,
     time_max: datetime,
     calendar_id: str = 'primary',
-) -> Dict[date, Dict[str, Any]]:
+) -> Optional[Dict[date, Dict[str, Any]]]:
     """
     Analyzes event count and total duration per day within a time window.
 
@@ -713,76 +1211,76 @@ def analyze_busyness(
         calendar_id: The calendar to analyze
 
     Returns:
-        A dictionary mapping each date within the window to its busyness stats
+        A dictionary mapping each date within the window to its busyness stats, or None
+        if the events could not be retrieved
     """
-    busyness_by_date: Dict[date, Dict[str, Any]] = defaultdict(lambda: {'event_count': 0, 'total_duration_minutes': 0.0})
+    # One pre-allocated bucket per day in [time_min.date(), time_max.date())
+    window_start = time_min.date()
+    busyness_by_date: Dict[date, Dict[str, Any]] = {
+        window_start + timedelta(days=i): {'event_count': 0, 'total_duration_minutes': 0.0}
+        for i in range((time_max.date() - window_start).days)
+    }
 
     logger.info(f"Starting busyness analysis for calendar '{calendar_id}'")
     logger.info(f"Analysis window: {time_min} to {time_max}")
 
-    # Find all event instances in the range
-    events_response = find_events(
+    # Stream all event instances in the range
+    items = iter_events(
         service=service,
         calendar_id=calendar_id,
         time_min=time_min,
         time_max=time_max,
         single_events=True,
         show_deleted=False,
-        max_results=2500
+        fields='nextPageToken,items(id,summary,start,end)'
     )
 
-    if not events_response or not events_response.items:
-        logger.info("No events found in the specified time range for busyness analysis.")
-        return dict(busyness_by_date)
+    # Process events and aggregate stats by date; hot lookups are bound to locals
+    from_api = EventView.from_api
+    get_bucket = busyness_by_date.get
 
-    logger.debug(f"Found {len(events_response.items)} event instances for analysis.")
+    for item in items:
+        try:
+            event = from_api(item)
+        except ValueError:
+            logger.warning(f"Could not parse start/end for event {item.get('id')}: {item.get('start')} - {item.get('end')}")
+            continue
 
-    # Process events and aggregate stats by date
-    for event in events_response.items:
-        start_dt: Optional[datetime] = None
-        end_dt: Optional[datetime] = None
-        event_date: Optional[date] = None
+        start_dt = event.start_dt
+        end_dt = event.end_dt
 
-        # Determine start and end datetimes/dates
-        if event.start:
-            if event.start.dateTime:
-                try:
-                    start_dt = date_parser.isoparse(event.start.dateTime)
-                    event_date = start_dt.date()
-                except ValueError:
-                    logger.warning(f"Could not parse start dateTime: {event.start.dateTime}")
-                    continue
-            elif event.start.date:
-                try:
-                    event_date = date_parser.parse(event.start.date).date()
-                except ValueError:
-                    logger.warning(f"Could not parse start date: {event.start.date}")
-                    continue
+        # Determine the event date
+        event_date = start_dt.date() if start_dt else event.start_date
 
         if not event_date:
             logger.warning(f"Event '{event.summary}' ({event.id}) missing valid start information. Skipping.")
             continue
 
         # Ensure the event actually starts within our analysis window bounds
-        if not (time_min.date() <= event_date < time_max.date()):
+        bucket = get_bucket(event_date)
+        if bucket is None:
             continue
 
         # Increment event count for the date
-        busyness_by_date[event_date]['event_count'] += 1
+        bucket['event_count'] += 1
 
         # Calculate duration for non-all-day events
-        if start_dt and event.end and event.end.dateTime:
+        if start_dt and end_dt:
             try:
-                end_dt = date_parser.isoparse(event.end.dateTime)
                 duration = end_dt - start_dt
-                busyness_by_date[event_date]['total_duration_minutes'] += max(0, duration.total_seconds() / 60.0)
-            except ValueError:
-                logger.warning(f"Could not parse end dateTime: {event.end.dateTime} for event {event.id}")
+                bucket['total_duration_minutes'] += max(0, duration.total_seconds() / 60.0)
             except TypeError:
                 logger.warning(f"Could not calculate duration for event {event.id} (start: {start_dt}, end: {end_dt})")
 
-    # Convert defaultdict back to regular dict and sort by date
-    sorted_busyness = dict(sorted(busyness_by_date.items()))
+    # Buckets are already in date order; only report days that had events
+    sorted_busyness = {
+        event_date: stats
+        for event_date, stats in busyness_by_date.items()
+        if stats['event_count']
+    }
+
+    if not sorted_busyness:
+        logger.info("No events found in the specified time range for busyness analysis.")
 
     logger.info(f"Finished busyness analysis. Analyzed {len(sorted_busyness)} days.")
     return sorted_busyness
@@ -790,12 +1288,72 @@ def analyze_busyness(
 
 # === AVAILABILITY FUNCTIONS ===
 
+# Maximum number of calendars the free/busy endpoint accepts per query
+FREEBUSY_MAX_CALENDARS = 50
+
+
+@functools.lru_cache(maxsize=128)
+def _freebusy_items(calendar_ids: Tuple[str, ...]) -> List[Dict[str, str]]:
+    """Build the free/busy request 'items' list (memoized for repeated polls; do not mutate)."""
+    return [{"id": cal_id} for cal_id in calendar_ids]
+
+
+def _parse_freebusy_calendars(freebusy_result: Dict[str, Any]) -> Dict[str, FreeBusyResult]:
+    """
+    Convert the 'calendars' section of a free/busy response into parsed busy intervals.
+
+    Args:
+        freebusy_result: Raw free/busy API response
+
+    Returns:
+        A dictionary mapping each calendar ID to its free/busy information
+    """
+    processed_results: Dict[str, FreeBusyResult] = {}
+    calendars_data = freebusy_result.get('calendars', {})
+
+    validate_busy = BUSY_LIST_ADAPTER.validate_python
+    # Timestamps parsed by the slow path, shared across calendars for this response only;
+    # recurring blocks and shared meetings repeat the same strings
+    parsed: Dict[str, datetime] = {}
+
+    def isoparse(value: str) -> datetime:
+        dt = parsed.get(value)
+        if dt is None:
+            dt = parsed[value] = _fast_isoparse(value)
+        return dt
+
+    for cal_id, data in calendars_data.items():
+        busy = data.get('busy') or ()
+        try:
+            # Fast path: validate the whole list in one pydantic-core pass
+            busy_intervals = validate_busy(busy)
+        except ValidationError:
+            # Slow path: parse row by row so one bad interval doesn't drop the rest
+            busy_intervals = []
+            append = busy_intervals.append
+            for interval in busy:
+                try:
+                    start_dt = isoparse(interval.get('start'))
+                    end_dt = isoparse(interval.get('end'))
+                    append(BusyInterval(start=start_dt, end=end_dt))
+                except (TypeError, ValueError) as parse_error:
+                    logger.warning(f"Could not parse busy interval for {cal_id}: {interval}. Error: {parse_error}")
+
+        processed_results[cal_id] = {
+            'busy': busy_intervals,
+            'errors': data.get('errors') or []
+        }
+
+    return processed_results
+
+
+@_handle_api_errors('querying free/busy information', retry_status=RETRY_STATUS)
 def find_availability(
     service: CalendarService,
     time_min: datetime,
     time_max: datetime,
     calendar_ids: List[str]
-) -> Optional[Dict[str, Dict[str, Any]]]:
+) -> Optional[Dict[str, FreeBusyResult]]:
     """
     Finds free/busy information for a list of calendars.
 
@@ -818,39 +1376,73 @@ def find_availability(
     request_body = {
         "timeMin": time_min_str,
         "timeMax": time_max_str,
-        "items": [{"id": cal_id} for cal_id in calendar_ids]
+        "items": _freebusy_items(tuple(calendar_ids))
     }
 
     logger.info(f"Querying free/busy information for calendars: {calendar_ids} between {time_min_str} and {time_max_str}")
 
-    try:
-        freebusy_result = service.freebusy().query(body=request_body).execute()
+    # Decode the raw body with pydantic-core's JSON parser; googleapiclient would
+    # first copy it into a str and then run the stdlib parser
+    freebusy_result = from_json(_execute_raw(service.freebusy().query(body=request_body)))
 
-        # Process the response
-        processed_results: Dict[str, Dict[str, Any]] = {}
-        calendars_data = freebusy_result.get('calendars', {})
+    # Process the response
+    processed_results = _parse_freebusy_calendars(freebusy_result)
+
+    logger.info(f"Successfully retrieved free/busy information for {len(processed_results)} calendars.")
+    return processed_results
 
-        for cal_id, data in calendars_data.items():
-            busy_intervals = []
-            for interval in data.get('busy', []):
-                try:
-                    start_dt = date_parser.isoparse(interval.get('start'))
-                    end_dt = date_parser.isoparse(interval.get('end'))
-                    busy_intervals.append({'start': start_dt, 'end': end_dt})
-                except (TypeError, ValueError) as parse_error:
-                    logger.warning(f"Could not parse busy interval for {cal_id}: {interval}. Error: {parse_error}")
 
-            processed_results[cal_id] = {
-                'busy': busy_intervals,
-                'errors': data.get('errors', [])
-            }
+def find_availability_many(
+    service: CalendarService,
+    time_min: datetime,
+    time_max: datetime,
+    calendar_ids: List[str]
+) -> Optional[Dict[str, FreeBusyResult]]:
+    """
+    Finds free/busy information for an arbitrarily long list of calendars.
 
-        logger.info(f"Successfully retrieved free/busy information for {len(processed_results)} calendars.")
-        return processed_results
+    Calendars are grouped into queries of FREEBUSY_MAX_CALENDARS each, and the
+    queries are sent together as a single batch HTTP request.
 
-    except HttpError as error:
-        logger.error(f"An API error occurred during free/busy query: {error}", exc_info=True)
-        return None
-    except Exception as e:
-        logger.error(f"An unexpected error occurred during free/busy query: {e}", exc_info=True)
-        return None
\ No newline at end of file
+    Args:
+        service: Calendar API service instance
+        time_min: Start of the time range
+        time_max: End of the time range
+        calendar_ids: A list of calendar identifiers to query
+
+    Returns:
+        A dictionary mapping each calendar ID to its free/busy information, or None if any query fails
+    """
+    chunks = [
+        calendar_ids[i:i + FREEBUSY_MAX_CALENDARS]
+        for i in range(0, len(calendar_ids), FREEBUSY_MAX_CALENDARS)
+    ]
+    if len(chunks) <= 1:
+        return find_availability(service, time_min, time_max, calendar_ids)
+
+    time_min_str = _format_datetime_field(time_min)
+    time_max_str = _format_datetime_field(time_max)
+
+    requests = [
+        (i, service.freebusy().query(body={
+            "timeMin": time_min_str,
+            "timeMax": time_max_str,
+            "items": _freebusy_items(tuple(chunk))
+        }))
+        for i, chunk in enumerate(chunks)
+    ]
+
+    logger.info(f"Querying free/busy information for {len(calendar_ids)} calendars in {len(chunks)} batched queries")
+
+    # Merge the 'calendars' sections of every response, then parse them in one pass
+    calendars_data: Dict[str, Any] = {}
+    for response, exception in _execute_batch(service, requests, len(chunks)):
+        if exception is not None:
+            logger.error(f"An API error occurred during free/busy query: {exception}")
+            return None
+        calendars_data.update(response.get('calendars', {}))
+
+    processed_results = _parse_freebusy_calendars({'calendars': calendars_data})
+
+    logger.info(f"Successfully retrieved free/busy information for {len(processed_results)} calendars.")
+    return processed_results
@@ -2,9 +2,14 @@
 Pydantic models for Google Calendar API resources and requests.
 """
 
+import bisect
 import datetime
-from pydantic import BaseModel, Field, EmailStr
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter, field_validator
+from typing import Optional, List, Dict, Any, Iterable, Iterator, NamedTuple, Annotated, TypedDict, Union, overload
+
+# Shared model configuration
+_CFG = ConfigDict(populate_by_name=True, validate_default=False)
 
 
 class EventDateTime(BaseModel):
@@ -13,14 +18,45 @@ class EventDateTime(BaseModel):
     dateTime: Optional[datetime.datetime] = None
     timeZone: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
+
+
+class TimedEventDateTime(EventDateTime):
+    """Start or end of a timed event; only dateTime is set."""
+    dateTime: datetime.datetime
+
+
+class AllDayEventDateTime(EventDateTime):
+    """Start or end of an all-day event; only date is set."""
+    date: datetime.date
+
+
+def _event_time_kind(value: Any) -> str:
+    """Pick the EventTime variant from whichever key the payload carries."""
+    if isinstance(value, dict):
+        if value.get('dateTime') is not None:
+            return 'timed'
+        if value.get('date') is not None:
+            return 'all_day'
+    return 'other'
+
+
+# Tagged union used on API response models: pydantic dispatches on the present key
+# instead of trying every Optional field of EventDateTime
+EventTime = Annotated[
+    Union[
+        Annotated[TimedEventDateTime, Tag('timed')],
+        Annotated[AllDayEventDateTime, Tag('all_day')],
+        Annotated[EventDateTime, Tag('other')],
+    ],
+    Discriminator(_event_time_kind),
+]
 
 
 class EventAttendee(BaseModel):
     """Represents an attendee of an event."""
     id: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     displayName: Optional[str] = None
     organizer: Optional[bool] = None
     self: Optional[bool] = None
@@ -30,46 +66,41 @@ class EventAttendee(BaseModel):
     comment: Optional[str] = None
     additionalGuests: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class EventCreator(BaseModel):
     """Represents the creator of an event."""
     id: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     displayName: Optional[str] = None
     self: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class EventOrganizer(BaseModel):
     """Represents the organizer of an event."""
     id: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[str] = None
     displayName: Optional[str] = None
     self: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class EventReminderOverride(BaseModel):
     method: Optional[str] = None
     minutes: Optional[int] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class EventReminders(BaseModel):
     useDefault: bool = Field(..., alias="useDefault")
     overrides: Optional[List[EventReminderOverride]] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class GoogleCalendarEvent(BaseModel):
@@ -86,18 +117,17 @@ class GoogleCalendarEvent(BaseModel):
     colorId: Optional[str] = Field(None, description="Color of the event.")
     creator: Optional[EventCreator] = Field(None, description="The creator of the event.")
     organizer: Optional[EventOrganizer] = Field(None, description="The organizer of the event.")
-    start: Optional[EventDateTime] = Field(None, description="The start time of the event.")
-    end: Optional[EventDateTime] = Field(None, description="The end time of the event.")
+    start: Optional[EventTime] = Field(None, description="The start time of the event.")
+    end: Optional[EventTime] = Field(None, description="The end time of the event.")
     endTimeUnspecified: Optional[bool] = Field(None, description="Whether the end time is unspecified.")
     recurrence: Optional[List[str]] = Field(None, description="List of RRULE properties for recurring events.")
     recurringEventId: Optional[str] = Field(None, description="ID of the recurring event.")
-    originalStartTime: Optional[EventDateTime] = Field(None, description="Original start time for recurring event instances.")
-    attendees: Optional[List[EventAttendee]] = Field([], description="The attendees of the event.")
+    originalStartTime: Optional[EventTime] = Field(None, description="Original start time for recurring event instances.")
+    attendees: List[EventAttendee] = Field(default_factory=list, description="The attendees of the event.")
     attendeesOmitted: Optional[bool] = Field(None, description="Whether attendees were omitted.")
     reminders: Optional[EventReminders] = Field(None, description="Information about the event's reminders.")
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class EventCreateRequest(BaseModel):
@@ -111,6 +141,15 @@ class EventCreateRequest(BaseModel):
     recurrence: Optional[List[str]] = Field(None, description="List of RRULEs for recurring events.")
     reminders: Optional[EventReminders] = None
 
+    @field_validator("attendees")
+    @classmethod
+    def check_attendee_emails(cls, v: Optional[List[str]]) -> Optional[List[str]]:
+        """Cheap sanity check on attendee addresses; the API performs full validation."""
+        for email in v or ():
+            if "@" not in email:
+                raise ValueError(f"Invalid attendee email address: {email!r}")
+        return v
+
 
 class EventUpdateRequest(BaseModel):
     """Model for updating an existing event."""
@@ -142,8 +181,7 @@ class CalendarListEntry(BaseModel):
     primary: Optional[bool] = None
     deleted: Optional[bool] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class EventsResponse(BaseModel):
@@ -154,33 +192,146 @@ class EventsResponse(BaseModel):
     updated: Optional[datetime.datetime] = None
     timeZone: Optional[str] = None
     accessRole: Optional[str] = None
-    defaultReminders: Optional[List[EventReminderOverride]] = []
-    items: List[GoogleCalendarEvent] = []
+    defaultReminders: List[EventReminderOverride] = Field(default_factory=list)
+    items: List[GoogleCalendarEvent] = Field(default_factory=list)
     nextPageToken: Optional[str] = None
     nextSyncToken: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
 class CalendarListResponse(BaseModel):
     """Response containing a list of calendars."""
     kind: str = "calendar#calendarList"
-    items: List[CalendarListEntry] = []
+    items: List[CalendarListEntry] = Field(default_factory=list)
     nextPageToken: Optional[str] = None
     nextSyncToken: Optional[str] = None
 
-    class Config:
-        populate_by_name = True
+    model_config = _CFG
 
 
-class ProjectedEventOccurrence:
+@dataclass(slots=True, frozen=True)
+class BusyInterval:
+    """A busy period returned by the free/busy endpoint."""
+    start: datetime.datetime
+    end: datetime.datetime
+
+
+class FreeBusyResult(TypedDict):
+    """Free/busy information for one calendar."""
+    busy: List[BusyInterval]
+    errors: List[Dict[str, Any]]
+
+
+# Built once at import; validates a whole 'busy' list in a single pydantic-core call
+BUSY_LIST_ADAPTER = TypeAdapter(List[BusyInterval])
+
+
+class ProjectedEventOccurrence(NamedTuple):
     """Represents a projected occurrence of a recurring event."""
-    def __init__(self, original_event_id: str, original_summary: str, occurrence_start: datetime.datetime, occurrence_end: datetime.datetime):
-        self.original_event_id = original_event_id
-        self.original_summary = original_summary
-        self.occurrence_start = occurrence_start
-        self.occurrence_end = occurrence_end
+    original_event_id: str
+    original_summary: str
+    occurrence_start: datetime.datetime
+    occurrence_end: datetime.datetime
+
+    def __repr__(self):
+        return f"ProjectedOccurrence(id='{self.original_event_id}', summary='{self.original_summary}', start='{self.occurrence_start}', end='{self.occurrence_end}')"
+
+
+class ProjectedOccurrences:
+    """
+    Column-oriented collection of projected occurrences, sorted by start time.
+
+    Stores ids, summaries, starts and ends as parallel lists. Range queries bisect
+    the start column on both sides, using the longest occurrence duration as the
+    lower bound, so they only scan occurrences that start close to the interval.
+    Indexing and iteration yield ProjectedEventOccurrence tuples; slicing yields a
+    ProjectedOccurrences.
+    """
+    __slots__ = ('ids', 'summaries', 'starts', 'ends', 'max_duration')
+
+    def __init__(self, occurrences: Iterable[ProjectedEventOccurrence] = ()):
+        columns = tuple(zip(*occurrences))
+        if columns:
+            self.ids, self.summaries, self.starts, self.ends = map(list, columns)
+        else:
+            self.ids, self.summaries, self.starts, self.ends = [], [], [], []
+        self.max_duration = max(
+            (end - start for start, end in zip(self.starts, self.ends)),
+            default=datetime.timedelta(0),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, i: int) -> ProjectedEventOccurrence: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> "ProjectedOccurrences": ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return ProjectedOccurrences(map(
+                ProjectedEventOccurrence, self.ids[i], self.summaries[i], self.starts[i], self.ends[i]
+            ))
+        return ProjectedEventOccurrence(self.ids[i], self.summaries[i], self.starts[i], self.ends[i])
+
+    def __iter__(self) -> Iterator[ProjectedEventOccurrence]:
+        return map(ProjectedEventOccurrence, self.ids, self.summaries, self.starts, self.ends)
+
+    def overlapping(self, start: datetime.datetime, end: datetime.datetime) -> List[ProjectedEventOccurrence]:
+        """Return the occurrences that overlap the interval [start, end)."""
+        # Nothing starting before start - max_duration can still be running at start
+        lo = bisect.bisect_left(self.starts, start - self.max_duration)
+        hi = bisect.bisect_left(self.starts, end)
+        ends = self.ends
+        return [self[i] for i in range(lo, hi) if ends[i] > start]
+
+    def __repr__(self):
+        return f"ProjectedOccurrences(count={len(self)})"
+
+
+class EventView:
+    """Lightweight read-only view of a raw event dict, used by the analysis functions."""
+    __slots__ = ('id', 'summary', 'recurrence', 'start_dt', 'start_date', 'end_dt', 'end_date')
+
+    def __init__(
+        self,
+        id: Optional[str],
+        summary: Optional[str],
+        recurrence: Optional[List[str]],
+        start_dt: Optional[datetime.datetime],
+        start_date: Optional[datetime.date],
+        end_dt: Optional[datetime.datetime],
+        end_date: Optional[datetime.date],
+    ):
+        self.id = id
+        self.summary = summary
+        self.recurrence = recurrence
+        self.start_dt = start_dt
+        self.start_date = start_date
+        self.end_dt = end_dt
+        self.end_date = end_date
+
+    @classmethod
+    def from_api(cls, d: Dict[str, Any]) -> "EventView":
+        """Build a view from an event resource as returned by the API. Raises ValueError on bad timestamps."""
+        start = d.get('start') or {}
+        end = d.get('end') or {}
+        start_dt = start.get('dateTime')
+        start_date = start.get('date')
+        end_dt = end.get('dateTime')
+        end_date = end.get('date')
+        return cls(
+            d.get('id'),
+            d.get('summary'),
+            d.get('recurrence'),
+            datetime.datetime.fromisoformat(start_dt) if start_dt else None,
+            datetime.date.fromisoformat(start_date) if start_date else None,
+            datetime.datetime.fromisoformat(end_dt) if end_dt else None,
+            datetime.date.fromisoformat(end_date) if end_date else None,
+        )
 
     def __repr__(self):
-        return f"ProjectedOccurrence(id='{self.original_event_id}', summary='{self.original_summary}', start='{self.occurrence_start}', end='{self.occurrence_end}')"
\ No newline at end of file
+        return f"EventView(id='{self.id}', summary='{self.summary}', start='{self.start_dt or self.start_date}')"
@@ -2,99 +2,157 @@
 Configuration settings for the MCP Gmail, Calendar, and Google Chat server.
 """
 
+import functools
 import json
 import os
-from typing import List, Optional
-
-from pydantic_settings import BaseSettings, SettingsConfigDict
-
-# Import default settings from gmail, calendar, and google_chat modules
-from mcp_google.gmail import (
-    DEFAULT_CREDENTIALS_PATH as GMAIL_DEFAULT_CREDENTIALS_PATH,
-    DEFAULT_TOKEN_PATH as GMAIL_DEFAULT_TOKEN_PATH,
-    DEFAULT_USER_ID,
+from dataclasses import MISSING, dataclass, field, fields
+from typing import Any, Dict, List, Mapping, Optional
+
+# Default settings live in a dependency-free module so loading the configuration
+# does not import the Google API client libraries
+from mcp_google._defaults import (
+    GMAIL_DEFAULT_CREDENTIALS_PATH,
+    GMAIL_DEFAULT_TOKEN_PATH,
+    GMAIL_DEFAULT_USER_ID as DEFAULT_USER_ID,
     GMAIL_SCOPES,
-)
-
-from mcp_google.calendar import (
-    DEFAULT_CREDENTIALS_PATH as CALENDAR_DEFAULT_CREDENTIALS_PATH,
-    DEFAULT_TOKEN_PATH as CALENDAR_DEFAULT_TOKEN_PATH,
+    CALENDAR_DEFAULT_CREDENTIALS_PATH,
+    CALENDAR_DEFAULT_TOKEN_PATH,
     CALENDAR_SCOPES,
-)
-
-from mcp_google.google_chat import (
-    DEFAULT_CREDENTIALS_PATH as GOOGLE_CHAT_DEFAULT_CREDENTIALS_PATH,
-    DEFAULT_TOKEN_PATH as GOOGLE_CHAT_DEFAULT_TOKEN_PATH,
+    GOOGLE_CHAT_DEFAULT_CREDENTIALS_PATH,
+    GOOGLE_CHAT_DEFAULT_TOKEN_PATH,
+    GOOGLE_CHAT_DEFAULT_USER_CACHE_PATH,
     GOOGLE_CHAT_SCOPES,
 )
 
+# Environment variables are matched case-insensitively as MCP_<FIELD_NAME>
+ENV_PREFIX = "MCP_"
+ENV_FILE = ".env"
+
+
+def _read_env_file(path: str) -> Dict[str, str]:
+    """
+    Parse KEY=VALUE lines from a dotenv file.
+
+    Args:
+        path: Path to the dotenv file
 
-class Settings(BaseSettings):
+    Returns:
+        The variables defined in the file, or an empty dict if it doesn't exist
     """
-    Settings model for MCP Gmail, Calendar, and Google Chat server configuration.
+    values: Dict[str, str] = {}
+    if not os.path.exists(path):
+        return values
+
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith("#") or "=" not in line:
+                continue
+            key, _, value = line.partition("=")
+            key = key.strip()
+            if key.startswith("export "):
+                key = key[len("export "):].strip()
+            values[key] = value.strip().strip("'\"")
+
+    return values
+
+
+def _coerce(raw: Any, default: Any) -> Any:
+    """Convert a raw environment value to the type of the field's default."""
+    if not isinstance(raw, str):
+        return raw
+    if isinstance(default, int):
+        return int(raw)
+    if isinstance(default, list):
+        return json.loads(raw)
+    return raw
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Settings for MCP Gmail, Calendar, and Google Chat server configuration.
 
-    Automatically reads from environment variables with MCP_GMAIL_, MCP_CALENDAR_, or MCP_CHAT_ prefix.
+    Use Settings.from_env() to read environment variables (and the .env file) with the MCP_ prefix,
+    e.g. MCP_GMAIL_TOKEN_PATH or MCP_CALENDAR_MAX_RESULTS.
     """
 
     # Gmail settings
     gmail_credentials_path: str = GMAIL_DEFAULT_CREDENTIALS_PATH
     gmail_token_path: str = GMAIL_DEFAULT_TOKEN_PATH
-    gmail_scopes: List[str] = GMAIL_SCOPES
+    gmail_scopes: List[str] = field(default_factory=lambda: list(GMAIL_SCOPES))
     gmail_user_id: str = DEFAULT_USER_ID
     gmail_max_results: int = 10
 
     # Calendar settings
     calendar_credentials_path: str = CALENDAR_DEFAULT_CREDENTIALS_PATH
     calendar_token_path: str = CALENDAR_DEFAULT_TOKEN_PATH
-    calendar_scopes: List[str] = CALENDAR_SCOPES
+    calendar_scopes: List[str] = field(default_factory=lambda: list(CALENDAR_SCOPES))
     calendar_max_results: int = 50
 
     # Google Chat settings
     google_chat_credentials_path: str = GOOGLE_CHAT_DEFAULT_CREDENTIALS_PATH
     google_chat_token_path: str = GOOGLE_CHAT_DEFAULT_TOKEN_PATH
-    google_chat_scopes: List[str] = GOOGLE_CHAT_SCOPES
+    google_chat_user_cache_path: Optional[str] = GOOGLE_CHAT_DEFAULT_USER_CACHE_PATH
+    google_chat_scopes: List[str] = field(default_factory=lambda: list(GOOGLE_CHAT_SCOPES))
     google_chat_max_results: int = 100
 
-    # Configure environment variable settings
-    model_config = SettingsConfigDict(
-        env_prefix="MCP_",
-        env_file=".env",
-        env_file_encoding="utf-8",
-        extra="ignore",
-        case_sensitive=False,
-    )
-
-    # Backward compatibility properties for existing Gmail code
-    @property
-    def credentials_path(self) -> str:
-        """Backward compatibility for Gmail credentials path."""
-        return self.gmail_credentials_path
-
-    @property
-    def token_path(self) -> str:
-        """Backward compatibility for Gmail token path."""
-        return self.gmail_token_path
-
-    @property
-    def scopes(self) -> List[str]:
-        """Backward compatibility for Gmail scopes."""
-        return self.gmail_scopes
-
-    @property
-    def user_id(self) -> str:
-        """Backward compatibility for Gmail user ID."""
-        return self.gmail_user_id
-
-    @property
-    def max_results(self) -> int:
-        """Backward compatibility for Gmail max results."""
-        return self.gmail_max_results
-
-
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None, **overrides: Any) -> "Settings":
+        """
+        Build settings from environment variables.
+
+        Args:
+            env: Variables to read; defaults to the .env file overlaid with os.environ
+            **overrides: Explicit values that take precedence over the environment
+
+        Returns:
+            Settings instance
+        """
+        if env is None:
+            env = {**_read_env_file(ENV_FILE), **os.environ}
+
+        prefixed = {
+            key[len(ENV_PREFIX):].lower(): value
+            for key, value in env.items()
+            if key.upper().startswith(ENV_PREFIX)
+        }
+
+        values: Dict[str, Any] = {}
+        for f in fields(cls):
+            raw = overrides.get(f.name, prefixed.get(f.name))
+            if raw is None:
+                continue
+            default = f.default if f.default is not MISSING else f.default_factory()
+            values[f.name] = _coerce(raw, default)
+
+        return cls(**values)
+
+    def __getattr__(self, name: str) -> Any:
+        """Backward compatibility aliases for existing Gmail code (e.g. credentials_path)."""
+        key = _GMAIL_ALIASES.get(name)
+        if key is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(self, key)
+
+
+# Unprefixed names kept for backward compatibility, mapped to their Gmail settings
+_GMAIL_ALIASES = {
+    "credentials_path": "gmail_credentials_path",
+    "token_path": "gmail_token_path",
+    "scopes": "gmail_scopes",
+    "user_id": "gmail_user_id",
+    "max_results": "gmail_max_results",
+}
+
+
+@functools.lru_cache(maxsize=None)
 def get_settings(config_file: Optional[str] = None) -> Settings:
     """
     Get settings instance, optionally loaded from a config file.
 
+    Instances are cached per config file, so repeated calls are cheap.
+
     Args:
         config_file: Path to a JSON configuration file (optional)
 
@@ -102,18 +160,21 @@ def get_settings(config_file: Optional[str] = None) -> Settings:
         Settings instance
     """
     if config_file is None:
-        return Settings()
+        return Settings.from_env()
 
     # Override with config file if provided
     if config_file and os.path.exists(config_file):
         with open(config_file, "r") as f:
             file_config = json.load(f)
-            settings = Settings.model_validate(file_config)
+            settings = Settings.from_env(**file_config)
     else:
-        settings = Settings()
+        settings = Settings.from_env()
 
     return settings
 
 
-# Create a default settings instance
-settings = get_settings()
\ No newline at end of file
+def __getattr__(name: str) -> Settings:
+    """Create the default settings instance on first access instead of at import time."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,25 +7,22 @@ import json
 import os
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import Resource, build
 
+from mcp_google.transport import PooledHttp
+
 # Default settings
-DEFAULT_CREDENTIALS_PATH = "credentials.json"
-DEFAULT_TOKEN_PATH = "token.json"
-DEFAULT_USER_ID = "me"
-
-# Gmail API scopes
-GMAIL_SCOPES = [
-    "https://www.googleapis.com/auth/gmail.readonly",
-    "https://www.googleapis.com/auth/gmail.send",
-    "https://www.googleapis.com/auth/gmail.compose",
-    "https://www.googleapis.com/auth/gmail.labels",
-]
+from mcp_google._defaults import (
+    GMAIL_DEFAULT_CREDENTIALS_PATH as DEFAULT_CREDENTIALS_PATH,
+    GMAIL_DEFAULT_TOKEN_PATH as DEFAULT_TOKEN_PATH,
+    GMAIL_DEFAULT_USER_ID as DEFAULT_USER_ID,
+    GMAIL_SCOPES,
+)
 
 # For simpler testing
 GMAIL_MODIFY_SCOPE = ["https://www.googleapis.com/auth/gmail.modify"]
@@ -33,11 +30,16 @@ GMAIL_MODIFY_SCOPE = ["https://www.googleapis.com/auth/gmail.modify"]
 # Type alias for the Gmail service
 GmailService = Resource
 
+# The batch endpoint accepts up to 100 sub-requests, but Gmail rate limits batches
+# of more than 50 requests
+BATCH_MAX_REQUESTS = 50
+
 
 def get_gmail_service(
     credentials_path: str = DEFAULT_CREDENTIALS_PATH,
     token_path: str = DEFAULT_TOKEN_PATH,
     scopes: List[str] = GMAIL_SCOPES,
+    credentials: Optional[Credentials] = None,
 ) -> GmailService:
     """
     Authenticate with Gmail API and return the service object.
@@ -46,14 +48,16 @@ def get_gmail_service(
         credentials_path: Path to the credentials JSON file
         token_path: Path to save/load the token
         scopes: OAuth scopes to request
+        credentials: Already loaded credentials to use instead of the token file
+            (optional)
 
     Returns:
         Authenticated Gmail API service
     """
-    creds = None
+    creds = credentials
 
     # Look for token file with stored credentials
-    if os.path.exists(token_path):
+    if creds is None and os.path.exists(token_path):
         with open(token_path, "r") as token:
             token_data = json.load(token)
             creds = Credentials.from_authorized_user_info(token_data)
@@ -73,13 +77,13 @@ def get_gmail_service(
             flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
             creds = flow.run_local_server(port=0)
 
-        # Save credentials for future runs
-        token_json = json.loads(creds.to_json())
+        # Save credentials for future runs (to_json already returns serialized JSON)
         with open(token_path, "w") as token:
-            json.dump(token_json, token)
+            token.write(creds.to_json())
 
-    # Build the Gmail service
-    return build("gmail", "v1", credentials=creds)
+    # Build the Gmail service from the bundled discovery document, on the shared
+    # keep-alive connection pool
+    return build("gmail", "v1", http=PooledHttp(creds), cache_discovery=False, static_discovery=True)
 
 
 def create_message(
@@ -169,36 +173,53 @@ def create_multipart_message(
     return {"raw": encoded_message}
 
 
-def parse_message_body(message: Dict[str, Any]) -> str:
+def parse_message_body(message: Dict[str, Any], max_chars: Optional[int] = None) -> str:
     """
     Parse the body of a Gmail message.
 
     Args:
         message: The Gmail message object
+        max_chars: Stop after this many characters; parts beyond them are never decoded
 
     Returns:
         The extracted message body text
     """
 
-    # Helper function to find text/plain parts
-    def get_text_part(parts):
-        text = ""
+    def decode(data: str, limit: Optional[int]) -> str:
+        if limit is None:
+            return base64.urlsafe_b64decode(data).decode()
+        # A character takes at most 4 UTF-8 bytes and every 4 base64 characters
+        # hold 3 bytes, so this prefix always covers `limit` characters
+        prefix = data[:(limit * 4 + 2) // 3 * 4 + 4]
+        prefix += "=" * (-len(prefix) % 4)
+        return base64.urlsafe_b64decode(prefix).decode(errors="ignore")[:limit]
+
+    # Walk the MIME tree depth-first, yielding the text/plain parts in order
+    def iter_text_parts(parts):
         for part in parts:
             if part["mimeType"] == "text/plain":
                 if "data" in part["body"]:
-                    text += base64.urlsafe_b64decode(part["body"]["data"]).decode()
+                    yield part["body"]["data"]
             elif "parts" in part:
-                text += get_text_part(part["parts"])
-        return text
+                yield from iter_text_parts(part["parts"])
 
     # Check if the message is multipart
     if "parts" in message["payload"]:
-        return get_text_part(message["payload"]["parts"])
+        texts = []
+        remaining = max_chars
+        for data in iter_text_parts(message["payload"]["parts"]):
+            if remaining is not None and remaining <= 0:
+                break
+            text = decode(data, remaining)
+            texts.append(text)
+            if remaining is not None:
+                remaining -= len(text)
+        return "".join(texts)
     else:
         # Handle single part messages
         if "data" in message["payload"]["body"]:
             data = message["payload"]["body"]["data"]
-            return base64.urlsafe_b64decode(data).decode()
+            return decode(data, max_chars)
         return ""
 
 
@@ -390,6 +411,50 @@ def get_message(service: GmailService, message_id: str, user_id: str = DEFAULT_U
     return message
 
 
+def get_messages(
+    service: GmailService,
+    message_ids: List[str],
+    user_id: str = DEFAULT_USER_ID,
+    format: str = "full",
+    metadata_headers: Optional[List[str]] = None,
+) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Get several messages by ID using batch HTTP requests instead of one request per message.
+
+    Args:
+        service: Gmail API service instance
+        message_ids: Gmail message IDs
+        user_id: Gmail user ID (default: 'me')
+        format: Message format: 'full', 'metadata', 'minimal' or 'raw'
+        metadata_headers: Headers to include when format is 'metadata' (default: all)
+
+    Returns:
+        A list of (message, exception) tuples in the order of message_ids; exactly one
+        of the two is set for each ID
+    """
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(message_ids)
+
+    def callback(request_id: str, response: Optional[Dict[str, Any]], exception: Optional[Exception]) -> None:
+        results[int(request_id)] = (response, exception)
+
+    get_kwargs: Dict[str, Any] = {"userId": user_id, "format": format}
+    if metadata_headers:
+        get_kwargs["metadataHeaders"] = metadata_headers
+
+    for chunk_start in range(0, len(message_ids), BATCH_MAX_REQUESTS):
+        chunk = message_ids[chunk_start:chunk_start + BATCH_MAX_REQUESTS]
+        batch = service.new_batch_http_request(callback=callback)
+        for index, message_id in enumerate(chunk, chunk_start):
+            batch.add(service.users().messages().get(id=message_id, **get_kwargs), request_id=str(index))
+        try:
+            batch.execute()
+        except Exception as e:
+            for index in range(chunk_start, chunk_start + len(chunk)):
+                results[index] = (None, e)
+
+    return results
+
+
 def get_thread(service: GmailService, thread_id: str, user_id: str = DEFAULT_USER_ID) -> Dict[str, Any]:
     """
     Get a specific thread by ID.
@@ -3,38 +3,106 @@ This module provides utilities for authenticating with and using the Google Chat
 Includes space management and message operations with enhanced user detail fetching.
 """
 
-import json
+import functools
+import itertools
 import logging
 import os
-from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Tuple
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
+from pydantic_core import from_json, to_json
+
+from mcp_google.transport import PooledHttp
 
 # Default settings
-DEFAULT_CREDENTIALS_PATH = "credentials.json"
-DEFAULT_TOKEN_PATH = "google_chat_token.json"
-DEFAULT_USER_ID = "me"
-
-# Google Chat API scopes
-GOOGLE_CHAT_SCOPES = [
-    "https://www.googleapis.com/auth/chat.spaces.readonly",
-    "https://www.googleapis.com/auth/chat.messages",
-    "https://www.googleapis.com/auth/chat.messages.readonly",
-    "https://www.googleapis.com/auth/chat.spaces",
-    "https://www.googleapis.com/auth/chat.memberships.readonly",
-    "https://www.googleapis.com/auth/userinfo.profile",  # Added for user details
-    "https://www.googleapis.com/auth/userinfo.email",   # Added for user details
-    "openid",  # Add this line to prevent scope mismatch error
-]
+from mcp_google._defaults import (
+    GOOGLE_CHAT_DEFAULT_CREDENTIALS_PATH as DEFAULT_CREDENTIALS_PATH,
+    GOOGLE_CHAT_DEFAULT_TOKEN_PATH as DEFAULT_TOKEN_PATH,
+    GOOGLE_CHAT_DEFAULT_USER_ID as DEFAULT_USER_ID,
+    GOOGLE_CHAT_SCOPES,
+)
 
 # Type alias for the Google Chat service
 GoogleChatService = Resource
 
+# Refresh access tokens this long before they actually expire
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+
+# Headless authentication: when all three variables are set, credentials are built
+# from the refresh token and no browser flow or token file is involved
+REFRESH_TOKEN_ENV = "GOOGLE_CHAT_REFRESH_TOKEN"
+CLIENT_ID_ENV = "GOOGLE_CHAT_CLIENT_ID"
+CLIENT_SECRET_ENV = "GOOGLE_CHAT_CLIENT_SECRET"
+TOKEN_URI = "https://oauth2.googleapis.com/token"
+
+# The refresh token obtained by the browser flow is also kept next to the token file
+# (with this suffix, readable by the owner only) so the flow never has to run again
+REFRESH_TOKEN_SUFFIX = ".refresh"
+
+# Built services and their credentials, keyed by (credentials_path, token_path, scopes)
+_SERVICE_CACHE: Dict[Tuple[str, str, Tuple[str, ...]], Tuple[GoogleChatService, Credentials]] = {}
+_SERVICE_LOCK = threading.Lock()
+
+# Maximum number of sub-requests the API accepts in one batch
+BATCH_MAX_REQUESTS = 100
+
+# Largest page size the members.list endpoint accepts
+MAX_MEMBER_PAGE_SIZE = 1000
+# Membership pages read to seed the display name cache before looking up senders
+MEMBER_PREFETCH_MAX_PAGES = 2
+
+# Worker limit for concurrent fetches; must stay within transport.SHARED_POOL_SIZE
+MAX_CONCURRENT_REQUESTS = 10
+
+# Display names are cached in memory and in a small SQLite database so repeated
+# listings don't look up the same users again. By default the database file sits
+# next to the token file.
+USER_CACHE_FILENAME = "google_chat_user_cache.sqlite3"
+USER_CACHE_TTL_SECONDS = 3600.0
+USER_CACHE_MAX_ENTRIES = 10000
+
+# user name -> (display name, fetched_at)
+_user_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+_user_cache_lock = threading.Lock()
+# user name -> time of the last failed lookup; these users aren't looked up again
+# until USER_LOOKUP_RETRY_SECONDS have passed
+USER_LOOKUP_RETRY_SECONDS = 600.0
+# Resource name prefix of Chat users, e.g. 'users/12345'
+USER_NAME_PREFIX = "users/"
+# User IDs longer than this are abbreviated by short_user_label
+USER_ID_ABBREV_LENGTH = 10
+_failed_user_lookups: "OrderedDict[str, float]" = OrderedDict()
+_user_cache_db: Optional[sqlite3.Connection] = None
+_user_cache_path = USER_CACHE_FILENAME
+
+# Default partial response masks: only the fields the tools display are requested.
+# Pass fields=None to any function taking a mask to get the full resources.
+SPACE_LIST_FIELDS = "spaces(name,displayName,type,spaceType),nextPageToken"
+SPACE_FIELDS = (
+    "name,displayName,type,spaceType,createTime,membershipCount,"
+    "singleUserBotDm,threaded,externalUserAllowed"
+)
+MESSAGE_FIELDS = "name,text,createTime,sender(name,displayName,type),thread"
+MESSAGE_LIST_FIELDS = f"messages({MESSAGE_FIELDS}),nextPageToken"
+MESSAGE_LIST_DETAILED_FIELDS = (
+    "messages(name,text,createTime,sender(name,displayName,type,email,domainId),thread),nextPageToken"
+)
+SENT_MESSAGE_FIELDS = "name,createTime"
+MEMBER_LIST_FIELDS = "memberships(name,member(name,displayName,type),role),nextPageToken"
+MEMBER_LIST_DETAILED_FIELDS = (
+    "memberships(name,member(name,displayName,type,email,domainId),createTime,role),nextPageToken"
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,56 +110,290 @@ def get_google_chat_service(
     credentials_path: str = DEFAULT_CREDENTIALS_PATH,
     token_path: str = DEFAULT_TOKEN_PATH,
     scopes: List[str] = GOOGLE_CHAT_SCOPES,
+    refresh_token_path: Optional[str] = None,
+    credentials: Optional[Credentials] = None,
+    user_cache_path: Optional[str] = None,
 ) -> GoogleChatService:
     """
     Authenticate with Google Chat API and return the service object.
 
+    The service is built once per (credentials_path, token_path, scopes) combination
+    and reused on subsequent calls; its credentials are refreshed in place when they
+    are about to expire.
+
+    Credentials are taken, in order, from the GOOGLE_CHAT_REFRESH_TOKEN,
+    GOOGLE_CHAT_CLIENT_ID and GOOGLE_CHAT_CLIENT_SECRET environment variables, the
+    token file, or the saved refresh token; the browser flow only runs if none of
+    them is available.
+
     Args:
         credentials_path: Path to the credentials JSON file
         token_path: Path to save/load the token
         scopes: OAuth scopes to request
+        refresh_token_path: Path of the saved refresh token; defaults to the token
+            path with a '.refresh' suffix
+        credentials: Already loaded credentials to build the service on instead
+            (optional); none of the sources above are consulted in that case
+        user_cache_path: Path of the display name cache database; defaults to
+            USER_CACHE_FILENAME in the token file's directory
 
     Returns:
         Authenticated Google Chat API service
     """
-    creds = None
-
-    # Look for token file with stored credentials
-    if os.path.exists(token_path):
-        with open(token_path, "r") as token:
-            token_data = json.load(token)
-            creds = Credentials.from_authorized_user_info(token_data)
-
-    # If credentials don't exist or are invalid, authenticate
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            # Check if credentials file exists
-            if not os.path.exists(credentials_path):
-                raise FileNotFoundError(
-                    f"Credentials file not found at {credentials_path}. "
-                    "Please download your OAuth credentials from Google Cloud Console."
-                )
+    if user_cache_path is None:
+        user_cache_path = os.path.join(os.path.dirname(token_path), USER_CACHE_FILENAME)
+    set_user_cache_path(user_cache_path)
+
+    if credentials is not None:
+        return _build_chat_service(credentials)
+
+    key = (credentials_path, token_path, tuple(sorted(scopes)))
+    if refresh_token_path is None:
+        refresh_token_path = token_path + REFRESH_TOKEN_SUFFIX
+
+    with _SERVICE_LOCK:
+        cached = _SERVICE_CACHE.get(key)
+        creds = cached[1] if cached else None
+        if cached and not _needs_refresh(creds):
+            return cached[0]
+
+        # Environment credentials are never written to disk
+        env_creds = _credentials_from_env(scopes)
+        if creds is None:
+            creds = env_creds
+
+        # Look for token file with stored credentials
+        if creds is None and os.path.exists(token_path):
+            with open(token_path, "rb") as token:
+                token_data = from_json(token.read())
+                creds = Credentials.from_authorized_user_info(token_data)
+
+        # Fall back to the refresh token saved by an earlier browser flow
+        if creds is None:
+            creds = _credentials_from_refresh_token_file(refresh_token_path, credentials_path, scopes)
+
+        # If credentials don't exist or are about to expire, authenticate; the token
+        # file is only rewritten when the token actually changed
+        if not creds or _needs_refresh(creds):
+            if creds and creds.refresh_token:
+                creds.refresh(Request())
+            else:
+                # Check if credentials file exists
+                if not os.path.exists(credentials_path):
+                    raise FileNotFoundError(
+                        f"Credentials file not found at {credentials_path}. "
+                        "Please download your OAuth credentials from Google Cloud Console."
+                    )
+
+                flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
+                creds = flow.run_local_server(port=0)
+                if creds.refresh_token:
+                    _save_refresh_token(creds.refresh_token, refresh_token_path)
+
+            # Save credentials for future runs (to_json already returns serialized JSON)
+            if env_creds is None:
+                with open(token_path, "w") as token:
+                    token.write(creds.to_json())
+
+        # A refreshed token is picked up by the cached service, which shares the credentials
+        if cached and cached[1] is creds:
+            return cached[0]
+
+        service = _build_chat_service(creds)
+        _SERVICE_CACHE[key] = (service, creds)
+        return service
+
+
+def _build_chat_service(creds: Credentials) -> GoogleChatService:
+    """Build a Chat service on a thread-safe, pooled keep-alive transport."""
+    # Build the Google Chat service from the bundled discovery document, on a pooled
+    # keep-alive transport that concurrent callers can share
+    return build(
+        "chat",
+        "v1",
+        http=PooledHttp(creds),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+def _credentials_from_env(scopes: List[str]) -> Optional[Credentials]:
+    """Build refreshable credentials from the environment, or return None if it isn't configured."""
+    refresh_token = os.environ.get(REFRESH_TOKEN_ENV)
+    client_id = os.environ.get(CLIENT_ID_ENV)
+    client_secret = os.environ.get(CLIENT_SECRET_ENV)
+    if not (refresh_token and client_id and client_secret):
+        return None
+
+    return Credentials(
+        None,
+        refresh_token=refresh_token,
+        token_uri=TOKEN_URI,
+        client_id=client_id,
+        client_secret=client_secret,
+        scopes=scopes,
+    )
+
+
+def _credentials_from_refresh_token_file(
+    refresh_token_path: str,
+    credentials_path: str,
+    scopes: List[str]
+) -> Optional[Credentials]:
+    """
+    Build refreshable credentials from a saved refresh token and the OAuth client file.
+
+    Args:
+        refresh_token_path: Path of the saved refresh token
+        credentials_path: Path to the credentials JSON file holding the client ID and secret
+        scopes: OAuth scopes to request
+
+    Returns:
+        Credentials without an access token, or None if either file is missing or unreadable
+    """
+    if not (os.path.exists(refresh_token_path) and os.path.exists(credentials_path)):
+        return None
 
-            flow = InstalledAppFlow.from_client_secrets_file(credentials_path, scopes)
-            creds = flow.run_local_server(port=0)
+    try:
+        with open(refresh_token_path, "r") as f:
+            refresh_token = f.read().strip()
+        with open(credentials_path, "rb") as f:
+            client_config = from_json(f.read())
+        # Client secrets files nest the values under "installed" or "web"
+        client = client_config.get("installed") or client_config.get("web") or {}
+
+        if not (refresh_token and client.get("client_id") and client.get("client_secret")):
+            return None
+
+        return Credentials(
+            None,
+            refresh_token=refresh_token,
+            token_uri=client.get("token_uri", TOKEN_URI),
+            client_id=client["client_id"],
+            client_secret=client["client_secret"],
+            scopes=scopes,
+        )
+    except (OSError, ValueError) as e:
+        logger.warning("Could not load saved refresh token from %s: %s", refresh_token_path, e)
+        return None
 
-        # Save credentials for future runs
-        token_json = json.loads(creds.to_json())
-        with open(token_path, "w") as token:
-            json.dump(token_json, token)
 
-    # Build the Google Chat service
-    return build("chat", "v1", credentials=creds)
+def _save_refresh_token(refresh_token: str, refresh_token_path: str) -> None:
+    """Write the refresh token to a file only its owner can read."""
+    try:
+        fd = os.open(refresh_token_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(refresh_token)
+        # O_CREAT's mode doesn't apply to an existing file
+        os.chmod(refresh_token_path, 0o600)
+    except OSError as e:
+        logger.warning("Could not save refresh token to %s: %s", refresh_token_path, e)
+
+
+def _needs_refresh(creds: Credentials) -> bool:
+    """Check whether credentials are invalid or expire within TOKEN_REFRESH_MARGIN."""
+    if not creds.valid:
+        return True
+    if creds.expiry is None:
+        return False
+    # google-auth stores expiry as a naive UTC datetime
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    return creds.expiry - TOKEN_REFRESH_MARGIN <= now
+
+
+def _iter_pages(
+    fetch_page: Callable[[Optional[str]], Dict[str, Any]],
+    items_key: str,
+    max_pages: Optional[int] = None,
+    prefetch: bool = False
+) -> Iterator[Dict[str, Any]]:
+    """
+    Walk a paginated list endpoint, yielding its items page by page.
+
+    Args:
+        fetch_page: Executes the list request for a page token (None for the first page)
+        items_key: Key of the item list in each response, e.g. 'messages'
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        prefetch: Fetch the next page in a background thread while the caller consumes
+            the current one. The service's PooledHttp client is thread-safe, so the caller
+            may keep using the service meanwhile.
+
+    Yields:
+        The items of each page, in order
+    """
+    def more_pages(response: Dict[str, Any], pages: int) -> Optional[str]:
+        if max_pages is not None and pages >= max_pages:
+            return None
+        return response.get("nextPageToken")
+
+    if not prefetch:
+        page_token: Optional[str] = None
+        pages = 0
+        while True:
+            response = fetch_page(page_token)
+            pages += 1
+            yield from response.get(items_key, [])
+            page_token = more_pages(response, pages)
+            if not page_token:
+                return
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(fetch_page, None)
+        pages = 1
+        while pending is not None:
+            response = pending.result()
+            page_token = more_pages(response, pages)
+            # Request the next page before handing out this one
+            pending = executor.submit(fetch_page, page_token) if page_token else None
+            pages += 1
+            yield from response.get(items_key, [])
 
 
 # === GOOGLE CHAT SPACE FUNCTIONS ===
 
+def iter_chat_spaces(
+    service: GoogleChatService,
+    page_size: int = 100,
+    filter_str: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    fields: Optional[str] = SPACE_LIST_FIELDS
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterates over the Google Chat spaces the authenticated user has access to,
+    fetching further pages as the caller consumes them.
+
+    Args:
+        service: Google Chat API service instance
+        page_size: Maximum number of spaces to return per page
+        filter_str: Optional filter string for spaces
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        fields: Partial response mask, or None for full spaces; must include nextPageToken
+
+    Yields:
+        Space objects
+
+    Raises:
+        HttpError: If a page request fails
+    """
+    request_params = {"pageSize": page_size}
+    if filter_str:
+        request_params["filter"] = filter_str
+    if fields:
+        request_params["fields"] = fields
+
+    def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
+        params = dict(request_params, pageToken=page_token) if page_token else request_params
+        return service.spaces().list(**params).execute()
+
+    yield from _iter_pages(fetch_page, "spaces", max_pages)
+
+
 def list_chat_spaces(
     service: GoogleChatService,
     page_size: int = 100,
-    filter_str: Optional[str] = None
+    filter_str: Optional[str] = None,
+    max_pages: Optional[int] = 1,
+    fields: Optional[str] = SPACE_LIST_FIELDS
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Lists all Google Chat spaces the authenticated user has access to.
@@ -100,34 +402,78 @@ def list_chat_spaces(
         service: Google Chat API service instance
         page_size: Maximum number of spaces to return per page
         filter_str: Optional filter string for spaces
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        fields: Partial response mask, or None for full spaces
 
     Returns:
         List of space objects, or None if an error occurs
     """
-    logger.info(f"Fetching chat spaces. Page size: {page_size}")
+    logger.info("Fetching chat spaces. Page size: %s", page_size)
+
+    try:
+        spaces = list(iter_chat_spaces(service, page_size, filter_str, max_pages, fields))
+
+        logger.info("Found %d chat spaces.", len(spaces))
+        return spaces
+
+    except HttpError as error:
+        logger.error("An API error occurred while fetching chat spaces: %s", error, exc_info=True)
+        return None
+    except Exception as e:
+        logger.error("An unexpected error occurred while fetching chat spaces: %s", e, exc_info=True)
+        return None
+
+
+def list_chat_spaces_page(
+    service: GoogleChatService,
+    page_size: int = 100,
+    page_token: Optional[str] = None,
+    filter_str: Optional[str] = None,
+    fields: Optional[str] = SPACE_LIST_FIELDS
+) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """
+    Fetches a single page of the Google Chat spaces the authenticated user has access to.
+
+    Args:
+        service: Google Chat API service instance
+        page_size: Maximum number of spaces to return
+        page_token: Token of the page to fetch, as returned for the previous page
+        filter_str: Optional filter string for spaces
+        fields: Partial response mask, or None for full spaces; must include nextPageToken
+
+    Returns:
+        A (spaces, next_page_token) tuple, where next_page_token is None on the last
+        page, or None if an error occurs
+    """
+    logger.info("Fetching a page of chat spaces. Page size: %s", page_size)
 
     try:
         request_params = {"pageSize": page_size}
+        if page_token:
+            request_params["pageToken"] = page_token
         if filter_str:
             request_params["filter"] = filter_str
+        if fields:
+            request_params["fields"] = fields
 
-        spaces_result = service.spaces().list(**request_params).execute()
-        spaces = spaces_result.get("spaces", [])
+        response = service.spaces().list(**request_params).execute()
+        spaces = response.get("spaces", [])
 
-        logger.info(f"Found {len(spaces)} chat spaces.")
-        return spaces
+        logger.info("Found %d chat spaces.", len(spaces))
+        return spaces, response.get("nextPageToken")
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching chat spaces: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching chat spaces: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching chat spaces: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching chat spaces: %s", e, exc_info=True)
         return None
 
 
 def get_space_details(
     service: GoogleChatService,
-    space_name: str
+    space_name: str,
+    fields: Optional[str] = SPACE_FIELDS
 ) -> Optional[Dict[str, Any]]:
     """
     Get details for a specific Google Chat space.
@@ -135,37 +481,114 @@ def get_space_details(
     Args:
         service: Google Chat API service instance
         space_name: The name/identifier of the space (e.g., 'spaces/space_id')
+        fields: Partial response mask, or None for the full space
 
     Returns:
         Space object with details, or None if an error occurs
     """
-    logger.info(f"Fetching details for space: {space_name}")
+    logger.info("Fetching details for space: %s", space_name)
 
     try:
-        space = service.spaces().get(name=space_name).execute()
-        logger.info(f"Successfully retrieved space details for: {space_name}")
+        request_params = {"name": space_name}
+        if fields:
+            request_params["fields"] = fields
+
+        space = service.spaces().get(**request_params).execute()
+        logger.info("Successfully retrieved space details for: %s", space_name)
         return space
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching space details: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching space details: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching space details: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching space details: %s", e, exc_info=True)
         return None
 
 
 # === GOOGLE CHAT MESSAGE FUNCTIONS ===
 
-def list_space_messages(
+def _utc(value: datetime) -> datetime:
+    """Return value as an aware UTC datetime, treating naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@functools.lru_cache(maxsize=256)
+def _time_filter_for_range(start_ts: float, end_ts: float) -> str:
+    """Format the createTime filter for a range of UTC timestamps (memoized)."""
+    start_rfc = datetime.fromtimestamp(start_ts, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    end_rfc = datetime.fromtimestamp(end_ts, timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+    return f'createTime > "{start_rfc}" AND createTime < "{end_rfc}"'
+
+
+def _build_time_filter(start_date: datetime, end_date: Optional[datetime] = None) -> str:
+    """
+    Build the createTime filter for a message listing.
+
+    Aware datetimes are converted to UTC and naive ones are taken as UTC, so the
+    cache behind this is keyed on the instants rather than on the datetime objects.
+
+    Args:
+        start_date: Start of the range
+        end_date: End of the range; if omitted, the whole day of start_date is used
+
+    Returns:
+        A filter string such as 'createTime > "..." AND createTime < "..."'
+    """
+    if end_date is None:
+        # For single day query, set range from start of day to end of day
+        start_date = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
+        end_date = start_date + timedelta(days=1)
+
+    return _time_filter_for_range(_utc(start_date).timestamp(), _utc(end_date).timestamp())
+
+
+def _message_list_params(
+    space_name: str,
+    start_date: Optional[datetime],
+    end_date: Optional[datetime],
+    page_size: int,
+    order_by: str,
+    fields: Optional[str]
+) -> Dict[str, Any]:
+    """Build the spaces.messages.list parameters shared by every page of a listing."""
+    # Prepare request parameters
+    request_params = {
+        "parent": space_name,
+        "pageSize": page_size,
+        "orderBy": order_by
+    }
+    if fields:
+        request_params["fields"] = fields
+
+    # Only add filter if dates are provided
+    if start_date:
+        try:
+            filter_str = _build_time_filter(start_date, end_date)
+            request_params["filter"] = filter_str
+            logger.debug("Using date filter: %s", filter_str)
+        except Exception as filter_error:
+            logger.warning("Failed to create date filter, proceeding without it: %s", filter_error)
+
+    logger.debug("Request parameters: %s", request_params)
+    return request_params
+
+
+def iter_space_messages(
     service: GoogleChatService,
     space_name: str,
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     page_size: int = 100,
-    order_by: str = "createTime desc"
-) -> Optional[List[Dict[str, Any]]]:
+    order_by: str = "createTime desc",
+    max_pages: Optional[int] = None,
+    prefetch: bool = False,
+    fields: Optional[str] = MESSAGE_LIST_FIELDS
+) -> Iterator[Dict[str, Any]]:
     """
-    Lists messages from a specific Google Chat space with optional time filtering.
+    Iterates over the messages of a Google Chat space, fetching further pages
+    as the caller consumes them.
 
     Args:
         service: Google Chat API service instance
@@ -174,130 +597,224 @@ def list_space_messages(
         end_date: Optional end datetime for filtering messages
         page_size: Maximum number of messages to return per page
         order_by: Order of the messages returned
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        prefetch: Fetch the next page in the background while the current one is consumed
+        fields: Partial response mask, or None for full messages; must include nextPageToken
+
+    Yields:
+        Message objects
+
+    Raises:
+        HttpError: If a page request fails
+    """
+    request_params = _message_list_params(space_name, start_date, end_date, page_size, order_by, fields)
+
+    def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
+        params = dict(request_params, pageToken=page_token) if page_token else request_params
+        return service.spaces().messages().list(**params).execute()
+
+    yield from _iter_pages(fetch_page, "messages", max_pages, prefetch=prefetch)
+
+
+def list_space_messages_page(
+    service: GoogleChatService,
+    space_name: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    page_size: int = 100,
+    order_by: str = "createTime desc",
+    page_token: Optional[str] = None,
+    fields: Optional[str] = MESSAGE_LIST_FIELDS
+) -> Optional[Tuple[List[Dict[str, Any]], Optional[str]]]:
+    """
+    Fetches a single page of messages from a Google Chat space.
+
+    Args:
+        service: Google Chat API service instance
+        space_name: The name/identifier of the space to fetch messages from
+        start_date: Optional start datetime for filtering messages
+        end_date: Optional end datetime for filtering messages
+        page_size: Maximum number of messages to return
+        order_by: Order of the messages returned
+        page_token: Token of the page to fetch, as returned for the previous page
+        fields: Partial response mask, or None for full messages; must include nextPageToken
 
     Returns:
-        List of message objects from the space, or None if an error occurs
+        A (messages, next_page_token) tuple, where next_page_token is None on the last
+        page, or None if an error occurs
     """
-    logger.info(f"Fetching messages from space: {space_name}")
+    logger.info("Fetching a page of messages from space: %s", space_name)
 
     try:
-        # Prepare request parameters
-        request_params = {
-            "parent": space_name,
-            "pageSize": page_size,
-            "orderBy": order_by
-        }
-        
-        # Only add filter if dates are provided
-        if start_date:
-            try:
-                if end_date:
-                    # Format for date range query - try different formats
-                    # Try without microseconds first
-                    start_rfc = start_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    end_rfc = end_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    filter_str = f'createTime > "{start_rfc}" AND createTime < "{end_rfc}"'
-                else:
-                    # For single day query, set range from start of day to end of day
-                    day_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                    day_end = day_start + timedelta(days=1)
-                    start_rfc = day_start.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    end_rfc = day_end.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    filter_str = f'createTime > "{start_rfc}" AND createTime < "{end_rfc}"'
-                
-                request_params["filter"] = filter_str
-                logger.debug(f"Using date filter: {filter_str}")
-                
-            except Exception as filter_error:
-                logger.warning(f"Failed to create date filter, proceeding without it: {filter_error}")
-
-        logger.debug(f"Request parameters: {request_params}")
-
-        # Make API request
-        messages_result = service.spaces().messages().list(**request_params).execute()
-        messages = messages_result.get("messages", [])
-
-        logger.info(f"Found {len(messages)} messages in space: {space_name}")
-        return messages
+        request_params = _message_list_params(space_name, start_date, end_date, page_size, order_by, fields)
+        if page_token:
+            request_params["pageToken"] = page_token
+
+        response = service.spaces().messages().list(**request_params).execute()
+        messages = response.get("messages", [])
+
+        logger.info("Found %d messages in space: %s", len(messages), space_name)
+        return messages, response.get("nextPageToken")
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching messages: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching messages: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching messages: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching messages: %s", e, exc_info=True)
         return None
 
 
-def list_space_messages_detailed(
+def _list_messages(
     service: GoogleChatService,
     space_name: str,
+    *,
+    fields: Optional[str],
     start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
     page_size: int = 100,
-    order_by: str = "createTime desc"
+    order_by: str = "createTime desc",
+    max_pages: Optional[int] = 1,
+    enrich_senders: bool = False
 ) -> Optional[List[Dict[str, Any]]]:
     """
-    Lists messages from a specific Google Chat space with detailed sender information.
-    Uses the fields parameter to request all available information.
+    Shared implementation of the list_space_messages* functions.
+
+    Args:
+        service: Google Chat API service instance
+        space_name: The name/identifier of the space to fetch messages from
+        fields: Partial response mask, or None for full messages
+        start_date: Optional start datetime for filtering messages
+        end_date: Optional end datetime for filtering messages
+        page_size: Maximum number of messages to return per page
+        order_by: Order of the messages returned
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        enrich_senders: Fill in missing sender display names
+
+    Returns:
+        List of message objects from the space, or None if an error occurs
     """
-    logger.info(f"Fetching detailed messages from space: {space_name}")
+    logger.info("Fetching messages from space: %s", space_name)
 
     try:
-        # Prepare request parameters
-        request_params = {
-            "parent": space_name,
-            "pageSize": page_size,
-            "orderBy": order_by,
-            # Request all available fields including sender details
-            "fields": "messages(name,text,createTime,sender(name,displayName,type,email,domainId),thread)"
-        }
-        
-        # Add date filter if provided
-        if start_date:
-            try:
-                if end_date:
-                    start_rfc = start_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    end_rfc = end_date.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    filter_str = f'createTime > "{start_rfc}" AND createTime < "{end_rfc}"'
-                else:
-                    day_start = start_date.replace(hour=0, minute=0, second=0, microsecond=0)
-                    day_end = day_start + timedelta(days=1)
-                    start_rfc = day_start.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    end_rfc = day_end.strftime('%Y-%m-%dT%H:%M:%SZ')
-                    filter_str = f'createTime > "{start_rfc}" AND createTime < "{end_rfc}"'
-                
-                request_params["filter"] = filter_str
-                logger.debug(f"Using date filter: {filter_str}")
-                
-            except Exception as filter_error:
-                logger.warning(f"Failed to create date filter, proceeding without it: {filter_error}")
-
-        logger.debug(f"Request parameters: {request_params}")
-
-        # Make API request
-        messages_result = service.spaces().messages().list(**request_params).execute()
-        messages = messages_result.get("messages", [])
-
-        logger.info(f"Found {len(messages)} messages in space: {space_name}")
-        
+        # Later pages are fetched while the current one is being collected
+        messages = list(iter_space_messages(
+            service, space_name, start_date, end_date, page_size, order_by,
+            max_pages=max_pages, prefetch=max_pages != 1, fields=fields
+        ))
+
+        logger.info("Found %d messages in space: %s", len(messages), space_name)
+
         # Log what we actually got for debugging
         if messages and logger.isEnabledFor(logging.DEBUG):
             sample_msg = messages[0]
-            logger.debug(f"Sample message structure: {json.dumps(sample_msg, indent=2)}")
-        
-        return messages
+            logger.debug("Sample message structure: %s", to_json(sample_msg, indent=2).decode())
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching messages: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching messages: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching messages: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching messages: %s", e, exc_info=True)
         return None
 
+    if enrich_senders and messages:
+        _fill_sender_display_names(service, space_name, messages)
+    return messages
+
+
+def list_space_messages(
+    service: GoogleChatService,
+    space_name: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    page_size: int = 100,
+    order_by: str = "createTime desc",
+    max_pages: Optional[int] = 1,
+    fields: Optional[str] = MESSAGE_LIST_FIELDS
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Lists messages from a specific Google Chat space with optional time filtering.
+
+    Args:
+        service: Google Chat API service instance
+        space_name: The name/identifier of the space to fetch messages from
+        start_date: Optional start datetime for filtering messages
+        end_date: Optional end datetime for filtering messages
+        page_size: Maximum number of messages to return per page
+        order_by: Order of the messages returned
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        fields: Partial response mask, or None for full messages
+
+    Returns:
+        List of message objects from the space, or None if an error occurs
+    """
+    return _list_messages(
+        service, space_name, fields=fields, start_date=start_date, end_date=end_date,
+        page_size=page_size, order_by=order_by, max_pages=max_pages
+    )
+
+
+def list_space_messages_detailed(
+    service: GoogleChatService,
+    space_name: str,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    page_size: int = 100,
+    order_by: str = "createTime desc",
+    max_pages: Optional[int] = 1,
+    fields: Optional[str] = MESSAGE_LIST_DETAILED_FIELDS
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Lists messages from a specific Google Chat space with detailed sender information.
+    Uses the fields parameter to request all available information.
+    Fetches up to `max_pages` pages (None for all of them).
+    """
+    return _list_messages(
+        service, space_name, fields=fields, start_date=start_date, end_date=end_date,
+        page_size=page_size, order_by=order_by, max_pages=max_pages
+    )
+
+
+def list_messages_across_spaces(
+    service: GoogleChatService,
+    space_names: List[str],
+    max_workers: int = MAX_CONCURRENT_REQUESTS,
+    **kwargs: Any
+) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+    """
+    Lists messages from several Google Chat spaces concurrently.
+
+    The service's pooled transport is thread-safe, so the workers share it, and it
+    already retries rate-limited and failed page requests on its own.
+
+    Args:
+        service: Google Chat API service instance
+        space_names: The names/identifiers of the spaces to fetch messages from
+        max_workers: Maximum number of spaces fetched at the same time
+        **kwargs: Filtering and paging options passed through to iter_space_messages
+
+    Returns:
+        A dictionary mapping each space name to its messages, or None if that fetch failed
+    """
+    def fetch(space_name: str) -> Optional[List[Dict[str, Any]]]:
+        try:
+            return list(iter_space_messages(service, space_name, **kwargs))
+        except HttpError as error:
+            logger.error("An API error occurred while fetching messages from %s: %s", space_name, error, exc_info=True)
+            return None
+        except Exception as e:
+            logger.error("An unexpected error occurred while fetching messages from %s: %s", space_name, e, exc_info=True)
+            return None
+
+    logger.info("Fetching messages from %d spaces concurrently.", len(space_names))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return dict(zip(space_names, executor.map(fetch, space_names)))
+
 
 def get_message_details(
     service: GoogleChatService,
-    message_name: str
+    message_name: str,
+    fields: Optional[str] = MESSAGE_FIELDS
 ) -> Optional[Dict[str, Any]]:
     """
     Get details for a specific Google Chat message.
@@ -305,22 +822,27 @@ def get_message_details(
     Args:
         service: Google Chat API service instance
         message_name: The name/identifier of the message (e.g., 'spaces/space_id/messages/message_id')
+        fields: Partial response mask, or None for the full message
 
     Returns:
         Message object with details, or None if an error occurs
     """
-    logger.info(f"Fetching details for message: {message_name}")
+    logger.info("Fetching details for message: %s", message_name)
 
     try:
-        message = service.spaces().messages().get(name=message_name).execute()
-        logger.info(f"Successfully retrieved message details for: {message_name}")
+        request_params = {"name": message_name}
+        if fields:
+            request_params["fields"] = fields
+
+        message = service.spaces().messages().get(**request_params).execute()
+        logger.info("Successfully retrieved message details for: %s", message_name)
         return message
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching message details: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching message details: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching message details: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching message details: %s", e, exc_info=True)
         return None
 
 
@@ -328,7 +850,8 @@ def send_message(
     service: GoogleChatService,
     space_name: str,
     message_text: str,
-    thread_key: Optional[str] = None
+    thread_key: Optional[str] = None,
+    fields: Optional[str] = SENT_MESSAGE_FIELDS
 ) -> Optional[Dict[str, Any]]:
     """
     Send a message to a Google Chat space.
@@ -338,11 +861,12 @@ def send_message(
         space_name: The name/identifier of the space to send message to
         message_text: The text content of the message
         thread_key: Optional thread key to reply to a specific thread
+        fields: Partial response mask, or None for the full created message
 
     Returns:
         Created message object, or None if an error occurs
     """
-    logger.info(f"Sending message to space: {space_name}")
+    logger.info("Sending message to space: %s", space_name)
 
     try:
         # Prepare message body
@@ -358,27 +882,67 @@ def send_message(
         
         if thread_key:
             request_params["threadKey"] = thread_key
+        if fields:
+            request_params["fields"] = fields
 
         # Send message
         created_message = service.spaces().messages().create(**request_params).execute()
         
-        logger.info(f"Successfully sent message to space: {space_name}")
+        logger.info("Successfully sent message to space: %s", space_name)
         return created_message
 
     except HttpError as error:
-        logger.error(f"An API error occurred while sending message: {error}", exc_info=True)
+        logger.error("An API error occurred while sending message: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while sending message: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while sending message: %s", e, exc_info=True)
         return None
 
 
 # === MEMBER MANAGEMENT FUNCTIONS ===
 
+def iter_space_members(
+    service: GoogleChatService,
+    space_name: str,
+    page_size: int = 100,
+    max_pages: Optional[int] = None,
+    fields: Optional[str] = MEMBER_LIST_FIELDS
+) -> Iterator[Dict[str, Any]]:
+    """
+    Iterates over the members of a Google Chat space, fetching further pages
+    as the caller consumes them.
+
+    Args:
+        service: Google Chat API service instance
+        space_name: The name/identifier of the space
+        page_size: Maximum number of members to return per page
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        fields: Partial response mask, or None for full memberships; must include nextPageToken
+
+    Yields:
+        Membership objects
+
+    Raises:
+        HttpError: If a page request fails
+    """
+    request_params = {"parent": space_name, "pageSize": page_size}
+    if fields:
+        request_params["fields"] = fields
+
+    def fetch_page(page_token: Optional[str]) -> Dict[str, Any]:
+        params = dict(request_params, pageToken=page_token) if page_token else request_params
+        return service.spaces().members().list(**params).execute()
+
+    yield from _iter_pages(fetch_page, "memberships", max_pages)
+
+
 def list_space_members(
     service: GoogleChatService,
     space_name: str,
-    page_size: int = 100
+    page_size: int = 100,
+    max_pages: Optional[int] = 1,
+    fields: Optional[str] = MEMBER_LIST_FIELDS,
+    max_results: Optional[int] = None
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Lists members of a specific Google Chat space.
@@ -387,68 +951,128 @@ def list_space_members(
         service: Google Chat API service instance
         space_name: The name/identifier of the space
         page_size: Maximum number of members to return per page
+        max_pages: Maximum number of pages to fetch, or None for all of them
+        fields: Partial response mask, or None for full memberships
+        max_results: Maximum number of members to return, or None for no limit;
+            no further pages are fetched once it is reached
 
     Returns:
         List of member objects, or None if an error occurs
     """
-    logger.info(f"Fetching members for space: {space_name}")
+    logger.info("Fetching members for space: %s", space_name)
 
     try:
-        members_result = service.spaces().members().list(
-            parent=space_name,
-            pageSize=page_size
-        ).execute()
-        
-        members = members_result.get("memberships", [])
-        logger.info(f"Found {len(members)} members in space: {space_name}")
+        members = list(itertools.islice(
+            iter_space_members(service, space_name, page_size, max_pages, fields), max_results
+        ))
+        logger.info("Found %d members in space: %s", len(members), space_name)
         return members
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching space members: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching space members: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching space members: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching space members: %s", e, exc_info=True)
         return None
 
 
 def list_space_members_detailed(
     service: GoogleChatService,
     space_name: str,
-    page_size: int = 100
+    page_size: int = 100,
+    max_pages: Optional[int] = 1,
+    fields: Optional[str] = MEMBER_LIST_DETAILED_FIELDS,
+    max_results: Optional[int] = None
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Lists members of a specific Google Chat space with detailed information.
+    Fetches up to `max_pages` pages (None for all of them) and at most
+    `max_results` members (None for no limit).
     """
-    logger.info(f"Fetching detailed members for space: {space_name}")
+    logger.info("Fetching detailed members for space: %s", space_name)
 
     try:
-        members_result = service.spaces().members().list(
-            parent=space_name,
-            pageSize=page_size,
-            # Request all available fields
-            fields="memberships(name,member(name,displayName,type,email,domainId),createTime,role)"
-        ).execute()
-        
-        members = members_result.get("memberships", [])
-        logger.info(f"Found {len(members)} members in space: {space_name}")
+        members = list(itertools.islice(
+            iter_space_members(service, space_name, page_size, max_pages, fields), max_results
+        ))
+        logger.info("Found %d members in space: %s", len(members), space_name)
         
         # Log what we actually got for debugging
         if members and logger.isEnabledFor(logging.DEBUG):
             sample_member = members[0]
-            logger.debug(f"Sample member structure: {json.dumps(sample_member, indent=2)}")
+            logger.debug("Sample member structure: %s", to_json(sample_member, indent=2).decode())
             
         return members
 
     except HttpError as error:
-        logger.error(f"An API error occurred while fetching space members: {error}", exc_info=True)
+        logger.error("An API error occurred while fetching space members: %s", error, exc_info=True)
         return None
     except Exception as e:
-        logger.error(f"An unexpected error occurred while fetching space members: {e}", exc_info=True)
+        logger.error("An unexpected error occurred while fetching space members: %s", e, exc_info=True)
         return None
 
 
 # === USER DETAIL FUNCTIONS ===
 
+@functools.lru_cache(maxsize=4096)
+def short_user_label(user_name: str) -> str:
+    """
+    Readable stand-in for a user without a known display name (memoized).
+
+    Args:
+        user_name: The name/identifier of the user (e.g., 'users/user_id')
+
+    Returns:
+        'User <id>', with IDs longer than USER_ID_ABBREV_LENGTH shortened to
+        their first and last four characters
+    """
+    if user_name.startswith(USER_NAME_PREFIX):
+        user_id = user_name[len(USER_NAME_PREFIX):]
+    else:
+        # rpartition yields the whole string when there is no '/'
+        user_id = user_name.rpartition('/')[2]
+    if len(user_id) > USER_ID_ABBREV_LENGTH:
+        return f"User {user_id[:4]}...{user_id[-4:]}"
+    return f"User {user_id}"
+
+
+def format_principal(
+    info: Dict[str, Any],
+    cache: Optional[Dict[str, str]] = None,
+    use_email: bool = True,
+    default: str = "Unknown"
+) -> str:
+    """
+    Best available label for a message sender or space member.
+
+    Tries, in order: the display name, the cached label for the user, the email
+    address, a shortened user ID, and the raw resource name.
+
+    Args:
+        info: Sender or member object with optional name, displayName and email fields
+        cache: Optional mapping of user names to known labels
+        use_email: Whether to fall back to the email address
+        default: Label used when the object has no name at all
+
+    Returns:
+        The label
+    """
+    display_name = info.get('displayName')
+    if display_name:
+        return display_name
+
+    name = info.get('name', '')
+    if cache and name in cache:
+        return cache[name]
+    if use_email:
+        email = info.get('email')
+        if email:
+            return email
+    if name.startswith(USER_NAME_PREFIX):
+        return short_user_label(name)
+    return name or default
+
+
 def get_user_details(
     service: GoogleChatService,
     user_name: str
@@ -463,20 +1087,20 @@ def get_user_details(
     Returns:
         User object with details, or None if an error occurs
     """
-    logger.info(f"Fetching details for user: {user_name}")
+    logger.info("Fetching details for user: %s", user_name)
     
     try:
         # Try to get user details using the spaces.members.get endpoint
         # This might work better than users.get for some cases
         user = service.users().get(name=user_name).execute()
-        logger.info(f"Successfully retrieved user details for: {user_name}")
+        logger.info("Successfully retrieved user details for: %s", user_name)
         return user
     except HttpError as error:
         # If direct user lookup fails, return None
-        logger.debug(f"Could not fetch user details: {error}")
+        logger.debug("Could not fetch user details: %s", error)
         return None
     except Exception as e:
-        logger.debug(f"Error fetching user details: {e}")
+        logger.debug("Error fetching user details: %s", e)
         return None
 
 
@@ -494,20 +1118,314 @@ def get_space_member_details(
     Returns:
         Member object with details, or None if an error occurs
     """
-    logger.info(f"Fetching member details for: {member_name}")
+    logger.info("Fetching member details for: %s", member_name)
     
     try:
         member = service.spaces().members().get(name=member_name).execute()
-        logger.info(f"Successfully retrieved member details")
+        logger.info("Successfully retrieved member details")
         return member
     except HttpError as error:
-        logger.debug(f"Could not fetch member details: {error}")
+        logger.debug("Could not fetch member details: %s", error)
         return None
     except Exception as e:
-        logger.debug(f"Error fetching member details: {e}")
+        logger.debug("Error fetching member details: %s", e)
         return None
 
 
+def set_user_cache_path(path: str) -> None:
+    """
+    Point the on-disk display name cache at another database file.
+
+    An already open database is closed; the new one is opened on first use.
+
+    Args:
+        path: Path of the SQLite database file
+    """
+    global _user_cache_db, _user_cache_path
+    with _user_cache_lock:
+        if path == _user_cache_path:
+            return
+        if _user_cache_db is not None:
+            _user_cache_db.close()
+            _user_cache_db = None
+        _user_cache_path = path
+
+
+def _get_user_cache_db() -> Optional[sqlite3.Connection]:
+    """Open (once) the on-disk display name cache; returns None if it can't be used."""
+    global _user_cache_db
+    if _user_cache_db is None:
+        try:
+            conn = sqlite3.connect(_user_cache_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS user_display_names "
+                "(user_name TEXT PRIMARY KEY, display_name TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            conn.commit()
+            _user_cache_db = conn
+        except sqlite3.Error as e:
+            logger.warning("User cache database unavailable, caching in memory only: %s", e)
+            return None
+    return _user_cache_db
+
+
+def _remember_display_names(display_names: Dict[str, str], fetched_at: float) -> None:
+    """Add display names to the in-memory cache, evicting the oldest entries beyond the limit."""
+    for user_name, display_name in display_names.items():
+        _user_cache[user_name] = (display_name, fetched_at)
+        _user_cache.move_to_end(user_name)
+    while len(_user_cache) > USER_CACHE_MAX_ENTRIES:
+        _user_cache.popitem(last=False)
+
+
+def _cached_display_names(user_names: List[str]) -> Dict[str, str]:
+    """
+    Look up unexpired display names in the in-memory and on-disk caches.
+
+    Args:
+        user_names: User identifiers (e.g., 'users/user_id')
+
+    Returns:
+        A dictionary with the display names found in the cache
+    """
+    cutoff = time.time() - USER_CACHE_TTL_SECONDS
+    found: Dict[str, str] = {}
+
+    with _user_cache_lock:
+        missing = []
+        for user_name in user_names:
+            entry = _user_cache.get(user_name)
+            if entry and entry[1] >= cutoff:
+                found[user_name] = entry[0]
+            else:
+                missing.append(user_name)
+
+        db = _get_user_cache_db() if missing else None
+        if db is not None:
+            try:
+                placeholders = ",".join("?" * len(missing))
+                rows = db.execute(
+                    f"SELECT user_name, display_name, fetched_at FROM user_display_names "
+                    f"WHERE fetched_at >= ? AND user_name IN ({placeholders})",
+                    (cutoff, *missing)
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.debug("Could not read user cache: %s", e)
+                rows = []
+
+            for user_name, display_name, fetched_at in rows:
+                found[user_name] = display_name
+                _user_cache[user_name] = (display_name, fetched_at)
+
+    return found
+
+
+def _store_display_names(display_names: Dict[str, str]) -> None:
+    """Save freshly fetched display names to the in-memory and on-disk caches."""
+    if not display_names:
+        return
+
+    fetched_at = time.time()
+    with _user_cache_lock:
+        _remember_display_names(display_names, fetched_at)
+
+        db = _get_user_cache_db()
+        if db is not None:
+            try:
+                db.executemany(
+                    "INSERT OR REPLACE INTO user_display_names (user_name, display_name, fetched_at) VALUES (?, ?, ?)",
+                    [(user_name, display_name, fetched_at) for user_name, display_name in display_names.items()]
+                )
+                db.commit()
+            except sqlite3.Error as e:
+                logger.debug("Could not write user cache: %s", e)
+
+
+def _recently_failed_lookups(user_names: List[str]) -> Set[str]:
+    """Return the users whose last lookup failed less than USER_LOOKUP_RETRY_SECONDS ago."""
+    cutoff = time.time() - USER_LOOKUP_RETRY_SECONDS
+    with _user_cache_lock:
+        return {
+            user_name for user_name in user_names
+            if _failed_user_lookups.get(user_name, 0.0) >= cutoff
+        }
+
+
+def _remember_failed_lookups(user_names: List[str]) -> None:
+    """Record failed lookups in the negative cache, evicting the oldest entries beyond the limit."""
+    failed_at = time.time()
+    with _user_cache_lock:
+        for user_name in user_names:
+            _failed_user_lookups[user_name] = failed_at
+            _failed_user_lookups.move_to_end(user_name)
+        while len(_failed_user_lookups) > USER_CACHE_MAX_ENTRIES:
+            _failed_user_lookups.popitem(last=False)
+
+
+def cached_display_names(user_names: List[str]) -> Dict[str, str]:
+    """
+    Look up display names in the user cache only, without calling the API.
+
+    The cache is filled by earlier lookups and membership listings, so repeated
+    renders of the same people cost no requests.
+
+    Args:
+        user_names: User identifiers (e.g., 'users/user_id')
+
+    Returns:
+        A dictionary with the unexpired display names found in the cache
+    """
+    if not user_names:
+        return {}
+    return _cached_display_names(list(dict.fromkeys(user_names)))
+
+
+def invalidate_user(user_name: str) -> None:
+    """
+    Drop a user's cached display name, e.g. after a membership change.
+
+    Args:
+        user_name: The name/identifier of the user (e.g., 'users/user_id')
+    """
+    with _user_cache_lock:
+        _user_cache.pop(user_name, None)
+        _failed_user_lookups.pop(user_name, None)
+
+        db = _get_user_cache_db()
+        if db is not None:
+            try:
+                db.execute("DELETE FROM user_display_names WHERE user_name = ?", (user_name,))
+                db.commit()
+            except sqlite3.Error as e:
+                logger.debug("Could not invalidate cached user %s: %s", user_name, e)
+
+
+def _fetch_display_names(
+    service: GoogleChatService,
+    user_names: List[str]
+) -> Dict[str, str]:
+    """
+    Look up display names for several users, using the cache and batch HTTP requests.
+
+    Args:
+        service: Google Chat API service instance
+        user_names: User identifiers (e.g., 'users/user_id')
+
+    Returns:
+        A dictionary mapping each user name to its display name, falling back to the
+        bare user ID when the lookup fails
+    """
+    display_names = {user_name: user_name[len(USER_NAME_PREFIX):] for user_name in user_names}
+    cached = _cached_display_names(user_names)
+    display_names.update(cached)
+
+    # Users that just failed to resolve would only fail again
+    skip = _recently_failed_lookups(user_names)
+    to_fetch = [user_name for user_name in user_names if user_name not in cached and user_name not in skip]
+    fetched: Dict[str, str] = {}
+    failed: List[str] = []
+
+    def callback(request_id: str, response: Optional[Dict[str, Any]], exception: Optional[Exception]) -> None:
+        if exception is not None:
+            logger.debug("Could not fetch user details for %s: %s", request_id, exception)
+            failed.append(request_id)
+        elif response:
+            fetched[request_id] = response.get('displayName', request_id)
+
+    for chunk_start in range(0, len(to_fetch), BATCH_MAX_REQUESTS):
+        chunk = to_fetch[chunk_start:chunk_start + BATCH_MAX_REQUESTS]
+        try:
+            batch = service.new_batch_http_request(callback=callback)
+            for user_name in chunk:
+                batch.add(service.users().get(name=user_name), request_id=user_name)
+            batch.execute()
+        except Exception as e:
+            logger.debug("Error fetching user details in batch: %s", e)
+
+    # Successful lookups are cached for USER_CACHE_TTL_SECONDS, failed ones are
+    # retried after USER_LOOKUP_RETRY_SECONDS
+    _store_display_names(fetched)
+    _remember_failed_lookups(failed)
+    display_names.update(fetched)
+    return display_names
+
+
+def _prefetch_member_display_names(
+    service: GoogleChatService,
+    space_name: str
+) -> None:
+    """
+    Seed the display name cache from the space membership.
+
+    The senders of a space's messages are almost always its members, so a short
+    membership listing usually replaces the individual user lookups. At most
+    MEMBER_PREFETCH_MAX_PAGES full pages are read; senders of larger spaces that
+    aren't covered are looked up individually afterwards.
+
+    Args:
+        service: Google Chat API service instance
+        space_name: The name/identifier of the space
+    """
+    try:
+        display_names = {
+            member['name']: member['displayName']
+            for member in (
+                membership.get('member', {})
+                for membership in iter_space_members(
+                    service,
+                    space_name,
+                    page_size=MAX_MEMBER_PAGE_SIZE,
+                    max_pages=MEMBER_PREFETCH_MAX_PAGES,
+                    fields="memberships(member(name,displayName)),nextPageToken"
+                )
+            )
+            if member.get('name') and member.get('displayName')
+        }
+    except Exception as e:
+        logger.debug("Could not prefetch members of %s: %s", space_name, e)
+        return
+
+    _store_display_names(display_names)
+
+
+def _fill_sender_display_names(
+    service: GoogleChatService,
+    space_name: str,
+    messages: List[Dict[str, Any]]
+) -> None:
+    """
+    Fill in missing sender display names in place.
+
+    Args:
+        service: Google Chat API service instance
+        space_name: The name/identifier of the space the messages belong to
+        messages: Message objects to update
+    """
+    # Senders that have a user name but no displayName
+    senders_to_fill = [
+        sender
+        for sender in (message.get('sender', {}) for message in messages)
+        if sender.get('name', '').startswith(USER_NAME_PREFIX) and not sender.get('displayName')
+    ]
+    if not senders_to_fill:
+        return
+
+    # Look up every distinct human user at once instead of one request per sender;
+    # bots and senders of unknown type can't be resolved and keep their ID
+    user_names = list(dict.fromkeys(
+        sender['name'] for sender in senders_to_fill if sender.get('type') == 'HUMAN'
+    ))
+    # Prefetch the membership only for users it might resolve; recently failed lookups
+    # (e.g. external users who aren't members) would otherwise repeat the scan every time
+    unresolved = set(user_names) - set(_cached_display_names(user_names))
+    if unresolved - _recently_failed_lookups(list(unresolved)):
+        _prefetch_member_display_names(service, space_name)
+    display_names = _fetch_display_names(service, user_names) if user_names else {}
+
+    for sender in senders_to_fill:
+        sender['displayName'] = display_names.get(sender['name']) or sender['name'][len(USER_NAME_PREFIX):]
+
+
 def list_space_messages_with_user_details(
     service: GoogleChatService,
     space_name: str,
@@ -515,39 +1433,15 @@ def list_space_messages_with_user_details(
     end_date: Optional[datetime] = None,
     page_size: int = 100,
     order_by: str = "createTime desc",
-    fetch_user_details: bool = True
+    fetch_user_details: bool = True,
+    max_pages: Optional[int] = 1
 ) -> Optional[List[Dict[str, Any]]]:
     """
     Lists messages from a specific Google Chat space with optional user detail fetching.
     
     This is an enhanced version that attempts to fetch user display names.
     """
-    messages = list_space_messages(
-        service, space_name, start_date, end_date, page_size, order_by
+    return _list_messages(
+        service, space_name, fields=MESSAGE_LIST_FIELDS, start_date=start_date, end_date=end_date,
+        page_size=page_size, order_by=order_by, max_pages=max_pages, enrich_senders=fetch_user_details
     )
-    
-    if not messages or not fetch_user_details:
-        return messages
-    
-    # Try to enhance messages with user details
-    user_cache = {}  # Cache to avoid repeated lookups
-    
-    for message in messages:
-        sender = message.get('sender', {})
-        sender_name = sender.get('name', '')
-        
-        # If we don't have displayName but have a user name, try to fetch it
-        if sender_name and not sender.get('displayName') and sender_name.startswith('users/'):
-            if sender_name not in user_cache:
-                # Try to get user details
-                user_details = get_user_details(service, sender_name)
-                if user_details:
-                    user_cache[sender_name] = user_details.get('displayName', sender_name)
-                else:
-                    # If direct lookup fails, extract user ID
-                    user_cache[sender_name] = sender_name.split('/')[-1]
-            
-            # Update the sender info
-            sender['displayName'] = user_cache[sender_name]
-    
-    return messages
\ No newline at end of file
@@ -5,12 +5,19 @@ This module provides a Model Context Protocol server for interacting with Gmail,
 It exposes Gmail messages, Calendar events, and Chat spaces/messages as resources and provides tools for managing all three.
 """
 
+import asyncio
+import functools
 import re
+from calendar import monthrange
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime, time
-from typing import Optional, List
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, List, Set, Tuple
 
+from google.oauth2.credentials import Credentials
 from mcp.server.fastmcp import FastMCP
 
+from mcp_google._cache import ttl_cache
 from mcp_google.config import settings
 from mcp_google.gmail import (
     create_draft,
@@ -18,6 +25,7 @@ from mcp_google.gmail import (
     get_headers_dict,
     get_labels,
     get_message,
+    get_messages,
     get_thread,
     list_messages,
     modify_message_labels,
@@ -28,6 +36,7 @@ from mcp_google.gmail import send_email as gmail_send_email
 
 from mcp_google.calendar import (
     get_calendar_service,
+    get_credentials,
     find_calendars,
     create_calendar,
     find_events,
@@ -38,7 +47,7 @@ from mcp_google.calendar import (
     get_event,
     project_recurring_events,
     analyze_busyness,
-    find_availability,
+    find_availability_many,
 )
 from mcp_google.calendar_models import (
     EventCreateRequest,
@@ -48,58 +57,225 @@ from mcp_google.calendar_models import (
 
 from mcp_google.google_chat import (
     get_google_chat_service,
-    list_chat_spaces,
+    list_chat_spaces_page,
     get_space_details,
-    list_space_messages,
-    list_space_messages_detailed,
+    list_space_messages_page,
+    MESSAGE_LIST_DETAILED_FIELDS,
+    MESSAGE_LIST_FIELDS,
     get_message_details,
     send_message,
     list_space_members,
     list_space_members_detailed,
+    cached_display_names,
+    format_principal,
+    USER_NAME_PREFIX,
+    MAX_MEMBER_PAGE_SIZE,
 )
 
+
+def _load_shared_credentials() -> Dict[str, Credentials]:
+    """
+    Load one set of credentials for every token file configured for more than one service.
+
+    Services pointed at the same token file share a single Credentials object holding
+    the union of their scopes, so the file is read and the token refreshed only once.
+
+    Returns:
+        A mapping of token path to credentials; services with a token file of their
+        own aren't included and authenticate as before
+    """
+    services = [
+        (settings.gmail_credentials_path, settings.gmail_token_path, settings.gmail_scopes),
+        (settings.calendar_credentials_path, settings.calendar_token_path, settings.calendar_scopes),
+        (settings.google_chat_credentials_path, settings.google_chat_token_path, settings.google_chat_scopes),
+    ]
+
+    by_token_path: Dict[str, Tuple[str, Set[str], int]] = {}
+    for credentials_path, token_path, scopes in services:
+        _, merged_scopes, count = by_token_path.get(token_path, (credentials_path, set(), 0))
+        by_token_path[token_path] = (credentials_path, merged_scopes | set(scopes), count + 1)
+
+    return {
+        token_path: get_credentials(credentials_path, token_path, tuple(sorted(scopes)))
+        for token_path, (credentials_path, scopes, count) in by_token_path.items()
+        if count > 1
+    }
+
+
+_shared_credentials = _load_shared_credentials()
+
 # Initialize the Gmail service
 gmail_service = get_gmail_service(
     credentials_path=settings.gmail_credentials_path, 
     token_path=settings.gmail_token_path, 
-    scopes=settings.gmail_scopes
+    scopes=settings.gmail_scopes,
+    credentials=_shared_credentials.get(settings.gmail_token_path),
 )
 
 # Initialize the Calendar service
 calendar_service = get_calendar_service(
     credentials_path=settings.calendar_credentials_path,
     token_path=settings.calendar_token_path,
-    scopes=settings.calendar_scopes
+    scopes=settings.calendar_scopes,
+    credentials=_shared_credentials.get(settings.calendar_token_path),
 )
 
 # Initialize the Google Chat service
 google_chat_service = get_google_chat_service(
     credentials_path=settings.google_chat_credentials_path,
     token_path=settings.google_chat_token_path,
-    scopes=settings.google_chat_scopes
+    scopes=settings.google_chat_scopes,
+    credentials=_shared_credentials.get(settings.google_chat_token_path),
+    user_cache_path=settings.google_chat_user_cache_path,
 )
 
+# Blocking Google API calls made by the async tools run on this many threads at most
+TOOL_WORKER_THREADS = 16
+
+
+@asynccontextmanager
+async def lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Give the async tools a bounded thread pool for their blocking API calls."""
+    executor = ThreadPoolExecutor(max_workers=TOOL_WORKER_THREADS, thread_name_prefix="google-api")
+    asyncio.get_running_loop().set_default_executor(executor)
+    try:
+        yield
+    finally:
+        executor.shutdown(wait=False)
+
+
+def _in_thread(fn: Callable[..., str]) -> Callable[..., Awaitable[str]]:
+    """
+    Turn a blocking tool or resource function into a coroutine that runs it on the
+    tool thread pool.
+
+    FastMCP calls synchronous functions on the event loop itself, so one slow Google
+    API call would hold up every other request. functools.wraps keeps the signature
+    and docstring FastMCP builds the schema and description from.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> str:
+        return await asyncio.to_thread(fn, *args, **kwargs)
+
+    return wrapper
+
+
 mcp = FastMCP(
     "Gmail, Calendar, and Google Chat MCP Server",
+    lifespan=lifespan,
     instructions="Access and interact with Gmail, Google Calendar, and Google Chat. You can get messages, threads, search emails, send or compose new messages, manage calendar events, create meetings, analyze calendar data, list chat spaces, view chat messages, and send messages to Google Chat spaces.",
 )
 
 EMAIL_PREVIEW_LENGTH = 200
 
+# strftime formats for timed and all-day Calendar event boundaries
+EVENT_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+EVENT_DATE_FORMAT = "%Y-%m-%d"
 
-# === HELPER FUNCTIONS ===
+# YYYY/MM/DD with the month and day ranges checked by the pattern itself
+DATE_FORMAT_RE = re.compile(r"^(\d{4})/(0[1-9]|1[0-2])/(0[1-9]|[12]\d|3[01])$")
 
-def format_gmail_message(message):
-    """Format a Gmail message for display."""
-    headers = get_headers_dict(message)
-    body = parse_message_body(message)
+# Headers shown in email listings; only these are requested for listed messages
+LISTING_HEADERS = ["From", "Subject", "Date"]
+
+# Lifetimes of the in-process caches of fetched resources, in seconds
+RESOURCE_CACHE_TTL = 300
+LABEL_CACHE_TTL = 3600
+RESOURCE_CACHE_SIZE = 4096
+
+
+# === CACHED LOOKUPS ===
+
+@ttl_cache(maxsize=RESOURCE_CACHE_SIZE, ttl=RESOURCE_CACHE_TTL)
+def _get_message_cached(message_id: str) -> Dict[str, Any]:
+    """Fetch a Gmail message, reusing it for RESOURCE_CACHE_TTL seconds."""
+    return get_message(gmail_service, message_id, user_id=settings.gmail_user_id)
+
+
+def _get_messages_cached(message_ids: List[str]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Like gmail.get_messages, but only requests the messages that aren't cached, and
+    each repeated ID only once. Results still line up with message_ids.
+    """
+    cache = _get_message_cached.cache
+    results = [(cache.get((message_id,)), None) for message_id in message_ids]
+
+    missing = [i for i, (message, _) in enumerate(results) if message is None]
+    if missing:
+        unique_ids = list(dict.fromkeys(message_ids[i] for i in missing))
+        fetched = dict(zip(unique_ids, get_messages(gmail_service, unique_ids, user_id=settings.gmail_user_id)))
+        for i in missing:
+            results[i] = fetched[message_ids[i]]
+        for message_id, (message, _) in fetched.items():
+            if message is not None:
+                cache.set((message_id,), message)
+
+    return results
+
+
+def _get_message_headers(message_ids: List[str]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Fetch what an email listing shows: cached full messages where available, and
+    metadata-only messages carrying LISTING_HEADERS for the rest.
+    """
+    cache = _get_message_cached.cache
+    results = [(cache.get((message_id,)), None) for message_id in message_ids]
+
+    missing = [i for i, (message, _) in enumerate(results) if message is None]
+    if missing:
+        fetched = get_messages(
+            gmail_service,
+            [message_ids[i] for i in missing],
+            user_id=settings.gmail_user_id,
+            format="metadata",
+            metadata_headers=LISTING_HEADERS,
+        )
+        for i, result in zip(missing, fetched):
+            results[i] = result
+
+    return results
+
+
+@ttl_cache(maxsize=RESOURCE_CACHE_SIZE, ttl=RESOURCE_CACHE_TTL)
+def _get_thread_cached(thread_id: str) -> Dict[str, Any]:
+    """Fetch a Gmail thread, reusing it for RESOURCE_CACHE_TTL seconds."""
+    return get_thread(gmail_service, thread_id, user_id=settings.gmail_user_id)
+
+
+@ttl_cache(maxsize=1, ttl=LABEL_CACHE_TTL)
+def _get_labels_cached() -> List[Dict[str, Any]]:
+    """Fetch the Gmail labels, reusing them for LABEL_CACHE_TTL seconds."""
+    return get_labels(gmail_service, user_id=settings.gmail_user_id)
+
+
+@functools.cache
+def _sender_email() -> str:
+    """Email address of the authenticated Gmail user, fetched once per process."""
+    return gmail_service.users().getProfile(userId=settings.gmail_user_id).execute().get("emailAddress")
+
+
+def _invalidate_message(message: Dict[str, Any]) -> None:
+    """Drop a modified Gmail message and its thread from the caches."""
+    _get_message_cached.cache.pop((message.get("id"),))
+    _get_thread_cached.cache.pop((message.get("threadId"),))
+
+
+@ttl_cache(maxsize=RESOURCE_CACHE_SIZE, ttl=RESOURCE_CACHE_TTL)
+def _get_space_details_cached(space_name: str) -> Optional[Dict[str, Any]]:
+    """Fetch a Chat space, reusing it for RESOURCE_CACHE_TTL seconds."""
+    return get_space_details(google_chat_service, space_name)
+
+
+@ttl_cache(maxsize=RESOURCE_CACHE_SIZE, ttl=RESOURCE_CACHE_TTL)
+def _get_chat_message_cached(message_name: str) -> Optional[Dict[str, Any]]:
+    """Fetch a Chat message, reusing it for RESOURCE_CACHE_TTL seconds."""
+    return get_message_details(google_chat_service, message_name)
 
-    from_header = headers.get("From", "Unknown")
-    to_header = headers.get("To", "Unknown")
-    subject = headers.get("Subject", "No Subject")
-    date = headers.get("Date", "Unknown Date")
 
-    return f"""
+# === HELPER FUNCTIONS ===
+
+# Output templates, filled with str.format_map
+GMAIL_MESSAGE_TEMPLATE = """
 From: {from_header}
 To: {to_header}
 Subject: {subject}
@@ -109,36 +285,64 @@ Date: {date}
 """
 
 
+def format_gmail_message(message, max_body_chars=None):
+    """Format a Gmail message for display, optionally cutting the body to `max_body_chars`."""
+    headers = get_headers_dict(message)
+
+    return GMAIL_MESSAGE_TEMPLATE.format_map({
+        "from_header": headers.get("From", "Unknown"),
+        "to_header": headers.get("To", "Unknown"),
+        "subject": headers.get("Subject", "No Subject"),
+        "date": headers.get("Date", "Unknown Date"),
+        "body": parse_message_body(message, max_chars=max_body_chars),
+    })
+
+
+def _format_event_time(when) -> str:
+    """Format the start or end of a Calendar event, which is either a date-time or an all-day date."""
+    if when:
+        date_time = when.dateTime
+        if date_time:
+            return date_time.strftime(EVENT_DATETIME_FORMAT)
+        day = when.date
+        if day:
+            return day.strftime(EVENT_DATE_FORMAT) + " (All Day)"
+    return "Unknown"
+
+
+CALENDAR_EVENT_TEMPLATE = """
+Title: {summary}
+Start: {start}
+End: {end}
+Location: {location}
+Description: {description}{attendees}
+"""
+
+
 def format_calendar_event(event):
     """Format a Calendar event for display."""
-    start_str = "Unknown"
-    end_str = "Unknown"
-    
-    if event.start:
-        if event.start.dateTime:
-            start_str = event.start.dateTime.strftime("%Y-%m-%d %H:%M:%S")
-        elif event.start.date:
-            start_str = event.start.date.strftime("%Y-%m-%d") + " (All Day)"
-    
-    if event.end:
-        if event.end.dateTime:
-            end_str = event.end.dateTime.strftime("%Y-%m-%d %H:%M:%S")
-        elif event.end.date:
-            end_str = event.end.date.strftime("%Y-%m-%d") + " (All Day)"
-
     attendees_str = ""
     if event.attendees:
         attendees_list = [att.email for att in event.attendees if att.email]
         if attendees_list:
             attendees_str = f"\nAttendees: {', '.join(attendees_list)}"
 
-    return f"""
-Title: {event.summary or 'No Title'}
-Start: {start_str}
-End: {end_str}
-Location: {event.location or 'No location'}
-Description: {event.description or 'No description'}{attendees_str}
-"""
+    return CALENDAR_EVENT_TEMPLATE.format_map({
+        "summary": event.summary or 'No Title',
+        "start": _format_event_time(event.start),
+        "end": _format_event_time(event.end),
+        "location": event.location or 'No location',
+        "description": event.description or 'No description',
+        "attendees": attendees_str,
+    })
+
+
+CHAT_SPACE_TEMPLATE = """
+Display Name: {display_name}
+Space ID: {space_name}
+Type: {space_type}
+Member Count: {member_count}
+Created: {create_time}"""
 
 
 def format_chat_space(space):
@@ -146,9 +350,10 @@ def format_chat_space(space):
     space_name = space.get('name', 'Unknown')
     display_name = space.get('displayName', '')
     
+    space_type = space.get('type', 'Unknown type')
+
     # Handle spaces without display names (like direct messages)
     if not display_name:
-        space_type = space.get('type', 'Unknown type')
         if space_type == 'ROOM':
             display_name = 'Unnamed Room'
         elif space_type == 'DM':
@@ -156,21 +361,17 @@ def format_chat_space(space):
         else:
             display_name = f'Unnamed {space_type}'
     
-    space_type = space.get('type', 'Unknown type')
-    
     # Member count might not be available for all space types
-    member_count = space.get('memberCount')
-    member_info = f"Member Count: {member_count}" if member_count else "Member Count: Not available"
-    
-    create_time = space.get('createTime', 'Not available')
+    member_count = space.get('memberCount') or 'Not available'
     
     # Add more details if available
-    details = f"""
-Display Name: {display_name}
-Space ID: {space_name}
-Type: {space_type}
-{member_info}
-Created: {create_time}"""
+    details = CHAT_SPACE_TEMPLATE.format_map({
+        "display_name": display_name,
+        "space_name": space_name,
+        "space_type": space_type,
+        "member_count": member_count,
+        "create_time": space.get('createTime', 'Not available'),
+    })
     
     # Add additional space attributes if present
     if space.get('singleUserBotDm'):
@@ -183,28 +384,22 @@ Created: {create_time}"""
     return details
 
 
+CHAT_MESSAGE_TEMPLATE = """
+From: {sender_name}
+Time: {create_time}
+Message ID: {message_name}
+Text: {message_text}
+"""
+
+
 def format_chat_message(message):
     """Format a Google Chat message for display with better error handling."""
     sender = message.get('sender', {})
     
-    # Better handling for sender information
-    sender_name = sender.get('displayName', sender.get('name', 'Anonymous'))
+    # Senders without a displayName are labeled from their name field
+    sender_name = format_principal(sender, use_email=False, default='Anonymous')
     sender_type = sender.get('type', 'USER')
     
-    # Some messages might not have displayName, try to extract from name field
-    if (sender_name == 'Anonymous' or sender_name.startswith('users/')) and 'name' in sender:
-        # Extract user ID from name like 'users/12345'
-        user_id = sender['name'].split('/')[-1] if '/' in sender['name'] else sender['name']
-        # Make it more readable
-        if len(user_id) > 10:
-            sender_name = f"User {user_id[:4]}...{user_id[-4:]}"
-        else:
-            sender_name = f"User {user_id}"
-    
-    message_text = message.get('text', 'No text content')
-    create_time = message.get('createTime', 'Unknown time')
-    message_name = message.get('name', 'Unknown')
-    
     # Check if it's a system message or bot message
     if sender_type == 'BOT':
         sender_name = f"{sender_name} (Bot)"
@@ -213,12 +408,42 @@ def format_chat_message(message):
         if not sender_name.startswith('User '):
             sender_name = f"{sender_name} (User)"
     
-    return f"""
-From: {sender_name}
-Time: {create_time}
-Message ID: {message_name}
-Text: {message_text}
-"""
+    return CHAT_MESSAGE_TEMPLATE.format_map({
+        "sender_name": sender_name,
+        "create_time": message.get('createTime', 'Unknown time'),
+        "message_name": message.get('name', 'Unknown'),
+        "message_text": message.get('text', 'No text content'),
+    })
+
+
+@functools.lru_cache(maxsize=1024)
+def _canon_space(space_id: str) -> str:
+    """Turn a bare space ID or a 'spaces/ID' name into the 'spaces/ID' resource name."""
+    return space_id if space_id.startswith("spaces/") else f"spaces/{space_id}"
+
+
+def _fill_cached_display_names(principals: List[Dict[str, Any]]) -> None:
+    """
+    Fill in missing displayName fields of Chat senders or members, in place, from
+    the process-wide user cache. No API requests are made.
+    """
+    unnamed = [
+        principal for principal in principals
+        if not principal.get('displayName') and principal.get('name', '').startswith(USER_NAME_PREFIX)
+    ]
+    if not unnamed:
+        return
+
+    display_names = cached_display_names([principal['name'] for principal in unnamed])
+    for principal in unnamed:
+        display_name = display_names.get(principal['name'])
+        if display_name:
+            principal['displayName'] = display_name
+
+
+def _canon_message(space_id: str, message_id: str) -> str:
+    """Build the 'spaces/ID/messages/ID' resource name of a Chat message."""
+    return f"{_canon_space(space_id)}/messages/{message_id}"
 
 
 def validate_date_format(date_str):
@@ -226,43 +451,45 @@ def validate_date_format(date_str):
     if not date_str:
         return True
 
-    if not re.match(r"^\d{4}/\d{2}/\d{2}$", date_str):
+    match = DATE_FORMAT_RE.match(date_str)
+    if match is None:
         return False
 
-    try:
-        datetime.strptime(date_str, "%Y/%m/%d")
-        return True
-    except ValueError:
-        return False
+    # Only days 29-31 can fall outside their month
+    year, month, day = map(int, match.groups())
+    return day <= 28 or day <= monthrange(year, month)[1]
 
 
 # === GMAIL RESOURCES ===
 
 @mcp.resource("gmail://messages/{message_id}")
+@_in_thread
 def get_email_message(message_id: str) -> str:
     """Get the content of an email message by its ID."""
-    message = get_message(gmail_service, message_id, user_id=settings.gmail_user_id)
+    message = _get_message_cached(message_id)
     formatted_message = format_gmail_message(message)
     return formatted_message
 
 
 @mcp.resource("gmail://threads/{thread_id}")
+@_in_thread
 def get_email_thread(thread_id: str) -> str:
     """Get all messages in an email thread by thread ID."""
-    thread = get_thread(gmail_service, thread_id, user_id=settings.gmail_user_id)
+    thread = _get_thread_cached(thread_id)
     messages = thread.get("messages", [])
 
-    result = f"Email Thread (ID: {thread_id})\n"
+    parts = [f"Email Thread (ID: {thread_id})\n"]
     for i, message in enumerate(messages, 1):
-        result += f"\n--- Message {i} ---\n"
-        result += format_gmail_message(message)
+        parts.append(f"\n--- Message {i} ---\n")
+        parts.append(format_gmail_message(message))
 
-    return result
+    return "".join(parts)
 
 
 # === CALENDAR RESOURCES ===
 
 @mcp.resource("calendar://events/{event_id}")
+@_in_thread
 def get_calendar_event(event_id: str) -> str:
     """Get the content of a calendar event by its ID from the primary calendar."""
     event = get_event(calendar_service, event_id, "primary")
@@ -275,10 +502,11 @@ def get_calendar_event(event_id: str) -> str:
 # === GOOGLE CHAT RESOURCES ===
 
 @mcp.resource("chat://spaces/{space_id}")
+@_in_thread
 def get_chat_space(space_id: str) -> str:
     """Get the details of a Google Chat space by its ID."""
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
-    space = get_space_details(google_chat_service, space_name)
+    space_name = _canon_space(space_id)
+    space = _get_space_details_cached(space_name)
     if space:
         return format_chat_space(space)
     else:
@@ -286,11 +514,11 @@ def get_chat_space(space_id: str) -> str:
 
 
 @mcp.resource("chat://spaces/{space_id}/messages/{message_id}")
+@_in_thread
 def get_chat_message(space_id: str, message_id: str) -> str:
     """Get the content of a Google Chat message by its space and message ID."""
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
-    message_name = f"{space_name}/messages/{message_id}"
-    message = get_message_details(google_chat_service, message_name)
+    message_name = _canon_message(space_id, message_id)
+    message = _get_chat_message_cached(message_name)
     if message:
         return format_chat_message(message)
     else:
@@ -299,50 +527,84 @@ def get_chat_message(space_id: str, message_id: str) -> str:
 
 # === GMAIL TOOLS ===
 
+DRAFT_CREATED_TEMPLATE = """
+Email draft created with ID: {draft_id}
+To: {to}
+Subject: {subject}
+CC: {cc}
+BCC: {bcc}
+Body: {body_preview}
+"""
+
+EMAIL_SENT_TEMPLATE = """
+Email sent successfully with ID: {message_id}
+To: {to}
+Subject: {subject}
+CC: {cc}
+BCC: {bcc}
+Body: {body_preview}
+"""
+
+MESSAGE_READ_TEMPLATE = """
+Message marked as read:
+ID: {message_id}
+Subject: {subject}
+"""
+
+
+def _preview(body: str) -> str:
+    """Cut an email body to EMAIL_PREVIEW_LENGTH characters, marking the cut with '...'."""
+    if len(body) > EMAIL_PREVIEW_LENGTH:
+        return body[:EMAIL_PREVIEW_LENGTH] + "..."
+    return body
+
+
 @mcp.tool()
+@_in_thread
 def compose_email(
     to: str, subject: str, body: str, cc: Optional[str] = None, bcc: Optional[str] = None
 ) -> str:
     """Compose a new email draft."""
-    sender = gmail_service.users().getProfile(userId=settings.gmail_user_id).execute().get("emailAddress")
+    sender = _sender_email()
     draft = create_draft(
         gmail_service, sender=sender, to=to, subject=subject, body=body, user_id=settings.gmail_user_id, cc=cc, bcc=bcc
     )
 
     draft_id = draft.get("id")
-    return f"""
-Email draft created with ID: {draft_id}
-To: {to}
-Subject: {subject}
-CC: {cc or ""}
-BCC: {bcc or ""}
-Body: {body[:EMAIL_PREVIEW_LENGTH]}{"..." if len(body) > EMAIL_PREVIEW_LENGTH else ""}
-"""
+    return DRAFT_CREATED_TEMPLATE.format_map({
+        "draft_id": draft_id,
+        "to": to,
+        "subject": subject,
+        "cc": cc or "",
+        "bcc": bcc or "",
+        "body_preview": _preview(body),
+    })
 
 
 @mcp.tool()
+@_in_thread
 def send_email(
     to: str, subject: str, body: str, cc: Optional[str] = None, bcc: Optional[str] = None
 ) -> str:
     """Compose and send an email."""
-    sender = gmail_service.users().getProfile(userId=settings.gmail_user_id).execute().get("emailAddress")
+    sender = _sender_email()
     message = gmail_send_email(
         gmail_service, sender=sender, to=to, subject=subject, body=body, user_id=settings.gmail_user_id, cc=cc, bcc=bcc
     )
 
     message_id = message.get("id")
-    return f"""
-Email sent successfully with ID: {message_id}
-To: {to}
-Subject: {subject}
-CC: {cc or ""}
-BCC: {bcc or ""}
-Body: {body[:EMAIL_PREVIEW_LENGTH]}{"..." if len(body) > EMAIL_PREVIEW_LENGTH else ""}
-"""
+    return EMAIL_SENT_TEMPLATE.format_map({
+        "message_id": message_id,
+        "to": to,
+        "subject": subject,
+        "cc": cc or "",
+        "bcc": bcc or "",
+        "body_preview": _preview(body),
+    })
 
 
 @mcp.tool()
-def search_emails(
+async def search_emails(
     from_email: Optional[str] = None,
     to_email: Optional[str] = None,
     subject: Optional[str] = None,
@@ -360,7 +622,8 @@ def search_emails(
     if before_date and not validate_date_format(before_date):
         return f"Error: before_date '{before_date}' is not in the required format YYYY/MM/DD"
 
-    messages = search_messages(
+    messages = await asyncio.to_thread(
+        search_messages,
         gmail_service,
         user_id=settings.gmail_user_id,
         from_email=from_email,
@@ -374,118 +637,160 @@ def search_emails(
         max_results=max_results,
     )
 
-    result = f"Found {len(messages)} messages matching criteria:\n"
+    parts = [f"Found {len(messages)} messages matching criteria:\n"]
+
+    msg_ids = [msg_info.get("id") for msg_info in messages]
+    fetched = await asyncio.to_thread(_get_message_headers, msg_ids)
+
+    for msg_id, (message, error) in zip(msg_ids, fetched):
+        parts.append(f"\nMessage ID: {msg_id}\n")
+        if error is not None:
+            parts.append(f"Error: {error}\n")
+            continue
 
-    for msg_info in messages:
-        msg_id = msg_info.get("id")
-        message = get_message(gmail_service, msg_id, user_id=settings.gmail_user_id)
         headers = get_headers_dict(message)
 
         from_header = headers.get("From", "Unknown")
         subject = headers.get("Subject", "No Subject")
         date = headers.get("Date", "Unknown Date")
 
-        result += f"\nMessage ID: {msg_id}\n"
-        result += f"From: {from_header}\n"
-        result += f"Subject: {subject}\n"
-        result += f"Date: {date}\n"
+        parts.append(f"From: {from_header}\n")
+        parts.append(f"Subject: {subject}\n")
+        parts.append(f"Date: {date}\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
-def query_emails(query: str, max_results: int = 10) -> str:
+async def query_emails(query: str, max_results: int = 10) -> str:
     """Search for emails using a raw Gmail query string."""
-    messages = list_messages(gmail_service, user_id=settings.gmail_user_id, max_results=max_results, query=query)
+    messages = await asyncio.to_thread(
+        list_messages, gmail_service, user_id=settings.gmail_user_id, max_results=max_results, query=query
+    )
 
-    result = f'Found {len(messages)} messages matching query: "{query}"\n'
+    parts = [f'Found {len(messages)} messages matching query: "{query}"\n']
+
+    msg_ids = [msg_info.get("id") for msg_info in messages]
+    fetched = await asyncio.to_thread(_get_message_headers, msg_ids)
+
+    for msg_id, (message, error) in zip(msg_ids, fetched):
+        parts.append(f"\nMessage ID: {msg_id}\n")
+        if error is not None:
+            parts.append(f"Error: {error}\n")
+            continue
 
-    for msg_info in messages:
-        msg_id = msg_info.get("id")
-        message = get_message(gmail_service, msg_id, user_id=settings.gmail_user_id)
         headers = get_headers_dict(message)
 
         from_header = headers.get("From", "Unknown")
         subject = headers.get("Subject", "No Subject")
         date = headers.get("Date", "Unknown Date")
 
-        result += f"\nMessage ID: {msg_id}\n"
-        result += f"From: {from_header}\n"
-        result += f"Subject: {subject}\n"
-        result += f"Date: {date}\n"
+        parts.append(f"From: {from_header}\n")
+        parts.append(f"Subject: {subject}\n")
+        parts.append(f"Date: {date}\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def list_available_labels() -> str:
     """Get all available Gmail labels for the user."""
-    labels = get_labels(gmail_service, user_id=settings.gmail_user_id)
+    labels = _get_labels_cached()
 
-    result = "Available Gmail Labels:\n"
+    parts = ["Available Gmail Labels:\n"]
     for label in labels:
         label_id = label.get("id", "Unknown")
         name = label.get("name", "Unknown")
         type_info = label.get("type", "user")
 
-        result += f"\nLabel ID: {label_id}\n"
-        result += f"Name: {name}\n"
-        result += f"Type: {type_info}\n"
+        parts.append(f"\nLabel ID: {label_id}\n")
+        parts.append(f"Name: {name}\n")
+        parts.append(f"Type: {type_info}\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def mark_message_read(message_id: str) -> str:
     """Mark a message as read by removing the UNREAD label."""
     result = modify_message_labels(
         gmail_service, user_id=settings.gmail_user_id, message_id=message_id, remove_labels=["UNREAD"], add_labels=[]
     )
 
+    _invalidate_message(result)
+
     headers = get_headers_dict(result)
-    subject = headers.get("Subject", "No Subject")
 
-    return f"""
-Message marked as read:
-ID: {message_id}
-Subject: {subject}
-"""
+    return MESSAGE_READ_TEMPLATE.format_map({
+        "message_id": message_id,
+        "subject": headers.get("Subject", "No Subject"),
+    })
 
 
 @mcp.tool()
-def get_emails(message_ids: list[str]) -> str:
+async def get_emails(message_ids: list[str]) -> str:
     """Get the content of multiple email messages by their IDs."""
     if not message_ids:
         return "No message IDs provided."
 
+    # Each email is shown once, in the order it was first requested
+    message_ids = list(dict.fromkeys(message_ids))
+
     retrieved_emails = []
     error_emails = []
 
-    for msg_id in message_ids:
-        try:
-            message = get_message(gmail_service, msg_id, user_id=settings.gmail_user_id)
+    fetched = await asyncio.to_thread(_get_messages_cached, message_ids)
+    for msg_id, (message, error) in zip(message_ids, fetched):
+        if error is None:
             retrieved_emails.append((msg_id, message))
-        except Exception as e:
-            error_emails.append((msg_id, str(e)))
+        else:
+            error_emails.append((msg_id, str(error)))
 
-    result = f"Retrieved {len(retrieved_emails)} emails:\n"
+    parts = [f"Retrieved {len(retrieved_emails)} emails:\n"]
 
     for i, (msg_id, message) in enumerate(retrieved_emails, 1):
-        result += f"\n--- Email {i} (ID: {msg_id}) ---\n"
-        result += format_gmail_message(message)
+        parts.append(f"\n--- Email {i} (ID: {msg_id}) ---\n")
+        parts.append(format_gmail_message(message))
 
     if error_emails:
-        result += f"\n\nFailed to retrieve {len(error_emails)} emails:\n"
+        parts.append(f"\n\nFailed to retrieve {len(error_emails)} emails:\n")
         for i, (msg_id, error) in enumerate(error_emails, 1):
-            result += f"\n--- Email {i} (ID: {msg_id}) ---\n"
-            result += f"Error: {error}\n"
+            parts.append(f"\n--- Email {i} (ID: {msg_id}) ---\n")
+            parts.append(f"Error: {error}\n")
 
-    return result
+    return "".join(parts)
 
 
 # === CALENDAR TOOLS ===
 
+EVENT_CREATED_TEMPLATE = """
+Event created successfully!
+Event ID: {event_id}
+Title: {summary}
+Start: {start}
+End: {end}
+Location: {location}
+Description: {description}
+"""
+
+QUICK_EVENT_CREATED_TEMPLATE = """
+Event created successfully using quick add!
+Event ID: {event_id}
+Title: {summary}
+Parsed from: "{text}"
+"""
+
+EVENT_UPDATED_TEMPLATE = """
+Event updated successfully!
+Event ID: {event_id}
+Title: {summary}
+"""
+
+
 @mcp.tool()
+@_in_thread
 def list_calendars(min_access_role: Optional[str] = None) -> str:
     """Get all available calendars for the user."""
     calendars_response = find_calendars(calendar_service, min_access_role=min_access_role)
@@ -493,17 +798,18 @@ def list_calendars(min_access_role: Optional[str] = None) -> str:
     if not calendars_response:
         return "Error retrieving calendars."
 
-    result = "Available Calendars:\n"
+    parts = ["Available Calendars:\n"]
     for calendar in calendars_response.items:
-        result += f"\nCalendar ID: {calendar.id}\n"
-        result += f"Name: {calendar.summary}\n"
-        result += f"Access Role: {calendar.accessRole}\n"
-        result += f"Primary: {calendar.primary}\n"
+        parts.append(f"\nCalendar ID: {calendar.id}\n")
+        parts.append(f"Name: {calendar.summary}\n")
+        parts.append(f"Access Role: {calendar.accessRole}\n")
+        parts.append(f"Primary: {calendar.primary}\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def search_calendar_events(
     calendar_id: str = "primary",
     time_min: Optional[str] = None,
@@ -517,13 +823,13 @@ def search_calendar_events(
     
     if time_min:
         try:
-            time_min_dt = datetime.fromisoformat(time_min.replace('Z', '+00:00'))
+            time_min_dt = datetime.fromisoformat(time_min)
         except ValueError:
             return f"Error: Invalid time_min format. Use ISO format like '2024-01-01T00:00:00Z'"
     
     if time_max:
         try:
-            time_max_dt = datetime.fromisoformat(time_max.replace('Z', '+00:00'))
+            time_max_dt = datetime.fromisoformat(time_max)
         except ValueError:
             return f"Error: Invalid time_max format. Use ISO format like '2024-01-01T00:00:00Z'"
 
@@ -539,16 +845,17 @@ def search_calendar_events(
     if not events_response:
         return "Error retrieving events."
 
-    result = f"Found {len(events_response.items)} events:\n"
+    parts = [f"Found {len(events_response.items)} events:\n"]
 
     for event in events_response.items:
-        result += f"\n--- Event ID: {event.id} ---\n"
-        result += format_calendar_event(event)
+        parts.append(f"\n--- Event ID: {event.id} ---\n")
+        parts.append(format_calendar_event(event))
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def create_calendar_event(
     summary: str,
     start_datetime: str,
@@ -560,8 +867,8 @@ def create_calendar_event(
 ) -> str:
     """Create a new calendar event."""
     try:
-        start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
+        start_dt = datetime.fromisoformat(start_datetime)
+        end_dt = datetime.fromisoformat(end_datetime)
     except ValueError:
         return "Error: Invalid datetime format. Use ISO format like '2024-01-01T10:00:00Z'"
 
@@ -577,20 +884,20 @@ def create_calendar_event(
     created_event = create_event(calendar_service, event_data, calendar_id)
 
     if created_event:
-        return f"""
-Event created successfully!
-Event ID: {created_event.id}
-Title: {created_event.summary}
-Start: {start_datetime}
-End: {end_datetime}
-Location: {location or "No location"}
-Description: {description or "No description"}
-"""
+        return EVENT_CREATED_TEMPLATE.format_map({
+            "event_id": created_event.id,
+            "summary": created_event.summary,
+            "start": start_datetime,
+            "end": end_datetime,
+            "location": location or "No location",
+            "description": description or "No description",
+        })
     else:
         return "Error creating event."
 
 
 @mcp.tool()
+@_in_thread
 def quick_create_event(
     text: str,
     calendar_id: str = "primary"
@@ -599,17 +906,17 @@ def quick_create_event(
     created_event = quick_add_event(calendar_service, text, calendar_id)
 
     if created_event:
-        return f"""
-Event created successfully using quick add!
-Event ID: {created_event.id}
-Title: {created_event.summary}
-Parsed from: "{text}"
-"""
+        return QUICK_EVENT_CREATED_TEMPLATE.format_map({
+            "event_id": created_event.id,
+            "summary": created_event.summary,
+            "text": text,
+        })
     else:
         return f"Error creating event from text: '{text}'"
 
 
 @mcp.tool()
+@_in_thread
 def update_calendar_event(
     event_id: str,
     summary: Optional[str] = None,
@@ -631,31 +938,34 @@ def update_calendar_event(
 
     if start_datetime:
         try:
-            start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
+            start_dt = datetime.fromisoformat(start_datetime)
             update_data.start = EventDateTime(dateTime=start_dt)
         except ValueError:
             return "Error: Invalid start_datetime format. Use ISO format like '2024-01-01T10:00:00Z'"
 
     if end_datetime:
         try:
-            end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
+            end_dt = datetime.fromisoformat(end_datetime)
             update_data.end = EventDateTime(dateTime=end_dt)
         except ValueError:
             return "Error: Invalid end_datetime format. Use ISO format like '2024-01-01T10:00:00Z'"
 
+    if not update_data.model_fields_set:
+        return f"No fields provided to update for event {event_id}."
+
     updated_event = update_event(calendar_service, event_id, update_data, calendar_id)
 
     if updated_event:
-        return f"""
-Event updated successfully!
-Event ID: {updated_event.id}
-Title: {updated_event.summary}
-"""
+        return EVENT_UPDATED_TEMPLATE.format_map({
+            "event_id": updated_event.id,
+            "summary": updated_event.summary,
+        })
     else:
         return f"Error updating event {event_id}."
 
 
 @mcp.tool()
+@_in_thread
 def delete_calendar_event(
     event_id: str,
     calendar_id: str = "primary"
@@ -670,6 +980,7 @@ def delete_calendar_event(
 
 
 @mcp.tool()
+@_in_thread
 def analyze_calendar_busyness(
     start_date: str,
     end_date: str,
@@ -684,22 +995,25 @@ def analyze_calendar_busyness(
 
     busyness_data = analyze_busyness(calendar_service, start_dt, end_dt, calendar_id)
 
+    if busyness_data is None:
+        return "Error analyzing calendar busyness."
     if not busyness_data:
         return "No events found in the specified date range."
 
-    result = f"Calendar busyness analysis from {start_date} to {end_date}:\n"
-
-    for date_obj, stats in busyness_data.items():
-        date_str = date_obj.strftime("%Y-%m-%d")
-        event_count = stats['event_count']
-        duration_hours = stats['total_duration_minutes'] / 60.0
+    parts = [f"Calendar busyness analysis from {start_date} to {end_date}:\n"]
 
-        result += f"\n{date_str}: {event_count} events, {duration_hours:.1f} hours scheduled"
+    # One formatting pass per day; date.isoformat() is the same YYYY-MM-DD as strftime, but cheaper
+    parts.extend(
+        f"\n{date_obj.isoformat()}: {stats['event_count']} events, "
+        f"{stats['total_duration_minutes'] / 60.0:.1f} hours scheduled"
+        for date_obj, stats in busyness_data.items()
+    )
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def project_recurring_calendar_events(
     start_date: str,
     end_date: str,
@@ -715,69 +1029,87 @@ def project_recurring_calendar_events(
 
     occurrences = project_recurring_events(calendar_service, start_dt, end_dt, calendar_id, event_query)
 
+    if occurrences is None:
+        return "Error projecting recurring events."
     if not occurrences:
         return "No recurring event occurrences found in the specified date range."
 
-    result = f"Projected recurring event occurrences from {start_date} to {end_date}:\n"
+    parts = [f"Projected recurring event occurrences from {start_date} to {end_date}:\n"]
 
     for occurrence in occurrences:
-        start_str = occurrence.occurrence_start.strftime("%Y-%m-%d %H:%M:%S")
-        end_str = occurrence.occurrence_end.strftime("%Y-%m-%d %H:%M:%S")
-        result += f"\n{occurrence.original_summary}: {start_str} - {end_str}"
+        start_str = occurrence.occurrence_start.strftime(EVENT_DATETIME_FORMAT)
+        end_str = occurrence.occurrence_end.strftime(EVENT_DATETIME_FORMAT)
+        parts.append(f"\n{occurrence.original_summary}: {start_str} - {end_str}")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
-def check_availability(
+async def check_availability(
     calendar_ids: List[str],
     start_datetime: str,
     end_datetime: str
 ) -> str:
     """Check free/busy status for multiple calendars in a time range."""
     try:
-        start_dt = datetime.fromisoformat(start_datetime.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_datetime.replace('Z', '+00:00'))
+        start_dt = datetime.fromisoformat(start_datetime)
+        end_dt = datetime.fromisoformat(end_datetime)
     except ValueError:
         return "Error: Invalid datetime format. Use ISO format like '2024-01-01T10:00:00Z'"
 
-    availability_data = find_availability(calendar_service, start_dt, end_dt, calendar_ids)
+    availability_data = await asyncio.to_thread(find_availability_many, calendar_service, start_dt, end_dt, calendar_ids)
 
     if not availability_data:
         return "Error retrieving availability data."
 
-    result = f"Availability from {start_datetime} to {end_datetime}:\n"
+    parts = [f"Availability from {start_datetime} to {end_datetime}:\n"]
 
     for cal_id, data in availability_data.items():
-        result += f"\nCalendar: {cal_id}\n"
+        parts.append(f"\nCalendar: {cal_id}\n")
         
         if data.get('errors'):
-            result += f"Errors: {data['errors']}\n"
+            parts.append(f"Errors: {data['errors']}\n")
         
         busy_periods = data.get('busy', [])
         if busy_periods:
-            result += "Busy periods:\n"
+            parts.append("Busy periods:\n")
             for period in busy_periods:
-                start_str = period['start'].strftime("%Y-%m-%d %H:%M:%S")
-                end_str = period['end'].strftime("%Y-%m-%d %H:%M:%S")
-                result += f"  {start_str} - {end_str}\n"
+                start_str = period.start.strftime(EVENT_DATETIME_FORMAT)
+                end_str = period.end.strftime(EVENT_DATETIME_FORMAT)
+                parts.append(f"  {start_str} - {end_str}\n")
         else:
-            result += "No busy periods found.\n"
+            parts.append("No busy periods found.\n")
 
-    return result
+    return "".join(parts)
 
 
 # === GOOGLE CHAT TOOLS ===
 
+CHAT_MESSAGE_SENT_TEMPLATE = """
+Message sent successfully!
+Message ID: {message_name}
+Space: {space_name}
+Time: {create_time}
+Text: {message_text}
+"""
+
+
 @mcp.tool()
-def list_google_chat_spaces(max_results: int = 50) -> str:
-    """List all Google Chat spaces the authenticated user has access to."""
-    spaces = list_chat_spaces(google_chat_service, page_size=max_results)
+@_in_thread
+def list_google_chat_spaces(max_results: int = 50, page_token: Optional[str] = None) -> str:
+    """List all Google Chat spaces the authenticated user has access to.
+
+    Args:
+        max_results: Maximum number of spaces to return
+        page_token: Optional token from a previous call's output to fetch the next page
+    """
+    page = list_chat_spaces_page(google_chat_service, page_size=max_results, page_token=page_token)
+    spaces, next_page_token = page or ([], None)
     
     if not spaces:
         return "No chat spaces found or error retrieving spaces."
 
-    result = f"Found {len(spaces)} Google Chat spaces:\n"
+    parts = [f"Found {len(spaces)} Google Chat spaces:\n"]
 
     for i, space in enumerate(spaces, 1):
         space_name = space.get('name', 'Unknown')
@@ -794,19 +1126,23 @@ def list_google_chat_spaces(max_results: int = 50) -> str:
             else:
                 display_name = f'Unnamed {space_type}'
         
-        result += f"\n{i}. {display_name}\n"
-        result += f"   Space ID: {space_name}\n"
-        result += f"   Type: {space_type}\n"
-        result += f"   Members: {member_count}\n"
+        parts.append(f"\n{i}. {display_name}\n")
+        parts.append(f"   Space ID: {space_name}\n")
+        parts.append(f"   Type: {space_type}\n")
+        parts.append(f"   Members: {member_count}\n")
+
+    if next_page_token:
+        parts.append(f"\nNext page token: {next_page_token}\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def get_google_chat_space_details(space_id: str) -> str:
     """Get detailed information about a specific Google Chat space."""
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
-    space = get_space_details(google_chat_service, space_name)
+    space_name = _canon_space(space_id)
+    space = _get_space_details_cached(space_name)
     
     if not space:
         return f"Error retrieving details for space: {space_id}"
@@ -815,12 +1151,13 @@ def get_google_chat_space_details(space_id: str) -> str:
 
 
 @mcp.tool()
-def list_google_chat_messages(
+async def list_google_chat_messages(
     space_id: str,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
     max_results: int = 50,
-    use_detailed: bool = True
+    use_detailed: bool = True,
+    page_token: Optional[str] = None
 ) -> str:
     """List messages from a specific Google Chat space with optional date filtering.
     
@@ -830,8 +1167,10 @@ def list_google_chat_messages(
         end_date: Optional end date in YYYY-MM-DD format (if not provided, uses start_date as single day)
         max_results: Maximum number of messages to return
         use_detailed: Whether to use the detailed API call that requests more fields
+        page_token: Optional token from a previous call's output to fetch the next page;
+            the other arguments must be the same as in that call
     """
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
+    space_name = _canon_space(space_id)
     
     start_datetime = None
     end_datetime = None
@@ -844,43 +1183,43 @@ def list_google_chat_messages(
         except ValueError:
             return "Error: Dates must be in YYYY-MM-DD format (e.g., '2024-03-22')"
     
-    # Use detailed version if requested
-    if use_detailed:
-        messages = list_space_messages_detailed(
-            google_chat_service,
-            space_name,
-            start_date=start_datetime,
-            end_date=end_datetime,
-            page_size=max_results
-        )
-    else:
-        messages = list_space_messages(
-            google_chat_service,
-            space_name,
-            start_date=start_datetime,
-            end_date=end_datetime,
-            page_size=max_results
-        )
+    # Use the detailed field mask if requested
+    page = await asyncio.to_thread(
+        list_space_messages_page,
+        google_chat_service,
+        space_name,
+        start_date=start_datetime,
+        end_date=end_datetime,
+        page_size=max_results,
+        page_token=page_token,
+        fields=MESSAGE_LIST_DETAILED_FIELDS if use_detailed else MESSAGE_LIST_FIELDS
+    )
+    messages, next_page_token = page or ([], None)
     
     if not messages:
         return f"No messages found in space {space_id} for the specified criteria."
 
-    result = f"Found {len(messages)} messages in space {space_id}:\n"
+    _fill_cached_display_names([message['sender'] for message in messages if 'sender' in message])
+
+    parts = [f"Found {len(messages)} messages in space {space_id}:\n"]
 
     for i, message in enumerate(messages, 1):
-        result += f"\n--- Message {i} ---\n"
-        result += format_chat_message(message)
+        parts.append(f"\n--- Message {i} ---\n")
+        parts.append(format_chat_message(message))
+
+    if next_page_token:
+        parts.append(f"\nNext page token: {next_page_token}\n")
 
-    return result
+    return "".join(parts)
 
 
 @mcp.tool()
+@_in_thread
 def get_google_chat_message_details(space_id: str, message_id: str) -> str:
     """Get detailed information about a specific Google Chat message."""
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
-    message_name = f"{space_name}/messages/{message_id}"
+    message_name = _canon_message(space_id, message_id)
     
-    message = get_message_details(google_chat_service, message_name)
+    message = _get_chat_message_cached(message_name)
     
     if not message:
         return f"Error retrieving message {message_id} from space {space_id}"
@@ -889,6 +1228,7 @@ def get_google_chat_message_details(space_id: str, message_id: str) -> str:
 
 
 @mcp.tool()
+@_in_thread
 def send_google_chat_message(
     space_id: str,
     message_text: str,
@@ -901,7 +1241,7 @@ def send_google_chat_message(
         message_text: The text content to send
         thread_key: Optional thread key to reply to a specific thread
     """
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
+    space_name = _canon_space(space_id)
     
     created_message = send_message(
         google_chat_service,
@@ -913,59 +1253,51 @@ def send_google_chat_message(
     if not created_message:
         return f"Error sending message to space {space_id}"
 
-    message_name = created_message.get('name', 'Unknown')
-    create_time = created_message.get('createTime', 'Unknown')
-    
-    return f"""
-Message sent successfully!
-Message ID: {message_name}
-Space: {space_name}
-Time: {create_time}
-Text: {message_text}
-"""
+    return CHAT_MESSAGE_SENT_TEMPLATE.format_map({
+        "message_name": created_message.get('name', 'Unknown'),
+        "space_name": space_name,
+        "create_time": created_message.get('createTime', 'Unknown'),
+        "message_text": message_text,
+    })
 
 
 @mcp.tool()
+@_in_thread
 def list_google_chat_space_members(space_id: str, max_results: int = 100, use_detailed: bool = True) -> str:
     """List all members of a specific Google Chat space."""
-    space_name = f"spaces/{space_id}" if not space_id.startswith("spaces/") else space_id
+    space_name = _canon_space(space_id)
     
-    # Use detailed version if requested
-    if use_detailed:
-        members = list_space_members_detailed(google_chat_service, space_name, page_size=max_results)
-    else:
-        members = list_space_members(google_chat_service, space_name, page_size=max_results)
+    # Pages are fetched only until max_results members have arrived
+    list_members = list_space_members_detailed if use_detailed else list_space_members
+    members = list_members(
+        google_chat_service,
+        space_name,
+        page_size=min(max_results, MAX_MEMBER_PAGE_SIZE),
+        max_pages=None,
+        max_results=max_results,
+    )
     
     if not members:
         return f"No members found in space {space_id} or error retrieving members."
 
-    result = f"Found {len(members)} members in space {space_id}:\n"
+    _fill_cached_display_names([member['member'] for member in members if 'member' in member])
+
+    parts = [f"Found {len(members)} members in space {space_id}:\n"]
 
     for i, member in enumerate(members, 1):
         member_info = member.get('member', {})
-        member_name = member_info.get('name', '')
-        member_display = member_info.get('displayName', '')
-        member_type = member_info.get('type', 'Unknown type')
-        member_email = member_info.get('email', '')
-        
-        # If no display name, try to extract from name
-        if not member_display and member_name:
-            if member_name.startswith('users/'):
-                user_id = member_name.split('/')[-1]
-                # Make it more readable
-                if len(user_id) > 10:
-                    member_display = f"User {user_id[:4]}...{user_id[-4:]}"
-                else:
-                    member_display = f"User {user_id}"
-            else:
-                member_display = member_name
-        
-        result += f"\n{i}. {member_display or 'Unknown member'} ({member_type})"
-        if member_email:
-            result += f" - {member_email}"
-        result += f"\n   ID: {member_name}\n"
+        get_field = member_info.get
+        member_name = get_field('name', '')
+        member_type = get_field('type', 'Unknown type')
+        member_email = get_field('email', '')
+
+        # The email is shown separately, so it isn't used as the label
+        member_display = format_principal(member_info, use_email=False, default='Unknown member')
+
+        email_suffix = f" - {member_email}" if member_email else ""
+        parts.append(f"\n{i}. {member_display} ({member_type}){email_suffix}\n   ID: {member_name}\n")
 
-    return result
+    return "".join(parts)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,117 @@
+"""
+Pooled HTTP transport for the Google API clients.
+
+googleapiclient expects an httplib2-style object with a ``request`` method. This module
+adapts a ``google.auth.transport.requests.AuthorizedSession`` to that interface so the
+services run on a urllib3 connection pool that can be shared between threads.
+
+By default every PooledHttp mounts the same process-wide adapter, so the Gmail,
+Calendar, and Chat services share one set of keep-alive connections even though each
+authorizes its requests with its own credentials.
+"""
+
+import functools
+import socket
+from typing import Any, Dict, Optional, Tuple
+
+import httplib2
+from google.auth.credentials import Credentials
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+# Size of the shared pool: number of hosts kept and keep-alive connections per host.
+# Must cover the workers of every ThreadPoolExecutor that uses the services at once.
+SHARED_POOL_SIZE = 32
+
+# Connection errors and transient statuses are retried at the transport level.
+# Retry's default allowed_methods leaves POST alone, so inserts are never repeated,
+# and the last response is returned instead of raised so googleapiclient still
+# turns it into an HttpError.
+TRANSPORT_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+
+# TCP keepalive stops idle pooled connections from being silently dropped by NATs
+# and load balancers between calls
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections have TCP keepalive enabled."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def shared_adapter() -> HTTPAdapter:
+    """Return the process-wide connection pool adapter shared by all PooledHttp clients."""
+    return _KeepAliveAdapter(
+        pool_connections=SHARED_POOL_SIZE,
+        pool_maxsize=SHARED_POOL_SIZE,
+        max_retries=TRANSPORT_RETRY,
+    )
+
+
+class PooledHttp:
+    """httplib2-compatible HTTP client backed by a pooled, authorized requests session."""
+
+    def __init__(self, credentials: Credentials, pool_maxsize: Optional[int] = None):
+        """
+        Create a pooled HTTP client.
+
+        Args:
+            credentials: OAuth credentials; refreshed automatically when they expire
+            pool_maxsize: Maximum number of keep-alive connections per host for a
+                dedicated pool, or None to use the shared pool
+        """
+        self.credentials = credentials
+        self.session = AuthorizedSession(credentials)
+
+        if pool_maxsize is None:
+            adapter = shared_adapter()
+        else:
+            adapter = _KeepAliveAdapter(pool_maxsize=pool_maxsize, max_retries=TRANSPORT_RETRY)
+        self.session.mount("https://", adapter)
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = 5,
+        connection_type: Optional[Any] = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        """
+        Perform a request the way httplib2.Http.request does.
+
+        Args:
+            uri: Absolute request URI
+            method: HTTP method
+            body: Request body
+            headers: Request headers
+            redirections: Maximum number of redirects to follow
+            connection_type: Unused; accepted for httplib2 compatibility
+
+        Returns:
+            A (response, content) tuple, where response carries the status and headers
+        """
+        self.session.max_redirects = redirections
+        response = self.session.request(method, uri, data=body, headers=headers)
+
+        info = dict(response.headers)
+        info["status"] = str(response.status_code)
+        return httplib2.Response(info), response.content
+
+    def close(self) -> None:
+        """Close the pooled connections; the shared pool reopens them on demand."""
+        self.session.close()
@@ -41,16 +41,18 @@ def test_calendar_connection():
     )
     
     if events_response and events_response.items:
-        print(f"Found {len(events_response.items)} recent events:")
+        lines = [f"Found {len(events_response.items)} recent events:"]
         for event in events_response.items:
+            start = event.start
             start_str = "Unknown start"
-            if event.start:
-                if event.start.dateTime:
-                    start_str = event.start.dateTime.strftime("%Y-%m-%d %H:%M")
-                elif event.start.date:
-                    start_str = event.start.date.strftime("%Y-%m-%d") + " (All Day)"
+            if start:
+                if start.dateTime:
+                    start_str = start.dateTime.strftime("%Y-%m-%d %H:%M")
+                elif start.date:
+                    start_str = start.date.strftime("%Y-%m-%d") + " (All Day)"
             
-            print(f"  - {event.summary or 'No Title'} ({start_str})")
+            lines.append(f"  - {event.summary or 'No Title'} ({start_str})")
+        print("\n".join(lines))
     else:
         print("No recent events found (this is normal if you have no events in the last 7 days).")
 
@@ -3,9 +3,149 @@ Simple script to test Google Chat API connectivity with enhanced user detail fet
 Run with: uv run python scripts/test_google_chat_setup.py
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from mcp_google import google_chat
 
+# Number of spaces, messages and members shown by the test
+SPACES_SHOWN = 3
+MESSAGES_SHOWN = 3
+MEMBERS_SHOWN = 5
+
+# Members are fetched in a single page of this size
+MEMBER_PAGE_SIZE = 200
+
+# Message texts longer than this are truncated
+MESSAGE_PREVIEW_LENGTH = 100
+
+
+def _truncate(text, max_length=MESSAGE_PREVIEW_LENGTH):
+    """Cut text longer than max_length characters, ending it with '...'."""
+    return text if len(text) <= max_length else f"{text[:max_length - 3]}..."
+
+
+def _space_display_name(space):
+    """Display name of a space, with a placeholder for spaces that have none (like direct messages)."""
+    display_name = space.get('displayName', '')
+    if display_name:
+        return display_name
+    space_type = space.get('type', 'Unknown type')
+    if space_type == 'ROOM':
+        return 'Unnamed Room'
+    if space_type == 'DM':
+        return 'Direct Message'
+    return f'Unnamed {space_type}'
+
+
+def _test_space(service, space_name, display_name):
+    """Tests space details, recent messages and members for one space."""
+    # Test 2: Get space details
+    print(f"\n=== Testing Space Details for: {display_name} ===")
+    space_details = google_chat.get_space_details(service, space_name)
+    if space_details:
+        print(
+            f"     Member count: {space_details.get('memberCount', 'Not available')}\n"
+            f"     Space type: {space_details.get('type', 'Unknown')}\n"
+            f"     Create time: {space_details.get('createTime', 'Not available')}"
+        )
+    
+    # Test 3: List recent messages using detailed version
+    print(f"\n=== Testing Recent Messages from: {display_name} ===")
+    print("     Using detailed API call to fetch more information...")
+    
+    # The member list helps with name resolution and is tested below; it
+    # doesn't depend on the messages, so both are fetched at once
+    print("     Fetching member list for better name resolution...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        messages_future = executor.submit(
+            google_chat.list_space_messages_detailed, service, space_name, page_size=5
+        )
+        members_future = executor.submit(
+            google_chat.list_space_members_detailed, service, space_name, page_size=MEMBER_PAGE_SIZE
+        )
+        messages = messages_future.result()
+        members = members_future.result()
+    
+    if messages:
+        print(f"     Found {len(messages)} recent messages:")
+
+        # Cache member information for better name resolution
+        member_cache = {
+            member_info['name']: google_chat.format_principal(member_info)
+            for member in members or []
+            if (member_info := member.get('member', {})).get('name')
+        }
+        
+        for j, message in enumerate(messages[:MESSAGES_SHOWN]):
+            sender = message.get('sender', {})
+            sender_display = sender.get('displayName', '')
+            sender_type = sender.get('type', 'USER')
+            
+            # Try to get the best name possible
+            final_sender_name = google_chat.format_principal(sender, member_cache)
+            
+            # Add type indicator
+            if sender_type == 'BOT':
+                final_sender_name += " (Bot)"
+            elif sender_type == 'HUMAN' and not sender_display:
+                final_sender_name += " (User)"
+            
+            # Truncate long messages
+            message_text = _truncate(message.get('text', 'No text content'))
+            create_time = message.get('createTime', 'Unknown time')
+            
+            print(
+                f"       {j+1}. From: {final_sender_name}\n"
+                f"          Time: {create_time}\n"
+                f"          Text: {message_text}"
+            )
+    else:
+        print("     No recent messages found")
+        
+        # Try with date filtering as backup
+        print("     Trying with date filter for last 7 days...")
+        end_time = datetime.now()
+        start_time = end_time - timedelta(days=7)
+        
+        try:
+            messages_filtered = google_chat.list_space_messages_detailed(
+                service,
+                space_name,
+                start_date=start_time,
+                end_date=end_time,
+                page_size=5
+            )
+            if messages_filtered:
+                print(f"     Found {len(messages_filtered)} messages in the last 7 days")
+            else:
+                print("     No messages found even with date filter")
+        except Exception as e:
+            print(f"     Date filtering had an issue: {str(e)[:100]}...")
+    
+    # Test 4: List space members with detailed info, reusing the list fetched above
+    print(f"\n=== Testing Space Members for: {display_name} ===")
+    if members:
+        print(f"     Found {len(members)} members:")
+        for k, member in enumerate(members[:MEMBERS_SHOWN]):
+            member_info = member.get('member', {})
+            get_field = member_info.get
+            member_name = get_field('name', '')
+            member_type = get_field('type', 'Unknown type')
+            member_email = get_field('email', '')
+            
+            # Format member display
+            display_str = google_chat.format_principal(member_info, default='Unknown member')
+            
+            lines = [f"       {k+1}. {display_str} ({member_type})"]
+            if member_name:
+                lines.append(f"          ID: {member_name}")
+            if member_email and member_email != display_str:
+                lines.append(f"          Email: {member_email}")
+            print("\n".join(lines))
+    else:
+        print("     No members found or unable to retrieve member list")
+
+
 def test_google_chat_connection():
     """Tests connection to Google Chat API and prints available spaces and messages to verify access."""
     print("Starting Google Chat API test...")
@@ -16,171 +156,17 @@ def test_google_chat_connection():
 
     # Test 1: List available chat spaces
     print("\n=== Testing Chat Spaces List ===")
-    spaces = google_chat.list_chat_spaces(service)
+    # Only the spaces shown are requested: a single page of SPACES_SHOWN
+    spaces = google_chat.list_chat_spaces(service, page_size=SPACES_SHOWN)
     if spaces:
-        print(f"Found {len(spaces)} chat spaces:")
-        for i, space in enumerate(spaces[:3]):  # Show first 3 spaces
-            space_name = space.get('name', 'Unknown')
-            display_name = space.get('displayName', '')
+        print(f"Showing the first {len(spaces)} chat spaces:")
+        for i, space in enumerate(spaces):
             space_type = space.get('type', 'Unknown type')
-            
-            # Handle spaces without display names
-            if not display_name:
-                if space_type == 'ROOM':
-                    display_name = 'Unnamed Room'
-                elif space_type == 'DM':
-                    display_name = 'Direct Message'
-                else:
-                    display_name = f'Unnamed {space_type}'
-                    
-            print(f"  {i+1}. {display_name} ({space_type})")
-            print(f"     Space ID: {space_name}")
-            
-            # Test 2: Get space details for the first space
-            if i == 0:
-                print(f"\n=== Testing Space Details for: {display_name} ===")
-                space_details = google_chat.get_space_details(service, space_name)
-                if space_details:
-                    member_count = space_details.get('memberCount', 'Not available')
-                    print(f"     Member count: {member_count}")
-                    print(f"     Space type: {space_details.get('type', 'Unknown')}")
-                    create_time = space_details.get('createTime', 'Not available')
-                    print(f"     Create time: {create_time}")
-                
-                # Test 3: List recent messages using detailed version
-                print(f"\n=== Testing Recent Messages from: {display_name} ===")
-                print("     Using detailed API call to fetch more information...")
-                
-                # Try the detailed version first
-                messages = google_chat.list_space_messages_detailed(
-                    service,
-                    space_name,
-                    page_size=5
-                )
-                
-                if messages:
-                    print(f"     Found {len(messages)} recent messages:")
-                    
-                    # Cache member information for better name resolution
-                    member_cache = {}
-                    
-                    # First, get member list to help with name resolution
-                    print("     Fetching member list for better name resolution...")
-                    members = google_chat.list_space_members_detailed(service, space_name, page_size=50)
-                    if members:
-                        for member in members:
-                            member_info = member.get('member', {})
-                            member_name = member_info.get('name', '')
-                            member_display = member_info.get('displayName', '')
-                            member_email = member_info.get('email', '')
-                            
-                            if member_name:
-                                if member_display:
-                                    member_cache[member_name] = member_display
-                                elif member_email:
-                                    member_cache[member_name] = member_email
-                                else:
-                                    user_id = member_name.split('/')[-1] if '/' in member_name else member_name
-                                    member_cache[member_name] = f"User {user_id[:8]}..." if len(user_id) > 8 else f"User {user_id}"
-                    
-                    for j, message in enumerate(messages[:3]):  # Show first 3 messages
-                        sender = message.get('sender', {})
-                        sender_name_raw = sender.get('name', '')
-                        sender_display = sender.get('displayName', '')
-                        sender_email = sender.get('email', '')
-                        sender_type = sender.get('type', 'USER')
-                        
-                        # Try to get the best name possible
-                        if sender_display:
-                            final_sender_name = sender_display
-                        elif sender_name_raw in member_cache:
-                            final_sender_name = member_cache[sender_name_raw]
-                        elif sender_email:
-                            final_sender_name = sender_email
-                        elif sender_name_raw:
-                            user_id = sender_name_raw.split('/')[-1] if '/' in sender_name_raw else sender_name_raw
-                            if len(user_id) > 10:
-                                final_sender_name = f"User {user_id[:4]}...{user_id[-4:]}"
-                            else:
-                                final_sender_name = f"User {user_id}"
-                        else:
-                            final_sender_name = 'Unknown'
-                        
-                        # Add type indicator
-                        if sender_type == 'BOT':
-                            final_sender_name += " (Bot)"
-                        elif sender_type == 'HUMAN' and not sender_display:
-                            final_sender_name += " (User)"
-                        
-                        message_text = message.get('text', 'No text content')
-                        create_time = message.get('createTime', 'Unknown time')
-                        
-                        # Truncate long messages
-                        if len(message_text) > 100:
-                            message_text = message_text[:97] + "..."
-                        
-                        print(f"       {j+1}. From: {final_sender_name}")
-                        print(f"          Time: {create_time}")
-                        print(f"          Text: {message_text}")
-                else:
-                    print("     No recent messages found")
-                    
-                    # Try with date filtering as backup
-                    print("     Trying with date filter for last 7 days...")
-                    end_time = datetime.now()
-                    start_time = end_time - timedelta(days=7)
-                    
-                    try:
-                        messages_filtered = google_chat.list_space_messages_detailed(
-                            service,
-                            space_name,
-                            start_date=start_time,
-                            end_date=end_time,
-                            page_size=5
-                        )
-                        if messages_filtered:
-                            print(f"     Found {len(messages_filtered)} messages in the last 7 days")
-                        else:
-                            print("     No messages found even with date filter")
-                    except Exception as e:
-                        print(f"     Date filtering had an issue: {str(e)[:100]}...")
-                
-                # Test 4: List space members with detailed info
-                print(f"\n=== Testing Space Members for: {display_name} ===")
-                members = google_chat.list_space_members_detailed(service, space_name, page_size=10)
-                if members:
-                    print(f"     Found {len(members)} members:")
-                    for k, member in enumerate(members[:5]):  # Show first 5 members
-                        member_info = member.get('member', {})
-                        member_name = member_info.get('name', '')
-                        member_display = member_info.get('displayName', '')
-                        member_type = member_info.get('type', 'Unknown type')
-                        member_email = member_info.get('email', '')
-                        
-                        # Format member display
-                        if member_display:
-                            display_str = member_display
-                        elif member_email:
-                            display_str = member_email
-                        elif member_name:
-                            user_id = member_name.split('/')[-1] if '/' in member_name else member_name
-                            if len(user_id) > 10:
-                                display_str = f"User {user_id[:4]}...{user_id[-4:]}"
-                            else:
-                                display_str = f"User {user_id}"
-                        else:
-                            display_str = 'Unknown member'
-                        
-                        print(f"       {k+1}. {display_str} ({member_type})")
-                        if member_name:
-                            print(f"          ID: {member_name}")
-                        if member_email and member_email != display_str:
-                            print(f"          Email: {member_email}")
-                else:
-                    print("     No members found or unable to retrieve member list")
-                    
-                break  # Only test the first space in detail
-                
+            print(f"  {i+1}. {_space_display_name(space)} ({space_type})\n     Space ID: {space.get('name', 'Unknown')}")
+
+        # Only the first space is tested in detail
+        first = spaces[0]
+        _test_space(service, first.get('name', 'Unknown'), _space_display_name(first))
     else:
         print("No chat spaces found. This could mean:")
         print("  - You don't have access to any Google Chat spaces")